@@ -2,7 +2,10 @@
 
 from .server import AgentConfig, create_a2a_app, run_agent_server, BaseAgentExecutor
 from .client import A2AClient, AgentEndpoint, AGENT_ENDPOINTS
+from .json_utils import json_dumps, json_loads
+from .parts import first_part, message_payload, part_payload, part_text
 from .logging_utils import (
+    get_logger,
     log_agent_message,
     log_llm_call,
     log_pipeline_step,
@@ -18,7 +21,16 @@ __all__ = [
     "A2AClient",
     "AgentEndpoint",
     "AGENT_ENDPOINTS",
+    # JSON helpers
+    "json_dumps",
+    "json_loads",
+    # Message part decoding
+    "first_part",
+    "message_payload",
+    "part_payload",
+    "part_text",
     # Logging utilities
+    "get_logger",
     "log_agent_message",
     "log_llm_call",
     "log_pipeline_step",
@@ -1,15 +1,15 @@
 """A2A Client for inter-agent communication."""
 
-import json
 import time
 import uuid
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from dataclasses import dataclass
 
 import httpx
 from a2a.client import A2AClient as BaseA2AClient
-from a2a.types import AgentCard, Message, TextPart
+from a2a.types import AgentCard, DataPart, Message, TextPart
 
+from .json_utils import json_loads
 from .logging_utils import log_agent_message, log_error
 
 
@@ -30,7 +30,18 @@ class A2AClient:
     def __init__(self, timeout: float = 120.0, caller_name: str = "Client"):
         self.timeout = timeout
         self.caller_name = caller_name
-        self._http_client = httpx.AsyncClient(timeout=timeout)
+        # One pooled client for the lifetime of this A2AClient so calls reuse
+        # keep-alive connections instead of reconnecting per task
+        self._http_client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+
+    async def __aenter__(self) -> "A2AClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def get_agent_card(self, endpoint: AgentEndpoint) -> Optional[AgentCard]:
         """Fetch agent card from an agent."""
@@ -48,15 +59,25 @@ class A2AClient:
         self,
         endpoint: AgentEndpoint,
         skill_id: str,
-        message: str,
+        message: Union[str, dict],
         params: Optional[dict] = None,
     ) -> dict:
-        """Send a task to an agent and wait for completion."""
-        # Parse message for logging
-        try:
-            message_data = json.loads(message)
-        except json.JSONDecodeError:
+        """Send a task to an agent and wait for completion.
+
+        A dict message is sent as a DataPart, skipping the JSON-in-a-string
+        round trip; the agent replies with a DataPart too. Decode the reply
+        with message_payload rather than reading the part's text.
+        """
+        if isinstance(message, dict):
             message_data = message
+            part = DataPart(data=message)
+        else:
+            # Parse message for logging
+            try:
+                message_data = json_loads(message)
+            except ValueError:
+                message_data = message
+            part = TextPart(text=message)
 
         # Log outgoing message
         log_agent_message(
@@ -75,7 +96,7 @@ class A2AClient:
             task_message = Message(
                 role="user",
                 message_id=str(uuid.uuid4()),
-                parts=[TextPart(text=message)],
+                parts=[part],
             )
 
             # Send task via JSON-RPC
@@ -150,7 +171,7 @@ class A2AClient:
             ) as response:
                 async for line in response.aiter_lines():
                     if line.startswith("data: "):
-                        data = json.loads(line[6:])
+                        data = json_loads(line[6:])
                         yield data
 
         except Exception as e:
@@ -0,0 +1,15 @@
+"""Fast JSON helpers for A2A message payloads, backed by pydantic-core."""
+
+from typing import Any
+
+from pydantic_core import from_json, to_json
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text. Raises ValueError on malformed input."""
+    return from_json(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text, stringifying unsupported values."""
+    return to_json(obj, fallback=str).decode()
@@ -1,8 +1,11 @@
 """Logging utilities for A2A agent communications."""
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from typing import Any, Optional
@@ -42,13 +45,25 @@ LOG_MESSAGES = os.environ.get("A2A_LOG_MESSAGES", "true").lower() == "true"
 logger = logging.getLogger("a2a")
 logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
-# Console handler with custom formatting
+# Console handler with custom formatting. Records are handed to a queue and
+# written to stdout by a listener thread, so concurrent tasks never block the
+# event loop on the stdout lock.
 if not logger.handlers:
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(logging.DEBUG)
     formatter = logging.Formatter('%(message)s')
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    _log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _listener = logging.handlers.QueueListener(_log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Get a module logger that shares the queued "a2a" console handler."""
+    return logger.getChild(name)
 
 
 def get_agent_color(agent_name: str) -> str:
@@ -0,0 +1,56 @@
+"""Decoding of A2A message parts shared by agents and their callers."""
+
+from typing import Any, Optional
+
+from .json_utils import json_loads
+
+
+def first_part(message: Any) -> Optional[Any]:
+    """Return a message's first part, unwrapped from the SDK's Part root model.
+
+    Accepts an a2a Message or its JSON dict form (as found in a
+    send_task response); returns None if the message has no parts.
+    """
+    if isinstance(message, dict):
+        parts = message.get("parts")
+    else:
+        parts = getattr(message, "parts", None)
+    if not parts:
+        return None
+    part = parts[0]
+    return part.root if hasattr(part, "root") else part
+
+
+def part_kind(part: Any) -> Optional[str]:
+    """Return a part's kind ("text", "data", ...), model or dict."""
+    if isinstance(part, dict):
+        return part.get("kind")
+    return getattr(part, "kind", None)
+
+
+def part_text(part: Any) -> str:
+    """Return a text part's text, or "" for other kinds."""
+    if isinstance(part, dict):
+        return part.get("text") or ""
+    return getattr(part, "text", None) or ""
+
+
+def part_payload(part: Any) -> Any:
+    """Decode a part: DataPart data as-is, TextPart text as JSON.
+
+    Raises ValueError if the text is not valid JSON.
+    """
+    if part_kind(part) == "data":
+        return part.get("data") if isinstance(part, dict) else part.data
+    return json_loads(part_text(part))
+
+
+def message_payload(message: Any) -> Any:
+    """Decode a message's first part; None if the message has no parts.
+
+    Raises ValueError if a text part is not valid JSON.
+    """
+    part = first_part(message)
+    if part is None:
+        return None
+    return part_payload(part)
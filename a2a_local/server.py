@@ -1,7 +1,6 @@
 """A2A Server implementation using a2a-sdk."""
 
 import asyncio
-import json
 import uuid
 from typing import Any, Callable, Optional
 from dataclasses import dataclass
@@ -17,11 +16,15 @@ from a2a.types import (
     Task,
     TaskState,
     Message,
+    DataPart,
     TextPart,
 )
 from starlette.middleware.cors import CORSMiddleware
 import uvicorn
 
+from .json_utils import json_dumps
+from .parts import first_part, part_kind
+
 
 @dataclass
 class AgentConfig:
@@ -32,6 +35,12 @@ class AgentConfig:
     version: str = "1.0.0"
 
 
+def is_data_message(message: Optional[Message]) -> bool:
+    """Whether a message carries its payload as a DataPart."""
+    part = first_part(message)
+    return part is not None and part_kind(part) == "data"
+
+
 class BaseAgentExecutor(AgentExecutor):
     """Base agent executor that can be extended by specific agents."""
 
@@ -68,11 +77,16 @@ class BaseAgentExecutor(AgentExecutor):
             else:
                 result = {"message": "No handler configured"}
 
-            # Create response message - use json.dumps for proper serialization
+            # Answer in kind: callers that sent a DataPart get the result as
+            # a structured object instead of JSON encoded inside a string
+            if is_data_message(context.message):
+                response_part = DataPart(data=result)
+            else:
+                response_part = TextPart(text=json_dumps(result))
             response_message = Message(
                 role="agent",
                 message_id=str(uuid.uuid4()),
-                parts=[TextPart(text=json.dumps(result, default=str))],
+                parts=[response_part],
             )
 
             # Update task with result
@@ -116,8 +130,8 @@ def create_agent_card(config: AgentConfig) -> AgentCard:
         version=config.version,
         capabilities=AgentCapabilities(streaming=True, pushNotifications=False),
         skills=skills,
-        defaultInputModes=["text"],
-        defaultOutputModes=["text"],
+        defaultInputModes=["text", "data"],
+        defaultOutputModes=["text", "data"],
     )
 
 
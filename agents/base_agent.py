@@ -1,19 +1,68 @@
 """Base agent class for all A2A agents."""
 
-import asyncio
-import json
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Optional
 
+import httpx
 from google import genai
-from google.genai.types import GenerateContentConfig
+from google.genai.types import GenerateContentConfig, HttpOptions
+from pydantic import TypeAdapter
+from pydantic_core import from_json
 
-from a2a_local import AgentConfig, run_agent_server
+from a2a_local import AgentConfig, json_loads, run_agent_server
 from a2a_local.logging_utils import log_llm_call, log_error, log_info
+from agents.llm_cache import llm_cache
+from agents.ratelimit import (
+    estimate_tokens,
+    gemini_limiter,
+    gemini_token_limiter,
+    is_rate_limit_error,
+)
 from config import config
 
 
+_gemini_client: Optional[genai.Client] = None
+_gemini_http: Optional[httpx.AsyncClient] = None
+
+
+def get_gemini_client() -> genai.Client:
+    """Process-wide Gemini client.
+
+    All agents in the process (main.py can run all eight together) share one
+    pooled async HTTP client, so connections to the API stay warm between calls.
+    """
+    global _gemini_client, _gemini_http
+    if _gemini_client is None:
+        _gemini_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=None,  # Long generations; callers bound their own waits
+        )
+        _gemini_client = genai.Client(
+            api_key=config.gemini.api_key,
+            http_options=HttpOptions(httpx_async_client=_gemini_http),
+        )
+    return _gemini_client
+
+
+async def close_gemini_client() -> None:
+    """Close the shared Gemini connection pool."""
+    global _gemini_client, _gemini_http
+    if _gemini_http is not None:
+        await _gemini_http.aclose()
+    _gemini_client = _gemini_http = None
+
+
+@lru_cache(maxsize=64)
+def read_prompt(*path_parts: str) -> str:
+    """Read a prompt file from the prompts directory (cached; prompts are static)."""
+    prompt_path = config.prompts_dir.joinpath(*path_parts)
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
+    return prompt_path.read_text()
+
+
 class BaseAgent(ABC):
     """Abstract base class for A2A agents."""
 
@@ -28,9 +77,9 @@ class BaseAgent(ABC):
 
     @property
     def gemini_client(self) -> genai.Client:
-        """Lazy initialization of Gemini client."""
+        """Gemini client, shared by every agent in the process."""
         if self._gemini_client is None:
-            self._gemini_client = genai.Client(api_key=config.gemini.api_key)
+            self._gemini_client = get_gemini_client()
         return self._gemini_client
 
     @abstractmethod
@@ -49,11 +98,13 @@ class BaseAgent(ABC):
         model = model or config.gemini.flash_model
         model_short = model.split("/")[-1] if "/" in model else model
 
+        # Bound both requests/sec and prompt tokens/min before calling out
+        await gemini_limiter.acquire()
+        await gemini_token_limiter.acquire(estimate_tokens(prompt))
         start_time = time.time()
 
         try:
-            response = await asyncio.to_thread(
-                self.gemini_client.models.generate_content,
+            response = await self.gemini_client.aio.models.generate_content(
                 model=model,
                 contents=prompt,
                 config=GenerateContentConfig(
@@ -63,6 +114,7 @@ class BaseAgent(ABC):
             )
 
             elapsed_ms = (time.time() - start_time) * 1000
+            gemini_limiter.on_success()
 
             # Log the LLM call
             log_llm_call(
@@ -77,6 +129,8 @@ class BaseAgent(ABC):
 
         except Exception as e:
             elapsed_ms = (time.time() - start_time) * 1000
+            if is_rate_limit_error(e):
+                gemini_limiter.on_rate_limited()
             log_llm_call(
                 agent_name=self.agent_name,
                 prompt=prompt,
@@ -91,15 +145,214 @@ class BaseAgent(ABC):
         prompt: str,
         model: Optional[str] = None,
         temperature: float = 0.7,
+        schema: Optional[TypeAdapter] = None,
+        cache: bool = False,
     ) -> list | dict:
-        """Generate JSON content using Gemini."""
+        """Generate JSON content using Gemini.
+
+        If a schema is given, the raw response text is decoded and validated
+        against it in one pydantic-core pass instead of going through json.loads.
+        With cache=True, a response that parsed successfully is reused for an
+        identical (model, prompt, temperature) request in this process.
+        """
+        cache_key = None
+        if cache:
+            cache_key = llm_cache.make_key(model or config.gemini.flash_model, prompt, temperature)
+            text = llm_cache.get(cache_key)
+            if text is not None:
+                return self._decode_json(text, schema)
+
         response = await self.generate_content(
             prompt=prompt,
             model=model,
             temperature=temperature,
         )
 
-        # Extract JSON from response
+        text = self._strip_code_fences(response)
+
+        data = self._decode_json(text, schema)
+        if cache_key is not None:
+            llm_cache.put(cache_key, text)
+        return data
+
+    async def generate_json_until(
+        self,
+        prompt: str,
+        stop_when: Callable[[str], bool],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 8192,
+        cache: bool = False,
+    ) -> tuple[Optional[list | dict], str]:
+        """Stream a JSON response, stopping as soon as stop_when(partial_text) is true.
+
+        Returns (data, text) for a complete response, or (None, partial_text)
+        if generation was cut short - the caller already has what it needs.
+        """
+        model = model or config.gemini.flash_model
+
+        cache_key = None
+        if cache:
+            cache_key = llm_cache.make_key(model, prompt, temperature)
+            text = llm_cache.get(cache_key)
+            if text is not None:
+                return self._decode_json(text), text
+
+        chunks: list[str] = []
+        stopped = False
+        stream = self._stream_text(prompt, model, temperature, max_tokens)
+        try:
+            async for text_chunk in stream:
+                chunks.append(text_chunk)
+                if stop_when("".join(chunks)):
+                    stopped = True
+                    break
+        finally:
+            await stream.aclose()
+
+        response = "".join(chunks)
+        if stopped:
+            return None, response
+
+        text = self._strip_code_fences(response)
+        data = self._decode_json(text)
+        if cache_key is not None:
+            llm_cache.put(cache_key, text)
+        return data, text
+
+    async def generate_json_items(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 8192,
+        cache: bool = False,
+        refresh: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Stream a JSON array response, yielding each element once it is complete.
+
+        Gemini is asked for JSON output directly, and the partial text is
+        re-parsed as chunks arrive, so callers get early elements while the
+        rest is still generating. A response that is not an array yields nothing.
+        With cache=True and refresh=True, a cached response is ignored and
+        replaced by the new one.
+        """
+        model = model or config.gemini.flash_model
+
+        cache_key = None
+        if cache:
+            cache_key = llm_cache.make_key(model, prompt, temperature)
+            text = None if refresh else llm_cache.get(cache_key)
+            if text is not None:
+                data = self._decode_json(text)
+                for item in data if isinstance(data, list) else []:
+                    yield item
+                return
+
+        buffer = ""
+        emitted = 0
+        stream = self._stream_text(prompt, model, temperature, max_tokens, json_mode=True)
+        try:
+            async for text_chunk in stream:
+                buffer += text_chunk
+                items = self._partial_json_items(buffer)
+                # The last element may still be cut off mid-object
+                for item in items[emitted:-1]:
+                    yield item
+                emitted = max(emitted, len(items) - 1)
+        finally:
+            await stream.aclose()
+
+        text = self._strip_code_fences(buffer)
+        data = self._decode_json(text)
+        if cache_key is not None:
+            llm_cache.put(cache_key, text)
+        for item in data[emitted:] if isinstance(data, list) else []:
+            yield item
+
+    async def _stream_text(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool = False,
+    ) -> AsyncIterator[str]:
+        """Stream response text chunks from Gemini, paced and logged like generate_content.
+
+        json_mode asks Gemini for a bare JSON response (no prose or code fences).
+        Closing the iterator early stops generation; the call is then logged
+        as stopped early.
+        """
+        model_short = model.split("/")[-1] if "/" in model else model
+
+        await gemini_limiter.acquire()
+        await gemini_token_limiter.acquire(estimate_tokens(prompt))
+        start_time = time.time()
+
+        chunks: list[str] = []
+        stream = None
+        complete = stopped = False
+        try:
+            stream = await self.gemini_client.aio.models.generate_content_stream(
+                model=model,
+                contents=prompt,
+                config=GenerateContentConfig(
+                    temperature=temperature,
+                    max_output_tokens=max_tokens,
+                    response_mime_type="application/json" if json_mode else None,
+                ),
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+            complete = True
+        except GeneratorExit:
+            # The consumer closed us early
+            stopped = True
+            raise
+        except Exception as e:
+            if is_rate_limit_error(e):
+                gemini_limiter.on_rate_limited()
+            log_llm_call(
+                agent_name=self.agent_name,
+                prompt=prompt,
+                model=model_short,
+                error=str(e),
+                duration_ms=(time.time() - start_time) * 1000,
+            )
+            raise
+        finally:
+            if stream is not None and not complete:
+                await stream.aclose()
+            if complete or stopped:
+                gemini_limiter.on_success()
+                log_llm_call(
+                    agent_name=self.agent_name,
+                    prompt=prompt,
+                    response="".join(chunks) + (" [stopped early]" if stopped else ""),
+                    model=model_short,
+                    duration_ms=(time.time() - start_time) * 1000,
+                )
+
+    @staticmethod
+    def _partial_json_items(text: str) -> list:
+        """Elements of a possibly truncated JSON array (empty if not parseable yet)."""
+        text = text.lstrip()
+        if text.startswith("```json"):
+            text = text[7:]
+        elif text.startswith("```"):
+            text = text[3:]
+        try:
+            data = from_json(text, allow_partial=True)
+        except ValueError:
+            return []
+        return data if isinstance(data, list) else []
+
+    @staticmethod
+    def _strip_code_fences(response: str) -> str:
+        """Extract JSON text from a response that may be wrapped in a code block."""
         text = response.strip()
 
         # Handle markdown code blocks
@@ -109,19 +362,21 @@ class BaseAgent(ABC):
             text = text[3:]
         if text.endswith("```"):
             text = text[:-3]
+        return text.strip()
 
+    def _decode_json(self, text: str, schema: Optional[TypeAdapter] = None) -> list | dict:
+        """Decode response text as JSON, validating against schema if given."""
         try:
-            return json.loads(text.strip())
-        except json.JSONDecodeError as e:
+            if schema is not None:
+                return schema.validate_json(text)
+            return json_loads(text)
+        except ValueError as e:  # also covers pydantic ValidationError
             log_error(self.agent_name, f"JSON parse error: {e}", context=text[:200])
             raise
 
     def load_prompt(self, *path_parts: str) -> str:
         """Load a prompt file from the prompts directory."""
-        prompt_path = config.prompts_dir.joinpath(*path_parts)
-        if not prompt_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-        return prompt_path.read_text()
+        return read_prompt(*path_parts)
 
     async def run(self):
         """Run the agent server."""
@@ -0,0 +1,76 @@
+"""Time-window micro-batching for agent calls made by concurrent pipelines."""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collects concurrent submissions into a single batch call.
+
+    A batch is flushed when it reaches `max_batch` items or `max_wait_ms`
+    after its first item arrived, whichever comes first. `fn` receives the
+    items in submission order and must return one result per item.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[list[T]], Awaitable[list[R]]],
+        max_batch: int = 8,
+        max_wait_ms: float = 50.0,
+    ):
+        self.fn = fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Keep references so in-flight batches aren't garbage collected
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for its result from the next batch."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # Drop submissions whose callers were cancelled while waiting
+        batch = [(item, future) for item, future in self._pending if not future.done()]
+        self._pending = []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results = await self.fn([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if i < len(results):
+                future.set_result(results[i])
+            else:
+                future.set_exception(RuntimeError("Batch returned fewer results than items"))
@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import Any, Optional
 from uuid import UUID
 
-from a2a_local import AgentConfig
+from a2a_local import AgentConfig, get_logger, message_payload
 from agents.base_agent import BaseAgent
 from models import (
     AtomicConcept,
@@ -17,6 +17,8 @@ from models import (
 )
 from config import config
 
+logger = get_logger(__name__)
+
 
 class ConceptGuideAgent(BaseAgent):
     """Agent that provides atomic concepts from our custom concept guide."""
@@ -64,7 +66,7 @@ class ConceptGuideAgent(BaseAgent):
 
         for topic_name, concepts_dir in topic_dirs.items():
             if not concepts_dir.exists():
-                print(f"Info: Concepts directory not found: {concepts_dir}")
+                logger.info("Concepts directory not found: %s", concepts_dir)
                 continue
 
             await self._load_concepts_from_dir(concepts_dir, topic_name)
@@ -118,24 +120,20 @@ class ConceptGuideAgent(BaseAgent):
                 # Only if there's no collision (first loaded wins)
                 if subtopic_key not in self._concept_graphs:
                     self._concept_graphs[subtopic_key] = graph
-                print(f"Loaded {len(concepts)} concepts for {namespaced_key}")
+                logger.info("Loaded %d concepts for %s", len(concepts), namespaced_key)
 
             except Exception as e:
-                print(f"Error loading {json_file}: {e}")
+                logger.error("Error loading %s: %s", json_file, e)
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming task requests."""
         await self._ensure_loaded()
 
-        message = task.status.message
-        if message and message.parts:
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, 'root') else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON in task message"}
-        else:
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            return {"error": "Invalid JSON in task message"}
+        if task_data is None:
             return {"error": "No task data provided"}
 
         action = task_data.get("action", "")
@@ -195,7 +193,7 @@ class ConceptGuideAgent(BaseAgent):
         exclude_ids: list[str] = None,
     ) -> dict:
         """Select a concept appropriate for the target difficulty."""
-        exclude_ids = exclude_ids or []
+        exclude_ids = set(exclude_ids or ())
 
         if subtopic not in self._concept_graphs:
             return {
@@ -208,9 +206,8 @@ class ConceptGuideAgent(BaseAgent):
 
         # Filter concepts by difficulty and exclusions
         eligible = [
-            c for c in graph.concepts
-            if c.difficulty_min <= difficulty <= c.difficulty_max
-            and c.id not in exclude_ids
+            c for c in graph.get_concepts_for_difficulty(difficulty)
+            if c.id not in exclude_ids
         ]
 
         if not eligible:
@@ -1,9 +1,9 @@
 """Correctness Agent - verifies answer correctness by working backwards and forwards."""
 
-import json
+import asyncio
 from typing import Any
 
-from a2a_local import AgentConfig
+from a2a_local import AgentConfig, message_payload
 from agents.base_agent import BaseAgent
 from config import config
 
@@ -23,21 +23,23 @@ class CorrectnessAgent(BaseAgent):
                     "description": "Work backwards from answer and solve forwards to verify correctness",
                     "tags": ["correctness", "verification", "math"],
                 },
+                {
+                    "id": "verify_correctness_batch",
+                    "name": "Verify Correctness Batch",
+                    "description": "Verify several questions' correctness in one request",
+                    "tags": ["correctness", "verification", "batch"],
+                },
             ],
         )
         super().__init__(agent_config)
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming task requests."""
-        message = task.status.message
-        if message and message.parts:
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, "root") else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON in task message"}
-        else:
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            return {"error": "Invalid JSON in task message"}
+        if task_data is None:
             return {"error": "No task data provided"}
 
         action = task_data.get("action", "")
@@ -47,6 +49,10 @@ class CorrectnessAgent(BaseAgent):
                 question=task_data.get("question", {}),
                 blueprint=task_data.get("blueprint", {}),
             )
+        elif action == "verify_correctness_batch":
+            return await self.verify_correctness_batch(
+                items=task_data.get("items", []),
+            )
         else:
             return {"error": f"Unknown action: {action}"}
 
@@ -60,7 +66,7 @@ class CorrectnessAgent(BaseAgent):
         try:
             prompt = self._build_verification_prompt(question, blueprint)
 
-            result_data = await self.generate_json(prompt, temperature=0.1)
+            result_data = await self.generate_json(prompt, temperature=0.1, cache=True)
 
             if not result_data:
                 return {"success": False, "error": "Failed to verify correctness"}
@@ -86,6 +92,17 @@ class CorrectnessAgent(BaseAgent):
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    async def verify_correctness_batch(self, items: list[dict]) -> dict:
+        """Verify a batch of {question, blueprint} items concurrently, in order."""
+        results = await asyncio.gather(*(
+            self.verify_correctness(
+                question=item.get("question", {}),
+                blueprint=item.get("blueprint", {}),
+            )
+            for item in items
+        ))
+        return {"success": True, "results": list(results)}
+
     def _build_verification_prompt(self, question: dict, blueprint: dict) -> str:
         """Build the prompt for verification."""
         content = question.get("content", "")
@@ -1,17 +1,16 @@
 """Database Agent for PostgreSQL operations."""
 
 import asyncio
-import json
 from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
 import asyncpg
 
-from a2a_local import AgentConfig
+from a2a_local import AgentConfig, json_dumps, message_payload
 from agents.base_agent import BaseAgent
 from models import Question, Exam
-from config import config
+from config import config, SUBTOPIC_SPECS_BY_NAME
 
 
 class DatabaseAgent(BaseAgent):
@@ -70,16 +69,11 @@ class DatabaseAgent(BaseAgent):
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming task requests."""
-        message = task.status.message
-        if message and message.parts:
-            # A2A SDK wraps parts - access via .root.text for TextPart
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, 'root') else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON in task message"}
-        else:
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            return {"error": "Invalid JSON in task message"}
+        if task_data is None:
             return {"error": "No task data provided"}
 
         action = task_data.get("action", "")
@@ -116,7 +110,7 @@ class DatabaseAgent(BaseAgent):
                     question_id = q_data.get("id") or str(uuid4())
 
                     # Convert choices to JSON
-                    choices = json.dumps(q_data.get("choices", []))
+                    choices = json_dumps(q_data.get("choices", []))
 
                     # Build insert query - matching database schema
                     query = """
@@ -156,7 +150,7 @@ class DatabaseAgent(BaseAgent):
                     # Prepare marking_criteria as JSON if present (handle empty list case)
                     marking_criteria = q_data.get("marking_criteria")
                     if marking_criteria is not None:
-                        marking_criteria = json.dumps(marking_criteria)
+                        marking_criteria = json_dumps(marking_criteria)
 
                     result = await conn.fetchval(
                         query,
@@ -194,6 +188,10 @@ class DatabaseAgent(BaseAgent):
         self, conn: asyncpg.Connection, subtopic_name: str
     ) -> Optional[UUID]:
         """Get subtopic ID from name."""
+        # Known subtopics resolve from config without a database round trip
+        spec = SUBTOPIC_SPECS_BY_NAME.get(subtopic_name)
+        if spec is not None:
+            return spec.id
         query = "SELECT id FROM subtopics WHERE name = $1 LIMIT 1"
         result = await conn.fetchval(query, subtopic_name)
         return result
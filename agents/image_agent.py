@@ -1,7 +1,6 @@
 """Image Agent for generating SAT-style educational diagrams using Gemini."""
 
 import asyncio
-import json
 import re
 import uuid
 from typing import Any, Optional
@@ -10,12 +9,14 @@ from dataclasses import dataclass
 import boto3
 import cairosvg
 
-from a2a_local import AgentConfig
+from a2a_local import AgentConfig, get_logger, first_part, part_payload, part_text
 from agents.base_agent import BaseAgent
 from agents.geosdf_generator import GeoSDFGenerator, ImageResult
 from agents.spatial_generator import SpatialReasoningGenerator
 from config import config
 
+logger = get_logger(__name__)
+
 
 class ImageAgent(BaseAgent):
     """Agent for generating educational diagrams using Gemini + CCJ loop."""
@@ -120,21 +121,13 @@ Reply with ONLY "spatial", "geosdf", or "ccj", nothing else."""
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming task requests."""
-        message = task.status.message
-        task_text = ""
-        if message and message.parts:
-            part = message.parts[0]
-            if isinstance(part, dict):
-                task_text = part.get("text", "")
-            elif hasattr(part, "text"):
-                task_text = part.text
-
-        if task_text:
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                task_data = {"action": "generate_diagram", "description": task_text}
-        else:
+        part = first_part(task.status.message)
+        try:
+            task_data = part_payload(part) if part is not None else None
+        except ValueError:
+            # Plain text is taken as the diagram description
+            task_data = {"action": "generate_diagram", "description": part_text(part)}
+        if not task_data:
             task_data = {"action": "generate_diagram", "description": ""}
 
         action = task_data.get("action", "generate_diagram")
@@ -162,7 +155,7 @@ Reply with ONLY "spatial", "geosdf", or "ccj", nothing else."""
         - CCJ loop (arxiv 2508.15222) for general diagrams
         """
         diagram_type = await self._route_diagram_type(description)
-        print(f"[ImageAgent] Routing to: {diagram_type} for: {description[:50]}...")
+        logger.info("[ImageAgent] Routing to: %s for: %.50s...", diagram_type, description)
 
         if diagram_type == "spatial":
             return await self._generate_spatial(difficulty)
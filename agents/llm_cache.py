@@ -0,0 +1,41 @@
+"""In-memory cache of LLM responses keyed by (model, prompt, temperature)."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Optional
+
+from config import config
+
+
+class LLMResponseCache:
+    """Bounded LRU cache of raw LLM response text."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+
+    @staticmethod
+    def make_key(model: str, prompt: str, temperature: float) -> str:
+        """Hash the request parameters that determine the response."""
+        payload = json.dumps(
+            {"model": model, "prompt": prompt, "temperature": temperature},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._entries[key] = text
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Shared by every agent in this process
+llm_cache = LLMResponseCache(max_entries=config.llm_cache_size)
@@ -1,7 +1,8 @@
 """Orchestrator Agent for coordinating the exam generation workflow."""
 
 import asyncio
-import json
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
@@ -9,12 +10,71 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from a2a_local import AgentConfig, A2AClient, AGENT_ENDPOINTS
+from a2a_local import AgentConfig, A2AClient, AGENT_ENDPOINTS, get_logger, first_part, message_payload, part_text
 from agents.base_agent import BaseAgent
 from agents.pipeline_controller import PipelineController, PipelineConfig
 from models import ThinkingSkillsConfig, MathConfig, PipelineResult
 from config import config
 
+logger = get_logger(__name__)
+
+# Default distribution matching NSW Selective exam (40 questions)
+# Based on analysis of official Practice Test 1
+# (subtopic, individual count param, default count)
+THINKING_SKILLS_DISTRIBUTION = (
+    ("critical_thinking", "critical_thinking_count", 7),      # Strengthen/weaken arguments
+    ("deduction", "deduction_count", 4),                      # "Whose reasoning is correct?" (2 characters)
+    ("inference", "inference_count", 4),                      # "Which shows the mistake?" (1 character)
+    ("logical_reasoning", "logical_reasoning_count", 11),     # Conditionals, constraints, logic grids
+    ("spatial_reasoning", "spatial_reasoning_count", 6),      # Visual patterns, shapes, transformations
+    ("numerical_reasoning", "numerical_reasoning_count", 8),  # Word problems with calculations
+)
+
+# Default distribution matching NSW Selective Math exam (35 questions)
+# Based on analysis of official Practice Test 1
+MATH_DISTRIBUTION = (
+    ("math:geometry", "geometry_count", 4),                      # Area, perimeter, angles, shapes
+    ("math:number_operations", "number_operations_count", 5),    # Place value, BODMAS, rounding
+    ("math:measurement", "measurement_count", 5),                # Time, scales, capacity, units
+    ("math:algebra_patterns", "algebra_patterns_count", 5),      # Symbol equations, sequences
+    ("math:fractions_decimals", "fractions_decimals_count", 5),  # Fraction ops, comparing, converting
+    ("math:probability", "probability_count", 3),                # Simple and combined probability
+    ("math:data_statistics", "data_statistics_count", 4),        # Mean, median, mode, tables
+    ("math:number_theory", "number_theory_count", 4),            # Factors, primes, divisibility
+)
+
+# Maximum replacement attempts for a rejected question slot
+MAX_RETRY_ROUNDS = 3
+
+
+@dataclass
+class SubtopicStats:
+    """Per-subtopic generation outcome, filled in place by its slot tasks.
+
+    Slot tasks all run on the event loop thread, so they update it without a lock.
+    """
+    subtopic: str
+    requested: int
+    questions: list[dict] = field(default_factory=list)
+    retries: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def verified(self) -> int:
+        return len(self.questions)
+
+    @property
+    def failed(self) -> int:
+        return self.requested - self.verified
+
+    def summary(self) -> dict:
+        return {
+            "requested": self.requested,
+            "verified": self.verified,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
+
 
 class GenerateExamRequest(BaseModel):
     exam_type: str  # "thinking_skills", "math", "reading"
@@ -48,21 +108,20 @@ class OrchestratorAgent(BaseAgent):
         self.a2a_client = A2AClient(timeout=300.0, caller_name="Orchestrator")
         self.pipeline = PipelineController(
             client=self.a2a_client,
-            config=PipelineConfig(max_revisions=3),
+            config=PipelineConfig(
+                max_revisions=3,
+                max_concurrent_questions=config.max_concurrent_questions,
+                accepted_verdict_cache_size=config.accepted_verdict_cache_size,
+            ),
         )
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming task requests."""
-        message = task.status.message
-        if message and message.parts:
-            # A2A SDK wraps parts - access via .root.text for TextPart
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, 'root') else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                task_data = {"action": "generate_exam", "exam_type": "thinking_skills"}
-        else:
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            task_data = None
+        if task_data is None:
             task_data = {"action": "generate_exam", "exam_type": "thinking_skills"}
 
         action = task_data.get("action", "generate_exam")
@@ -146,6 +205,7 @@ class OrchestratorAgent(BaseAgent):
 
         result["steps"][-1]["status"] = "completed"
         result["steps"][-1]["question_count"] = questions_result.get("total_questions", 0)
+        result["steps"][-1]["subtopic_stats"] = questions_result.get("subtopic_stats")
 
         questions = questions_result.get("questions", [])
 
@@ -165,22 +225,8 @@ class OrchestratorAgent(BaseAgent):
                 "count": len(questions_needing_images),
             })
 
-            for q in questions_needing_images:
-                image_result = await self._generate_image(q.get("image_description", ""))
-                if image_result.get("success"):
-                    # Image agent returns image_url (R2 URL), not base64
-                    image_url = image_result.get('image_url', '')
-                    if image_url:
-                        q["image_url"] = image_url
-
-                        # Insert image into the question content for rendering
-                        img_tag = f'<div class="question-image"><img src="{image_url}" alt="Question diagram"></div>'
-
-                        # Add image to content field (before the question text)
-                        if q.get("content"):
-                            q["content"] = img_tag + "\n" + q["content"]
-                        else:
-                            q["content"] = img_tag
+            # Images are independent, so request them all at once
+            await asyncio.gather(*(self._attach_image(q) for q in questions_needing_images))
 
             result["steps"][-1]["status"] = "completed"
 
@@ -263,92 +309,9 @@ class OrchestratorAgent(BaseAgent):
 
     async def _generate_thinking_skills(self, exam_config: dict) -> dict:
         """Generate thinking skills questions using the multi-agent pipeline."""
-        # Get subtopic distribution from config
-        subtopic_questions = exam_config.get("subtopic_questions", {})
         difficulty = exam_config.get("difficulty", 3)
-
-        # Default distribution matching NSW Selective exam (40 questions)
-        # Based on analysis of official Practice Test 1
-        default_counts = {
-            "critical_thinking": 7,      # Strengthen/weaken arguments
-            "deduction": 4,              # "Whose reasoning is correct?" (2 characters)
-            "inference": 4,              # "Which shows the mistake?" (1 character)
-            "logical_reasoning": 11,     # Conditionals, constraints, logic grids
-            "spatial_reasoning": 6,      # Visual patterns, shapes, transformations
-            "numerical_reasoning": 8,    # Word problems with calculations
-        }
-        # Total: 40 questions
-
-        # Build subtopic_questions from individual count params or use defaults
-        if not subtopic_questions:
-            subtopic_questions = {}
-            for subtopic, default_count in default_counts.items():
-                # Check for individual count param (e.g., "critical_thinking_count")
-                count_key = f"{subtopic}_count"
-                subtopic_questions[subtopic] = exam_config.get(count_key, default_count)
-
-        all_questions = []
-        errors = []
-        questions_by_subtopic = {st: [] for st in subtopic_questions.keys()}
-
-        max_retry_rounds = 3  # Maximum retry rounds for missing questions
-
-        for retry_round in range(max_retry_rounds + 1):
-            # Calculate what we still need
-            tasks = []
-            subtopic_names = []
-            for subtopic, target_count in subtopic_questions.items():
-                if target_count <= 0:
-                    continue
-                current_count = len(questions_by_subtopic[subtopic])
-                needed = target_count - current_count
-                if needed > 0:
-                    if retry_round == 0:
-                        print(f"Queuing {needed} questions for {subtopic}...")
-                    else:
-                        print(f"[Retry {retry_round}] Regenerating {needed} missing questions for {subtopic}...")
-                    tasks.append(self.pipeline.generate_batch(
-                        subtopic=subtopic,
-                        count=needed,
-                        difficulty=difficulty,
-                    ))
-                    subtopic_names.append(subtopic)
-
-            if not tasks:
-                # All questions generated successfully
-                break
-
-            print(f"Generating {len(tasks)} subtopics in parallel...")
-            all_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Process results from all subtopics
-            for subtopic, results in zip(subtopic_names, all_results):
-                if isinstance(results, Exception):
-                    errors.append(f"Error generating {subtopic}: {str(results)}")
-                    continue
-
-                for result in results:
-                    if result.accepted and result.question:
-                        # Question is already a dict from pipeline
-                        q_dict = result.question if isinstance(result.question, dict) else result.question.model_dump(mode="json")
-                        questions_by_subtopic[subtopic].append(q_dict)
-                    else:
-                        errors.extend(result.errors)
-
-        # Flatten all questions
-        for subtopic, questions in questions_by_subtopic.items():
-            all_questions.extend(questions)
-            actual = len(questions)
-            target = subtopic_questions.get(subtopic, 0)
-            if actual < target:
-                print(f"Warning: {subtopic} has {actual}/{target} questions after {max_retry_rounds} retries")
-
-        return {
-            "success": True,
-            "questions": all_questions,
-            "total_questions": len(all_questions),
-            "errors": errors if errors else None,
-        }
+        jobs = self._build_jobs(exam_config, THINKING_SKILLS_DISTRIBUTION)
+        return await self._generate_subtopics(jobs, difficulty)
 
     async def _generate_math(self, exam_config: dict) -> dict:
         """Generate math questions using the multi-agent pipeline.
@@ -356,105 +319,153 @@ class OrchestratorAgent(BaseAgent):
         NSW Selective Math exam: 35 questions, 40 minutes, 5 answer choices (A-E).
         Distribution based on official NSW exam analysis.
         """
-        # Get subtopic distribution from config
-        subtopic_questions = exam_config.get("subtopic_questions", {})
         difficulty = exam_config.get("difficulty", 3)
+        jobs = self._build_jobs(exam_config, MATH_DISTRIBUTION)
+        return await self._generate_subtopics(jobs, difficulty)
 
-        # Default distribution matching NSW Selective Math exam (35 questions)
-        # Based on analysis of official Practice Test 1
-        default_counts = {
-            "math:geometry": 4,            # Area, perimeter, angles, shapes
-            "math:number_operations": 5,   # Place value, BODMAS, rounding
-            "math:measurement": 5,         # Time, scales, capacity, units
-            "math:algebra_patterns": 5,    # Symbol equations, sequences
-            "math:fractions_decimals": 5,  # Fraction ops, comparing, converting
-            "math:probability": 3,         # Simple and combined probability
-            "math:data_statistics": 4,     # Mean, median, mode, tables
-            "math:number_theory": 4,       # Factors, primes, divisibility
-        }
-        # Total: 35 questions
-
-        # Build subtopic_questions from individual count params or use defaults
-        if not subtopic_questions:
-            subtopic_questions = {}
-            for subtopic, default_count in default_counts.items():
-                # Check for individual count param (e.g., "geometry_count")
-                # Remove "math:" prefix for param name
-                param_name = subtopic.replace("math:", "") + "_count"
-                subtopic_questions[subtopic] = exam_config.get(param_name, default_count)
-
-        all_questions = []
-        errors = []
-        questions_by_subtopic = {st: [] for st in subtopic_questions.keys()}
-
-        max_retry_rounds = 3  # Maximum retry rounds for missing questions
-
-        for retry_round in range(max_retry_rounds + 1):
-            # Calculate what we still need
-            tasks = []
-            subtopic_names = []
-            for subtopic, target_count in subtopic_questions.items():
-                if target_count <= 0:
-                    continue
-                current_count = len(questions_by_subtopic[subtopic])
-                needed = target_count - current_count
-                if needed > 0:
-                    if retry_round == 0:
-                        print(f"Queuing {needed} questions for {subtopic}...")
-                    else:
-                        print(f"[Retry {retry_round}] Regenerating {needed} missing questions for {subtopic}...")
-                    tasks.append(self.pipeline.generate_batch(
-                        subtopic=subtopic,
-                        count=needed,
-                        difficulty=difficulty,
-                    ))
-                    subtopic_names.append(subtopic)
+    @staticmethod
+    def _build_jobs(
+        exam_config: dict,
+        distribution: tuple[tuple[str, str, int], ...],
+    ) -> list[tuple[str, int]]:
+        """Resolve the (subtopic, count) jobs for an exam once, dropping zero counts.
 
-            if not tasks:
-                # All questions generated successfully
-                break
+        An explicit subtopic_questions mapping wins; otherwise each subtopic uses
+        its individual count param (e.g. "geometry_count") or the default.
+        """
+        subtopic_questions = exam_config.get("subtopic_questions")
+        if subtopic_questions:
+            items = subtopic_questions.items()
+        else:
+            items = (
+                (subtopic, exam_config.get(count_key, default_count))
+                for subtopic, count_key, default_count in distribution
+            )
+        return [(subtopic, count) for subtopic, count in items if count > 0]
 
-            print(f"Generating {len(tasks)} subtopics in parallel...")
-            all_results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _generate_subtopics(self, jobs: list[tuple[str, int]], difficulty: int) -> dict:
+        """Generate every subtopic concurrently and flatten the accepted questions.
 
-            # Process results from all subtopics
-            for subtopic, results in zip(subtopic_names, all_results):
-                if isinstance(results, Exception):
-                    errors.append(f"Error generating {subtopic}: {str(results)}")
-                    continue
+        Subtopics run as sibling tasks in a TaskGroup, so no subtopic waits on a
+        slower one before starting its retries.
+        """
+        logger.info("Generating %d subtopics in parallel...", len(jobs))
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._generate_subtopic(subtopic, count, difficulty))
+                for subtopic, count in jobs
+            ]
 
-                for result in results:
-                    if result.accepted and result.question:
-                        # Question is already a dict from pipeline
-                        q_dict = result.question if isinstance(result.question, dict) else result.question.model_dump(mode="json")
-                        questions_by_subtopic[subtopic].append(q_dict)
-                    else:
-                        errors.extend(result.errors)
-
-        # Flatten all questions
-        for subtopic, questions in questions_by_subtopic.items():
-            all_questions.extend(questions)
-            actual = len(questions)
-            target = subtopic_questions.get(subtopic, 0)
-            if actual < target:
-                print(f"Warning: {subtopic} has {actual}/{target} questions after {max_retry_rounds} retries")
+        all_questions = []
+        errors = []
+        subtopic_stats = {}
+        for task in tasks:
+            stats = task.result()
+            all_questions.extend(stats.questions)
+            errors.extend(stats.errors)
+            subtopic_stats[stats.subtopic] = stats.summary()
 
         return {
             "success": True,
             "questions": all_questions,
             "total_questions": len(all_questions),
             "errors": errors if errors else None,
+            "subtopic_stats": subtopic_stats,
         }
 
+    async def _generate_subtopic(
+        self,
+        subtopic: str,
+        target_count: int,
+        difficulty: int,
+    ) -> SubtopicStats:
+        """Fill target_count question slots for one subtopic.
+
+        The first pass goes through the pipeline's batched generation. Each slot
+        that comes back rejected then retries on its own (up to MAX_RETRY_ROUNDS
+        times) without waiting for the other slots.
+        """
+        logger.info("Queuing %d questions for %s...", target_count, subtopic)
+        stats = SubtopicStats(subtopic=subtopic, requested=target_count)
+
+        def accepted_question(result: PipelineResult) -> Optional[dict]:
+            if result.accepted and result.question:
+                # Question is already a dict from pipeline
+                return result.question if isinstance(result.question, dict) else result.question.model_dump(mode="json")
+            stats.errors.extend(result.errors)
+            return None
+
+        try:
+            first_pass = await self.pipeline.generate_batch(
+                subtopic=subtopic,
+                count=target_count,
+                difficulty=difficulty,
+            )
+        except Exception as e:
+            stats.errors.append(f"Error generating {subtopic}: {str(e)}")
+            first_pass = []
+
+        stats.questions = [q for result in first_pass if (q := accepted_question(result))]
+
+        async def fill_slot(slot: int) -> None:
+            for retry_round in range(1, MAX_RETRY_ROUNDS + 1):
+                logger.debug("[Retry %d] Regenerating question %d for %s...", retry_round, slot + 1, subtopic)
+                stats.retries += 1
+                try:
+                    result = await self.pipeline.generate_question(
+                        subtopic=subtopic,
+                        difficulty=difficulty,
+                    )
+                except Exception as e:
+                    stats.errors.append(f"Error generating {subtopic}: {str(e)}")
+                    continue
+                if question := accepted_question(result):
+                    stats.questions.append(question)
+                    return
+
+        async with asyncio.TaskGroup() as tg:
+            for i in range(stats.verified, target_count):
+                tg.create_task(fill_slot(i))
+
+        if stats.failed > 0:
+            logger.warning(
+                "%s has %d/%d questions after %d retries",
+                subtopic, stats.verified, target_count, stats.retries,
+            )
+        return stats
+
+    async def _attach_image(self, q: dict) -> None:
+        """Generate the diagram for a question and embed it in the question content."""
+        try:
+            image_result = await self._generate_image(q.get("image_description", ""))
+        except Exception as e:
+            logger.error("Error generating image: %s", e)
+            return
+
+        if image_result.get("success"):
+            # Image agent returns image_url (R2 URL), not base64
+            image_url = image_result.get('image_url', '')
+            if image_url:
+                q["image_url"] = image_url
+
+                # Insert image into the question content for rendering
+                img_tag = f'<div class="question-image"><img src="{image_url}" alt="Question diagram"></div>'
+
+                # Add image to content field (before the question text)
+                if q.get("content"):
+                    q["content"] = img_tag + "\n" + q["content"]
+                else:
+                    q["content"] = img_tag
+
     async def _generate_image(self, description: str) -> dict:
         """Send task to Image Agent."""
         endpoint = AGENT_ENDPOINTS["image"]
 
-        task_message = json.dumps({
+        task_message = {
             "action": "generate_diagram",
             "description": description,
             "max_attempts": 3,
-        })
+        }
 
         response = await self.a2a_client.send_task(
             endpoint=endpoint,
@@ -476,15 +487,12 @@ class OrchestratorAgent(BaseAgent):
         status = response.get("status")
         if status and isinstance(status, dict):
             message = status.get("message")
-            if message and isinstance(message, dict):
-                parts = message.get("parts", [])
-                if parts:
-                    text = parts[0].get("text", "")
-                    if text:
-                        try:
-                            return json.loads(text)
-                        except json.JSONDecodeError:
-                            return {"error": f"Invalid JSON response: {text[:100]}"}
+            if message and isinstance(message, dict) and message.get("parts"):
+                try:
+                    return message_payload(message)
+                except ValueError:
+                    text = part_text(first_part(message))
+                    return {"error": f"Invalid JSON response: {text[:100]}"}
 
         # Maybe it's already the parsed result
         if "success" in response:
@@ -496,10 +504,10 @@ class OrchestratorAgent(BaseAgent):
         """Send task to Database Agent."""
         endpoint = AGENT_ENDPOINTS["database"]
 
-        task_message = json.dumps({
+        task_message = {
             "action": "insert_questions",
             "questions": questions,
-        })
+        }
 
         response = await self.a2a_client.send_task(
             endpoint=endpoint,
@@ -516,11 +524,11 @@ class OrchestratorAgent(BaseAgent):
         """Send task to Database Agent."""
         endpoint = AGENT_ENDPOINTS["database"]
 
-        task_message = json.dumps({
+        task_message = {
             "action": "create_exam",
             "exam": exam_data,
             "question_ids": question_ids,
-        })
+        }
 
         response = await self.a2a_client.send_task(
             endpoint=endpoint,
@@ -537,11 +545,11 @@ class OrchestratorAgent(BaseAgent):
         """Send task to Database Agent to add exam to a pack."""
         endpoint = AGENT_ENDPOINTS["database"]
 
-        task_message = json.dumps({
+        task_message = {
             "action": "add_exam_to_pack",
             "exam_id": exam_id,
             "pack_id": pack_id,
-        })
+        }
 
         response = await self.a2a_client.send_task(
             endpoint=endpoint,
@@ -554,10 +562,19 @@ class OrchestratorAgent(BaseAgent):
 # FastAPI app for REST API
 def create_api_app() -> FastAPI:
     """Create FastAPI app with REST endpoints."""
+    orchestrator = OrchestratorAgent()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Share one A2A connection pool for the app's lifetime
+        async with orchestrator.a2a_client:
+            yield
+
     app = FastAPI(
         title="Selective Test Generator API",
         description="A2A-based exam generation system",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware for browser requests
@@ -569,8 +586,6 @@ def create_api_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    orchestrator = OrchestratorAgent()
-
     @app.get("/health")
     async def health():
         return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
@@ -613,7 +628,7 @@ def create_api_app() -> FastAPI:
     async def list_packs():
         """List available exam packs."""
         endpoint = AGENT_ENDPOINTS["database"]
-        task_message = json.dumps({"action": "get_exam_packs"})
+        task_message = {"action": "get_exam_packs"}
 
         result = await orchestrator.a2a_client.send_task(
             endpoint=endpoint,
@@ -629,7 +644,7 @@ def create_api_app() -> FastAPI:
     async def list_concepts():
         """List all available subtopics and concepts."""
         endpoint = AGENT_ENDPOINTS["concept_guide"]
-        task_message = json.dumps({"action": "list_subtopics"})
+        task_message = {"action": "list_subtopics"}
 
         result = await orchestrator.a2a_client.send_task(
             endpoint=endpoint,
@@ -645,10 +660,10 @@ def create_api_app() -> FastAPI:
     async def get_concepts(subtopic: str):
         """Get concepts for a specific subtopic."""
         endpoint = AGENT_ENDPOINTS["concept_guide"]
-        task_message = json.dumps({
+        task_message = {
             "action": "get_concepts",
             "subtopic": subtopic,
-        })
+        }
 
         result = await orchestrator.a2a_client.send_task(
             endpoint=endpoint,
@@ -670,11 +685,11 @@ def create_api_app() -> FastAPI:
         concept_result = await orchestrator.a2a_client.send_task(
             endpoint=AGENT_ENDPOINTS["concept_guide"],
             skill_id="select_concept",
-            message=json.dumps({
+            message={
                 "action": "select_concept",
                 "subtopic": subtopic,
                 "difficulty": difficulty,
-            }),
+            },
         )
 
         if not concept_result.get("success"):
@@ -684,10 +699,10 @@ def create_api_app() -> FastAPI:
         gen_result = await orchestrator.a2a_client.send_task(
             endpoint=AGENT_ENDPOINTS["question_generator"],
             skill_id="generate_question",
-            message=json.dumps({
+            message={
                 "action": "generate_question",
                 "selection": concept_result.get("selection"),
-            }),
+            },
         )
 
         if not gen_result.get("success"):
@@ -1,21 +1,44 @@
 """Pipeline Controller for orchestrating the multi-agent question generation flow."""
 
 import asyncio
+import hashlib
 import json
+from collections import OrderedDict
 from typing import Any, Optional
 from dataclasses import dataclass, field
 
-from a2a_local import A2AClient, AGENT_ENDPOINTS, log_pipeline_step, log_info, log_error
+from a2a_local import A2AClient, AGENT_ENDPOINTS, get_logger, log_pipeline_step, log_info, log_error, first_part, message_payload, part_text
+from pydantic import ValidationError
+
+from agents.batching import MicroBatcher
+
 from models import (
     JudgmentStatus,
     PipelineResult,
+    Question,
 )
 
+logger = get_logger(__name__)
+
 
 @dataclass
 class PipelineConfig:
     """Configuration for the pipeline."""
     max_revisions: int = 3
+    # Upper bound on questions in flight at once across all subtopics
+    max_concurrent_questions: int = 10
+    # Run the quality check concurrently with correctness, cancelling it if
+    # correctness fails (lower latency, some wasted tokens on failures)
+    speculative_quality_check: bool = True
+    # Questions requested per generation call in generate_batch
+    generation_batch_size: int = 4
+    # Correctness checks from concurrent questions are sent together, up to this
+    # many per call; 1 sends each check on its own
+    correctness_batch_size: int = 8
+    # How long the first check in a correctness batch waits for company
+    correctness_batch_wait_ms: float = 50.0
+    # Accepted verdicts kept for skipping re-verification of identical questions
+    accepted_verdict_cache_size: int = 512
 
 
 @dataclass
@@ -38,6 +61,15 @@ class PipelineController:
     def __init__(self, client: A2AClient, config: Optional[PipelineConfig] = None):
         self.client = client
         self.config = config or PipelineConfig()
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrent_questions)
+        # Verdicts of accepted questions, keyed by content hash, so an identical
+        # question coming back from the generator is not verified twice (LRU)
+        self._accepted_verdicts: OrderedDict[str, dict] = OrderedDict()
+        self._correctness_batcher = MicroBatcher(
+            self._verify_correctness_batch,
+            max_batch=self.config.correctness_batch_size,
+            max_wait_ms=self.config.correctness_batch_wait_ms,
+        )
 
     async def generate_question(
         self,
@@ -46,6 +78,16 @@ class PipelineController:
         exclude_concept_ids: Optional[list[str]] = None,
     ) -> PipelineResult:
         """Generate a single question through the full pipeline."""
+        async with self._semaphore:
+            return await self._run_pipeline(subtopic, difficulty, exclude_concept_ids)
+
+    async def _run_pipeline(
+        self,
+        subtopic: str,
+        difficulty: int,
+        exclude_concept_ids: Optional[list[str]],
+    ) -> PipelineResult:
+        """Run select -> generate -> verify -> quality (-> revise) for one question."""
         state = PipelineState(subtopic=subtopic, difficulty=difficulty)
         exclude_ids = exclude_concept_ids or []
 
@@ -63,14 +105,34 @@ class PipelineController:
             concept_name = state.concept_selection.get("concept", {}).get("name", "Unknown")
             log_info("Pipeline", f"Selected concept: {concept_name}")
 
+        except Exception as e:
+            state.errors.append(f"Pipeline error: {str(e)}")
+            return self._create_result(state)
+
+        return await self._refine_question(state)
+
+    async def _refine_question(
+        self,
+        state: PipelineState,
+        gen_result: Optional[dict] = None,
+    ) -> PipelineResult:
+        """Generate, verify correctness, check quality, and possibly revise.
+
+        If gen_result is given (e.g. from a batch generation call) it is used as
+        the first attempt instead of generating the question here.
+        """
+        concept_name = state.concept_selection.get("concept", {}).get("name", "Unknown")
+
+        try:
             # Step 2-5: Generate, verify correctness, check quality, and possibly revise
             for attempt in range(self.config.max_revisions + 1):
                 state.revision_count = attempt
 
                 # Step 2: Generate question (blueprint + realization)
                 if attempt == 0:
-                    log_pipeline_step("Generate Question", 2, 4, f"concept={concept_name}")
-                    gen_result = await self._generate_question(state.concept_selection)
+                    if gen_result is None:
+                        log_pipeline_step("Generate Question", 2, 4, f"concept={concept_name}")
+                        gen_result = await self._generate_question(state.concept_selection)
                 else:
                     log_pipeline_step(f"Revise Question (attempt {attempt + 1})", 2, 4,
                                      f"issues: {len(state.quality_result.get('issues', []))}")
@@ -89,29 +151,66 @@ class PipelineController:
                 state.blueprint = gen_result.get("blueprint")
                 state.question = gen_result.get("question")
 
-                # Step 3: Verify correctness (work backwards + forwards)
-                log_pipeline_step("Verify Correctness", 3, 4, f"attempt {attempt + 1}")
-                correctness_result = await self._verify_correctness(
-                    state.question,
-                    state.blueprint,
-                )
-
-                if correctness_result and not correctness_result.get("verified", False):
-                    # Failed correctness check - treat as quality failure for revision
-                    log_info("Pipeline", f"✗ Correctness FAILED - {len(correctness_result.get('issues', []))} issues")
+                # Fast path: this exact question already passed verification
+                content_key = self._content_key(state.question)
+                cached_verdict = self._accepted_verdicts.get(content_key)
+                if cached_verdict is not None:
+                    self._accepted_verdicts.move_to_end(content_key)
+                    log_info("Pipeline", "✓ Question ACCEPTED (previously verified content)")
+                    state.quality_result = cached_verdict
+                    state.accepted = True
+                    break
+
+                # Cheap local checks first - structurally broken questions go
+                # straight back for revision without an LLM round-trip
+                structural_issues = self._structural_check(state.question)
+                if structural_issues:
+                    log_info("Pipeline", f"✗ Structural check FAILED - {len(structural_issues)} issues")
                     state.quality_result = {
                         "accepted": False,
-                        "issues": correctness_result.get("issues", ["Answer verification failed"]),
-                        "suggestions": correctness_result.get("suggestions", []),
+                        "issues": structural_issues,
+                        "suggestions": [],
                     }
                     continue
 
-                # Step 4: Check quality (solve + attack + judge)
-                log_pipeline_step("Quality Check", 4, 4, f"attempt {attempt + 1}")
-                state.quality_result = await self._check_quality(
-                    state.question,
-                    state.blueprint,
-                )
+                # Step 3: Verify correctness (work backwards + forwards)
+                log_pipeline_step("Verify Correctness", 3, 4, f"attempt {attempt + 1}")
+                quality_task = None
+                if self.config.speculative_quality_check:
+                    # Start the quality check alongside correctness; it's cancelled
+                    # if correctness fails, otherwise its result is already on the way
+                    quality_task = asyncio.create_task(
+                        self._check_quality(state.question, state.blueprint)
+                    )
+
+                try:
+                    correctness_result = await self._verify_correctness(
+                        state.question,
+                        state.blueprint,
+                    )
+
+                    if correctness_result and not correctness_result.get("verified", False):
+                        # Failed correctness check - treat as quality failure for revision
+                        log_info("Pipeline", f"✗ Correctness FAILED - {len(correctness_result.get('issues', []))} issues")
+                        state.quality_result = {
+                            "accepted": False,
+                            "issues": correctness_result.get("issues", ["Answer verification failed"]),
+                            "suggestions": correctness_result.get("suggestions", []),
+                        }
+                        continue
+
+                    # Step 4: Check quality (solve + attack + judge)
+                    log_pipeline_step("Quality Check", 4, 4, f"attempt {attempt + 1}")
+                    if quality_task is not None:
+                        state.quality_result = await quality_task
+                    else:
+                        state.quality_result = await self._check_quality(
+                            state.question,
+                            state.blueprint,
+                        )
+                finally:
+                    if quality_task is not None and not quality_task.done():
+                        quality_task.cancel()
 
                 if not state.quality_result:
                     log_error("Pipeline", f"Quality check failed (attempt {attempt + 1})")
@@ -122,6 +221,7 @@ class PipelineController:
                 if state.quality_result.get("accepted"):
                     log_info("Pipeline", f"✓ Question ACCEPTED after {attempt + 1} attempt(s)")
                     state.accepted = True
+                    self._remember_verdict(content_key, state.quality_result)
                     break
                 else:
                     issues = state.quality_result.get("issues", [])
@@ -139,34 +239,63 @@ class PipelineController:
         count: int,
         difficulty: int = 3,
     ) -> list[PipelineResult]:
-        """Generate multiple questions for a subtopic in PARALLEL."""
-        # Generate all questions in parallel for speed
-        # Note: This means we can't exclude concepts across questions in same batch
-        # Trade-off: May get duplicate concepts, but much faster
-        tasks = [
-            self.generate_question(
-                subtopic=subtopic,
-                difficulty=difficulty,
-                exclude_concept_ids=[],  # No exclusion in parallel mode
-            )
+        """Generate multiple questions for a subtopic, batching the generation step.
+
+        Concepts are selected in parallel, then generated generation_batch_size
+        at a time in one LLM call each. Every question is then verified and
+        revised on its own; any question missing from a batch response falls
+        back to single generation inside _refine_question.
+        """
+        # Note: selection runs in parallel, so we can't exclude concepts across
+        # questions in the same batch. Trade-off: may get duplicate concepts.
+        selections = await asyncio.gather(*(
+            self._select_concept(subtopic, difficulty, [])
             for _ in range(count)
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        ))
+
+        results: list[PipelineResult] = []
+        states: list[PipelineState] = []
+        for selection in selections:
+            state = PipelineState(subtopic=subtopic, difficulty=difficulty, concept_selection=selection)
+            if selection:
+                states.append(state)
+            else:
+                state.errors.append("Failed to select concept")
+                results.append(self._create_result(state))
+
+        size = max(1, self.config.generation_batch_size)
+        chunks = [states[i:i + size] for i in range(0, len(states), size)]
+        log_pipeline_step("Generate Questions", 2, 4, f"{len(states)} questions in {len(chunks)} batch(es)")
+        gen_batches = await asyncio.gather(*(
+            self._generate_questions([state.concept_selection for state in chunk])
+            for chunk in chunks
+        ))
+
+        async def refine(state: PipelineState, gen_result: Optional[dict]) -> PipelineResult:
+            async with self._semaphore:
+                return await self._refine_question(state, gen_result)
+
+        refined = await asyncio.gather(
+            *(
+                refine(state, gen_result)
+                for chunk, gen_results in zip(chunks, gen_batches)
+                for state, gen_result in zip(chunk, gen_results)
+            ),
+            return_exceptions=True,
+        )
 
         # Filter out exceptions and convert to PipelineResult
-        valid_results = []
-        for r in results:
+        for r in refined:
             if isinstance(r, Exception):
-                valid_results.append(PipelineResult(
-                    accepted=False,
-                    question=None,
-                    errors=[f"Generation error: {str(r)}"],
-                ))
+                results.append(PipelineResult.from_trusted({
+                    "accepted": False,
+                    "question": None,
+                    "errors": [f"Generation error: {str(r)}"],
+                }))
             else:
-                valid_results.append(r)
+                results.append(r)
 
-        return valid_results
+        return results
 
     async def _select_concept(
         self,
@@ -179,19 +308,19 @@ class PipelineController:
             response = await self.client.send_task(
                 endpoint=AGENT_ENDPOINTS["concept_guide"],
                 skill_id="select_concept",
-                message=json.dumps({
+                message={
                     "action": "select_concept",
                     "subtopic": subtopic,
                     "difficulty": difficulty,
                     "exclude_ids": exclude_ids,
-                }),
+                },
             )
             result = self._parse_response(response)
             if result and result.get("success"):
                 return result.get("selection")
             return None
         except Exception as e:
-            print(f"Error selecting concept: {e}")
+            logger.error("Error selecting concept: %s", e)
             return None
 
     async def _generate_question(self, selection: dict) -> Optional[dict]:
@@ -200,19 +329,40 @@ class PipelineController:
             response = await self.client.send_task(
                 endpoint=AGENT_ENDPOINTS["question_generator"],
                 skill_id="generate_question",
-                message=json.dumps({
+                message={
                     "action": "generate_question",
                     "selection": selection,
-                }),
+                },
             )
             result = self._parse_response(response)
             if result and result.get("success"):
                 return result
             return None
         except Exception as e:
-            print(f"Error generating question: {e}")
+            logger.error("Error generating question: %s", e)
             return None
 
+    async def _generate_questions(self, selections: list[dict]) -> list[Optional[dict]]:
+        """Generate a batch of questions; failed entries come back as None."""
+        try:
+            response = await self.client.send_task(
+                endpoint=AGENT_ENDPOINTS["question_generator"],
+                skill_id="generate_questions",
+                message={
+                    "action": "generate_questions",
+                    "selections": selections,
+                },
+            )
+            result = self._parse_response(response)
+            items = result.get("results", []) if result and result.get("success") else []
+        except Exception as e:
+            logger.error("Error generating question batch: %s", e)
+            items = []
+
+        gen_results = [item if item.get("success") else None for item in items[:len(selections)]]
+        gen_results.extend([None] * (len(selections) - len(gen_results)))
+        return gen_results
+
     async def _revise_question(
         self,
         question: dict,
@@ -225,20 +375,20 @@ class PipelineController:
             response = await self.client.send_task(
                 endpoint=AGENT_ENDPOINTS["question_generator"],
                 skill_id="revise_question",
-                message=json.dumps({
+                message={
                     "action": "revise_question",
                     "question": question,
                     "blueprint": blueprint,
                     "issues": issues,
                     "suggestions": suggestions,
-                }),
+                },
             )
             result = self._parse_response(response)
             if result and result.get("success"):
                 return result
             return None
         except Exception as e:
-            print(f"Error revising question: {e}")
+            logger.error("Error revising question: %s", e)
             return None
 
     async def _check_quality(
@@ -251,18 +401,18 @@ class PipelineController:
             response = await self.client.send_task(
                 endpoint=AGENT_ENDPOINTS["quality_checker"],
                 skill_id="check_quality",
-                message=json.dumps({
+                message={
                     "action": "check_quality",
                     "question": question,
                     "blueprint": blueprint,
-                }),
+                },
             )
             result = self._parse_response(response)
             if result and result.get("success"):
                 return result
             return None
         except Exception as e:
-            print(f"Error checking quality: {e}")
+            logger.error("Error checking quality: %s", e)
             return None
 
     async def _verify_correctness(
@@ -271,15 +421,26 @@ class PipelineController:
         blueprint: dict,
     ) -> Optional[dict]:
         """Verify the correctness of a question by working backwards and forwards."""
+        if self.config.correctness_batch_size > 1:
+            try:
+                result = await self._correctness_batcher.submit((question, blueprint))
+            except Exception as e:
+                logger.error("Error verifying correctness: %s", e)
+                result = None
+            if result and result.get("success"):
+                return result
+            # If correctness check fails to run, assume verified to not block pipeline
+            return {"verified": True, "issues": [], "suggestions": []}
+
         try:
             response = await self.client.send_task(
                 endpoint=AGENT_ENDPOINTS["correctness"],
                 skill_id="verify_correctness",
-                message=json.dumps({
+                message={
                     "action": "verify_correctness",
                     "question": question,
                     "blueprint": blueprint,
-                }),
+                },
             )
             result = self._parse_response(response)
             if result and result.get("success"):
@@ -287,10 +448,73 @@ class PipelineController:
             # If correctness check fails to run, assume verified to not block pipeline
             return {"verified": True, "issues": [], "suggestions": []}
         except Exception as e:
-            print(f"Error verifying correctness: {e}")
+            logger.error("Error verifying correctness: %s", e)
             # On error, don't block the pipeline - just log and continue
             return {"verified": True, "issues": [], "suggestions": []}
 
+    async def _verify_correctness_batch(
+        self,
+        items: list[tuple[dict, dict]],
+    ) -> list[Optional[dict]]:
+        """Verify several (question, blueprint) pairs in one call; failed entries come back as None."""
+        response = await self.client.send_task(
+            endpoint=AGENT_ENDPOINTS["correctness"],
+            skill_id="verify_correctness_batch",
+            message={
+                "action": "verify_correctness_batch",
+                "items": [
+                    {"question": question, "blueprint": blueprint}
+                    for question, blueprint in items
+                ],
+            },
+        )
+        result = self._parse_response(response)
+        results = result.get("results", []) if result and result.get("success") else []
+        results = results[:len(items)]
+        results.extend([None] * (len(items) - len(results)))
+        return results
+
+    @staticmethod
+    def _structural_check(question: Optional[dict]) -> list[str]:
+        """Run the O(1) structural checks that don't need an LLM."""
+        try:
+            parsed = Question.model_validate(question or {})
+        except ValidationError as e:
+            return [f"Invalid question structure: {err['loc']}: {err['msg']}" for err in e.errors()]
+
+        issues = parsed.validate_structure()
+
+        if parsed.choices:
+            texts = [(c.text or "").strip() for c in parsed.choices]
+            if not all(texts):
+                issues.append("Every choice needs non-empty text")
+            if any(t == f"Option {i + 1}" for i, t in enumerate(texts)):
+                issues.append("Too few choices were generated; placeholder options were filled in")
+            if len(set(texts)) != len(texts):
+                issues.append("Choices must be distinct")
+
+        if not parsed.explanation.strip() or parsed.explanation == "No explanation provided.":
+            issues.append("Explanation is missing")
+
+        if parsed.requires_image and not parsed.image_description:
+            issues.append("Question requires an image but has no image description")
+
+        return issues
+
+    def _remember_verdict(self, key: str, verdict: dict) -> None:
+        self._accepted_verdicts[key] = verdict
+        self._accepted_verdicts.move_to_end(key)
+        while len(self._accepted_verdicts) > self.config.accepted_verdict_cache_size:
+            self._accepted_verdicts.popitem(last=False)
+
+    @staticmethod
+    def _content_key(question: Optional[dict]) -> str:
+        """Hash a question's content, ignoring the per-parse random id."""
+        payload = {k: v for k, v in (question or {}).items() if k != "id"}
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
     def _parse_response(self, response: Any) -> Optional[dict]:
         """Parse the response from an agent."""
         if response is None:
@@ -298,7 +522,7 @@ class PipelineController:
 
         # Handle error response
         if isinstance(response, dict) and "error" in response:
-            print(f"Agent returned error: {response['error']}")
+            logger.warning("Agent returned error: %s", response["error"])
             return None
 
         # Handle dict response (from A2AClient.send_task)
@@ -307,17 +531,13 @@ class PipelineController:
             status = response.get("status")
             if status and isinstance(status, dict):
                 message = status.get("message")
-                if message and isinstance(message, dict):
-                    parts = message.get("parts", [])
-                    if parts:
-                        part = parts[0]
-                        text = part.get("text", "")
-                        if text:
-                            try:
-                                return json.loads(text)
-                            except json.JSONDecodeError:
-                                print(f"Failed to parse JSON from agent response: {text[:100]}")
-                                return None
+                if message and isinstance(message, dict) and message.get("parts"):
+                    try:
+                        return message_payload(message)
+                    except ValueError:
+                        logger.warning("Failed to parse JSON from agent response: %.100s",
+                                       part_text(first_part(message)))
+                        return None
 
             # Maybe it's already the parsed result
             if "success" in response or "selection" in response:
@@ -325,25 +545,21 @@ class PipelineController:
 
         # Handle Task response object (legacy)
         if hasattr(response, 'status') and hasattr(response.status, 'message'):
-            message = response.status.message
-            if message and message.parts:
-                part = message.parts[0]
-                text = part.root.text if hasattr(part, 'root') else part.text
-                try:
-                    return json.loads(text)
-                except json.JSONDecodeError:
-                    return None
+            try:
+                return message_payload(response.status.message)
+            except ValueError:
+                return None
 
         return None
 
     def _create_result(self, state: PipelineState) -> PipelineResult:
         """Create a PipelineResult from the current state."""
         # Pass the question dict directly - it's already properly formatted from the agent
-        return PipelineResult(
-            accepted=state.accepted,
-            question=state.question,
-            concept_id=state.concept_selection.get("concept", {}).get("id") if state.concept_selection else None,
-            revision_count=state.revision_count,
-            judgment=state.quality_result if state.quality_result else None,
-            errors=state.errors,
-        )
+        return PipelineResult.from_trusted({
+            "accepted": state.accepted,
+            "question": state.question,
+            "concept_id": state.concept_selection.get("concept", {}).get("id") if state.concept_selection else None,
+            "revision_count": state.revision_count,
+            "judgment": state.quality_result if state.quality_result else None,
+            "errors": list(state.errors),
+        })
@@ -1,10 +1,10 @@
 """Quality Checker Agent - combines solving, adversarial testing, and judgment."""
 
 import asyncio
-import json
+import re
 from typing import Any, Optional
 
-from a2a_local import AgentConfig
+from a2a_local import AgentConfig, message_payload
 from agents.base_agent import BaseAgent
 from models import (
     JudgmentStatus,
@@ -14,6 +14,9 @@ from models import (
 )
 from config import config
 
+# Matches the solver's pick as soon as it appears in a streamed MCQ response
+SOLVED_ANSWER_RE = re.compile(r'"solved_answer_id"\s*:\s*"?([^",\s}]+)')
+
 
 class QualityCheckerAgent(BaseAgent):
     """Agent that solves, attacks, and judges questions for quality."""
@@ -36,15 +39,11 @@ class QualityCheckerAgent(BaseAgent):
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming task requests."""
-        message = task.status.message
-        if message and message.parts:
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, 'root') else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON in task message"}
-        else:
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            return {"error": "Invalid JSON in task message"}
+        if task_data is None:
             return {"error": "No task data provided"}
 
         action = task_data.get("action", "")
@@ -61,14 +60,26 @@ class QualityCheckerAgent(BaseAgent):
         """Perform comprehensive quality check on a question."""
         try:
             prompt = self._build_quality_check_prompt(question, blueprint)
+            question_type = question.get('type', 'multiple-choice')
 
-            result_data = await self.generate_json(prompt, temperature=0.3)
+            if question_type in (QuestionTypeEnum.DRAG_AND_DROP.value, QuestionTypeEnum.CLOZE.value):
+                result_data = await self.generate_json(prompt, temperature=0.3, cache=True)
+            else:
+                # MCQ: solved_answer_id comes early in the output, and a wrong
+                # solve rejects the question regardless of everything after it
+                result_data, partial = await self.generate_json_until(
+                    prompt,
+                    stop_when=self._solver_missed,
+                    temperature=0.3,
+                    cache=True,
+                )
+                if result_data is None:
+                    return self._solver_missed_result(question_type, partial)
 
             if not result_data:
                 return {"success": False, "error": "Failed to check quality"}
 
             # Determine final status based on question type
-            question_type = question.get('type', 'multiple-choice')
             status = self._determine_status(result_data, question_type)
 
             # Determine answer correctness based on type
@@ -111,6 +122,39 @@ class QualityCheckerAgent(BaseAgent):
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    @staticmethod
+    def _solver_missed(partial: str) -> bool:
+        """True once the streamed solver answer is known and isn't choice 1."""
+        match = SOLVED_ANSWER_RE.search(partial)
+        return match is not None and match.group(1) != "1"
+
+    def _solver_missed_result(self, question_type: str, partial: str) -> dict:
+        """Rejection built from a response cut short after a wrong solve."""
+        solved_id = SOLVED_ANSWER_RE.search(partial).group(1)
+        issue = f"Solver selected answer {solved_id}, not the marked correct answer (1)"
+        return {
+            "success": True,
+            "question_type": question_type,
+            "solution": {
+                "steps": [],
+                "selected_answer_id": solved_id,
+                "solved_order": None,
+                "solved_blanks": None,
+                "confidence": 0.5,
+            },
+            "answer_matches": False,
+            "vulnerabilities": [],
+            "can_shortcut": False,
+            "vulnerability_score": 0.0,
+            "scores": {},
+            "status": JudgmentStatus.REJECTED.value,
+            "accepted": False,
+            "issues": [issue],
+            "suggestions": [
+                "Re-check the solution: either fix the marked answer or remove the ambiguity that leads to the other choice",
+            ],
+        }
+
     def _build_quality_check_prompt(self, question: dict, blueprint: dict) -> str:
         """Build comprehensive quality check prompt based on question type."""
         question_type = question.get('type', 'multiple-choice')
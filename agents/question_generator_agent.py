@@ -1,12 +1,15 @@
 """Question Generator Agent - combines blueprint planning and surface realization."""
 
 import asyncio
-import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, TypedDict
 from uuid import UUID
 
-from a2a_local import AgentConfig
+from pydantic import ConfigDict, TypeAdapter, with_config
+
+from a2a_local import AgentConfig, json_dumps, message_payload
 from agents.base_agent import BaseAgent
 from models import (
     QuestionBlueprint,
@@ -14,10 +17,11 @@ from models import (
     TargetSkill,
     DistractorSpec,
     SolutionStep,
-    Question,
     Choice,
+    Question,
     QuestionTypeEnum,
 )
+from models.question import intern_tags
 from config import config
 
 # Paths to prompts directories by topic
@@ -29,215 +33,42 @@ PROMPTS_DIRS = {
 PROMPTS_DIR = PROMPTS_DIRS["thinking_skills"]
 
 
-class QuestionGeneratorAgent(BaseAgent):
-    """Agent that creates question blueprints and realizes them into polished questions."""
-
-    def __init__(self):
-        agent_config = AgentConfig(
-            name="QuestionGeneratorAgent",
-            description="Creates blueprints and generates polished NSW Selective exam questions",
-            port=config.ports.question_generator,
-            skills=[
-                {
-                    "id": "generate_question",
-                    "name": "Generate Question",
-                    "description": "Generate a complete question from a concept selection",
-                    "tags": ["generation", "question"],
-                },
-                {
-                    "id": "revise_question",
-                    "name": "Revise Question",
-                    "description": "Revise a question based on feedback",
-                    "tags": ["generation", "revision"],
-                },
-            ],
-        )
-        super().__init__(agent_config)
-        self._prompt_cache: dict[str, str] = {}
-
-    def _load_subtopic_prompt(self, subtopic_name: str, topic: str = "thinking_skills") -> Optional[str]:
-        """Load the subtopic-specific prompt from markdown files.
-
-        Args:
-            subtopic_name: The subtopic name (e.g., "Geometry", "Logical Reasoning")
-            topic: The topic namespace ("thinking_skills" or "math")
-        """
-        cache_key = f"{topic}:{subtopic_name}"
-        if cache_key in self._prompt_cache:
-            return self._prompt_cache[cache_key]
-
-        # Convert subtopic name to filename (e.g., "Logical Reasoning" -> "logical_reasoning.md")
-        filename = subtopic_name.lower().replace(" ", "_").replace("&", "and") + ".md"
-
-        # Try the topic-specific directory first
-        prompts_dir = PROMPTS_DIRS.get(topic, PROMPTS_DIR)
-        prompt_path = prompts_dir / filename
-
-        if prompt_path.exists():
-            content = prompt_path.read_text()
-            self._prompt_cache[cache_key] = content
-            return content
-        return None
-
-    async def handle_task(self, task: Any, context: Any) -> dict:
-        """Handle incoming task requests."""
-        message = task.status.message
-        if message and message.parts:
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, 'root') else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON in task message"}
-        else:
-            return {"error": "No task data provided"}
-
-        action = task_data.get("action", "")
-
-        if action == "generate_question":
-            return await self.generate_question(task_data.get("selection", {}))
-        elif action == "revise_question":
-            return await self.revise_question(
-                question=task_data.get("question", {}),
-                blueprint=task_data.get("blueprint", {}),
-                issues=task_data.get("issues", []),
-                suggestions=task_data.get("suggestions", []),
-            )
-        else:
-            return {"error": f"Unknown action: {action}"}
-
-    def _detect_topic(self, concept_data: dict) -> str:
-        """Detect the topic from concept data (thinking_skills or math)."""
-        topic_name = concept_data.get("topic_name", "").lower()
-        if "math" in topic_name:
-            return "math"
-        return "thinking_skills"
-
-    async def generate_question(self, selection_data: dict) -> dict:
-        """Generate a complete question from a concept selection."""
-        try:
-            concept_data = selection_data.get("concept", {})
-            target_difficulty = selection_data.get("target_difficulty", 3)
-            target_bloom = selection_data.get("target_bloom_level", "application")
-            selected_misconceptions = selection_data.get("selected_misconceptions", [])
-            selected_pattern = selection_data.get("selected_pattern")
-
-            # Detect topic (thinking_skills or math)
-            topic = self._detect_topic(concept_data)
-
-            # Generate blueprint and question in one prompt
-            prompt = self._build_generation_prompt(
-                concept_data=concept_data,
-                target_difficulty=target_difficulty,
-                target_bloom=target_bloom,
-                selected_misconceptions=selected_misconceptions,
-                selected_pattern=selected_pattern,
-                topic=topic,
-            )
-
-            result_data = await self.generate_json(prompt, temperature=0.7)
-
-            if not result_data:
-                return {"success": False, "error": "Failed to generate question"}
-
-            # Parse into models
-            blueprint = self._parse_blueprint(result_data, concept_data, target_difficulty, topic)
-            question = self._parse_question(result_data, blueprint, topic)
-
-            return {
-                "success": True,
-                "blueprint": blueprint.model_dump(mode="json"),
-                "question": question.model_dump(mode="json"),
-            }
-
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-
-    async def revise_question(
-        self,
-        question: dict,
-        blueprint: dict,
-        issues: list[str],
-        suggestions: list[str],
-    ) -> dict:
-        """Revise a question based on feedback."""
-        try:
-            prompt = self._build_revision_prompt(question, blueprint, issues, suggestions)
-
-            result_data = await self.generate_json(prompt, temperature=0.5)
-
-            if not result_data:
-                return {"success": False, "error": "Failed to revise question"}
-
-            # Parse revised blueprint and question
-            concept_data = {
-                "id": blueprint.get("concept_id"),
-                "name": blueprint.get("concept_name"),
-                "subtopic_id": blueprint.get("subtopic_id"),
-                "subtopic_name": blueprint.get("subtopic_name"),
-            }
+# Literal "\n" escapes the LLM sometimes leaves in HTML fields despite the prompt rules
+LITERAL_NEWLINE_RE = re.compile(r"\\n")
 
-            revised_blueprint = self._parse_blueprint(
-                result_data,
-                concept_data,
-                blueprint.get("difficulty_target", 3),
-            )
-            revised_blueprint.revision_count = blueprint.get("revision_count", 0) + 1
 
-            revised_question = self._parse_question(result_data, revised_blueprint)
+def sanitize_newlines(text: Optional[str]) -> Optional[str]:
+    """Replace literal backslash-n sequences with <br> tags."""
+    if not text or "\\" not in text:
+        return text
+    return LITERAL_NEWLINE_RE.sub("<br>", text)
 
-            return {
-                "success": True,
-                "blueprint": revised_blueprint.model_dump(mode="json"),
-                "question": revised_question.model_dump(mode="json"),
-                "revision_count": revised_blueprint.revision_count,
-            }
 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+@lru_cache(maxsize=64)
+def _read_subtopic_prompt(topic: str, subtopic_name: str) -> Optional[str]:
+    """Read a subtopic prompt once per process; misses are cached as None too."""
+    # Convert subtopic name to filename (e.g., "Logical Reasoning" -> "logical_reasoning.md")
+    filename = subtopic_name.lower().replace(" ", "_").replace("&", "and") + ".md"
 
-    def _determine_question_type(self, subtopic_name: str, concept_data: dict) -> str:
-        """Determine the appropriate question type based on subtopic.
+    # Try the topic-specific directory first
+    prompts_dir = PROMPTS_DIRS.get(topic, PROMPTS_DIR)
+    prompt_path = prompts_dir / filename
 
-        Note: Thinking Skills and Math are ALWAYS multiple-choice.
-        Cloze, drag-and-drop, and other types are for English/Reading only.
-        """
-        # Thinking Skills and Math are always multiple-choice
-        # Spatial Reasoning may have images but is still MCQ format
-        return QuestionTypeEnum.MULTIPLE_CHOICE.value
+    if prompt_path.exists():
+        return prompt_path.read_text()
+    return None
 
-    def _build_generation_prompt(
-        self,
-        concept_data: dict,
-        target_difficulty: int,
-        target_bloom: str,
-        selected_misconceptions: list[str],
-        selected_pattern: str = None,
-        topic: str = "thinking_skills",
-    ) -> str:
-        """Build the prompt for question generation using NSW exam formats."""
-        subtopic_name = concept_data.get('subtopic_name', 'Unknown')
-        subtopic_prompt = self._load_subtopic_prompt(subtopic_name, topic)
 
-        # Use topic-specific builder
-        if topic == "math":
-            return self._build_math_prompt(
-                concept_data=concept_data,
-                target_difficulty=target_difficulty,
-                target_bloom=target_bloom,
-                selected_misconceptions=selected_misconceptions,
-                selected_pattern=selected_pattern,
-                subtopic_prompt=subtopic_prompt,
-            )
+# Static prompt sections, built once at import rather than on every question
 
-        difficulty_desc = {
-            1: "EASY - straightforward, 1-2 steps",
-            2: "MEDIUM - requires careful thinking, 2-3 steps",
-            3: "EXTREMELY HARD - only top 5% of Year 6 students should answer correctly",
-        }
+DIFFICULTY_DESC = {
+    1: "EASY - straightforward, 1-2 steps",
+    2: "MEDIUM - requires careful thinking, 2-3 steps",
+    3: "EXTREMELY HARD - only top 5% of Year 6 students should answer correctly",
+}
 
-        # HARD difficulty requirements - these get inserted into the prompt
-        hard_requirements = """
+# HARD difficulty requirements - these get inserted into the prompt
+HARD_REQUIREMENTS = """
 ## CRITICAL: MAKE THIS QUESTION GENUINELY DIFFICULT
 
 This is for the NSW Selective Schools exam - a competitive test where only the TOP 5% of students
@@ -269,14 +100,9 @@ are selected. Your question must be GENUINELY CHALLENGING, not a straightforward
 - Multiple valid-looking paths: Several approaches seem right but only one works
 """
 
-        misconceptions_text = "\n".join(f"- {m}" for m in selected_misconceptions) if selected_misconceptions else ""
-
-        requires_image = concept_data.get("typically_requires_image", False)
-        image_types = concept_data.get("image_types", [])
-
-        # Build image section based on subtopic requirements
-        if subtopic_name == "Deduction":
-            image_section = """
+# Image sections for subtopics with a fixed image format
+SUBTOPIC_IMAGE_SECTIONS = {
+    "Deduction": """
 ## Image Requirement
 For Deduction questions, the image shows TWO character portraits side-by-side with names (NO quotes in image).
 Character statements go in the content field as HTML, not in the image.
@@ -287,9 +113,8 @@ person1_name: [Name1]
 person1_appearance: [brief description]
 person2_name: [Name2]
 person2_appearance: [brief description]
-```"""
-        elif subtopic_name == "Inference":
-            image_section = """
+```""",
+    "Inference": """
 ## Image Requirement
 For Inference questions, the image shows a SINGLE character portrait with their name AND their flawed statement.
 Set requires_image: true and provide image_description in this format:
@@ -298,21 +123,16 @@ image_type: character_portrait_single
 person_name: [Name]
 person_appearance: [brief description]
 person_statement: "[Their exact flawed statement]"
-```"""
-        elif requires_image:
-            image_section = f"""
-## Image Requirement
-This question type may require an image.
-Suitable image types: {', '.join(image_types) if image_types else 'diagram, figure, or visual'}
-If using an image, set requires_image: true and describe in image_description."""
-        else:
-            image_section = """
+```""",
+}
+
+TEXT_ONLY_IMAGE_SECTION = """
 ## Image Requirement
 This question should be text-only. Set requires_image: false."""
 
-        # Build subtopic-specific format instructions
-        if subtopic_name == "Deduction":
-            format_instructions = """
+# Subtopic-specific output format instructions
+SUBTOPIC_FORMAT_INSTRUCTIONS = {
+    "Deduction": """
 ## OUTPUT FORMAT (NSW Selective Exam - Deduction)
 
 For Deduction questions, use this EXACT structure:
@@ -337,9 +157,8 @@ For Deduction questions, use this EXACT structure:
     "tags": ["Thinking Skills", "Deduction"]
 }
 
-Character name pairs to use: Sara & Mila, Will & Evie, Jack & Amelia, Yifan & Ria, Alex & Jordan, Marcus & Leila"""
-        elif subtopic_name == "Inference":
-            format_instructions = """
+Character name pairs to use: Sara & Mila, Will & Evie, Jack & Amelia, Yifan & Ria, Alex & Jordan, Marcus & Leila""",
+    "Inference": """
 ## OUTPUT FORMAT (NSW Selective Exam - Inference)
 
 For Inference questions, use this EXACT structure with HTML box:
@@ -364,9 +183,8 @@ For Inference questions, use this EXACT structure with HTML box:
     "tags": ["Thinking Skills", "Inference"]
 }
 
-Character names to use: Sam, Ferdinand, Jarrah, Lisa, Alex, Maya, Noah, Priya, Marcus, Zara"""
-        elif subtopic_name == "Critical Thinking":
-            format_instructions = """
+Character names to use: Sam, Ferdinand, Jarrah, Lisa, Alex, Maya, Noah, Priya, Marcus, Zara""",
+    "Critical Thinking": """
 ## OUTPUT FORMAT (NSW Selective Exam - Critical Thinking)
 
 For Critical Thinking (strengthen/weaken argument) questions:
@@ -389,9 +207,8 @@ For Critical Thinking (strengthen/weaken argument) questions:
     ],
     "explanation": "Explanation with <strong>HTML</strong> formatting",
     "tags": ["Thinking Skills", "Critical Thinking"]
-}"""
-        elif subtopic_name == "Logical Reasoning":
-            format_instructions = """
+}""",
+    "Logical Reasoning": """
 ## OUTPUT FORMAT (NSW Selective Exam - Logical Reasoning)
 
 For Logical Reasoning (constraint satisfaction / logic puzzles), you MUST split content and question:
@@ -416,9 +233,8 @@ For Logical Reasoning (constraint satisfaction / logic puzzles), you MUST split
     "tags": ["Thinking Skills", "Logical Reasoning"]
 }
 
-CRITICAL: The 'content' field MUST contain the puzzle setup and ALL clues. The 'question_text' field should ONLY contain the question being asked (e.g., "Which statement must be true?"). Do NOT put clues in question_text."""
-        elif subtopic_name == "Numerical Reasoning":
-            format_instructions = """
+CRITICAL: The 'content' field MUST contain the puzzle setup and ALL clues. The 'question_text' field should ONLY contain the question being asked (e.g., "Which statement must be true?"). Do NOT put clues in question_text.""",
+    "Numerical Reasoning": """
 ## OUTPUT FORMAT (NSW Selective Exam - Numerical Reasoning)
 
 For Numerical Reasoning (number patterns, sequences, mathematical logic):
@@ -443,9 +259,8 @@ For Numerical Reasoning (number patterns, sequences, mathematical logic):
     "tags": ["Thinking Skills", "Numerical Reasoning"]
 }
 
-CRITICAL: The 'content' field MUST contain the sequence, pattern, or problem setup. The 'question_text' should ONLY contain the question. Do NOT put the sequence/pattern in question_text."""
-        elif subtopic_name == "Spatial Reasoning":
-            format_instructions = """
+CRITICAL: The 'content' field MUST contain the sequence, pattern, or problem setup. The 'question_text' should ONLY contain the question. Do NOT put the sequence/pattern in question_text.""",
+    "Spatial Reasoning": """
 ## OUTPUT FORMAT (NSW Selective Exam - Spatial Reasoning)
 
 For Spatial Reasoning (3D visualization, rotations, views):
@@ -470,9 +285,8 @@ For Spatial Reasoning (3D visualization, rotations, views):
     "tags": ["Thinking Skills", "Spatial Reasoning"]
 }
 
-CRITICAL: The 'content' field should describe what the student is looking at. The 'question_text' asks what they need to identify."""
-        elif subtopic_name == "Pattern Recognition":
-            format_instructions = """
+CRITICAL: The 'content' field should describe what the student is looking at. The 'question_text' asks what they need to identify.""",
+    "Pattern Recognition": """
 ## OUTPUT FORMAT (NSW Selective Exam - Pattern Recognition)
 
 For Pattern Recognition (visual/logical patterns, sequences):
@@ -497,9 +311,51 @@ For Pattern Recognition (visual/logical patterns, sequences):
     "tags": ["Thinking Skills", "Pattern Recognition"]
 }
 
-CRITICAL: The 'content' field MUST contain the pattern/sequence. The 'question_text' should ONLY ask the question."""
-        else:
-            format_instructions = f"""
+CRITICAL: The 'content' field MUST contain the pattern/sequence. The 'question_text' should ONLY ask the question.""",
+}
+
+CRITICAL_RULES = """
+
+## CRITICAL RULES
+1. Choice id="1" MUST be the correct answer
+2. Question must have exactly ONE correct answer
+3. Language: clear, unambiguous, Year 6 appropriate vocabulary (but HARD reasoning)
+4. NEVER use literal \\n in content - use actual line breaks or <br> tags
+5. For Deduction: Use HTML box format with character statements
+6. For Inference: Use HTML box format with premise and character statement
+7. All explanations should use <strong>HTML</strong> for emphasis
+8. THIS MUST BE A GENUINELY DIFFICULT QUESTION - if a typical Year 6 student can solve it quickly, it's TOO EASY
+
+## AUSTRALIAN CONTEXT (MANDATORY)
+- Use AUSTRALIAN ENGLISH spelling: colour, favourite, organisation, travelled, centre, metre, litre, programme
+- All locations MUST be Australian: Sydney, Melbourne, Brisbane, Perth, Adelaide, Canberra, Hobart, Darwin
+- Use Australian suburbs: Parramatta, Bondi, St Kilda, Surry Hills, Manly, Fremantle, Paddington
+- Australian schools: use names like "Northwood Primary", "Riverside Public School", "St Mary's College"
+- Australian currency: dollars and cents ($, AUD)
+- Australian seasons: Summer (Dec-Feb), Autumn (Mar-May), Winter (Jun-Aug), Spring (Sep-Nov)
+- Australian animals/plants when relevant: kangaroo, koala, platypus, wombat, eucalyptus, banksia
+- Australian sports: cricket, AFL, rugby league, netball, swimming
+- NO American references: no "favorite", "color", "math" (use "maths"), no US cities, no Fahrenheit
+
+Output ONLY the JSON object."""
+
+
+@lru_cache(maxsize=32)
+def _generic_image_section(requires_image: bool, image_types: tuple[str, ...]) -> str:
+    """Image section for subtopics without a dedicated one."""
+    if not requires_image:
+        return TEXT_ONLY_IMAGE_SECTION
+    return f"""
+## Image Requirement
+This question type may require an image.
+Suitable image types: {', '.join(image_types) if image_types else 'diagram, figure, or visual'}
+If using an image, set requires_image: true and describe in image_description."""
+
+
+@lru_cache(maxsize=64)
+def _generic_format_instructions(subtopic_name: str, requires_image: bool) -> str:
+    """Output format section for subtopics without a dedicated one."""
+    return f"""
 ## OUTPUT FORMAT (NSW Selective Exam)
 
 {{
@@ -524,6 +380,343 @@ CRITICAL: The 'content' field MUST contain the pattern/sequence. The 'question_t
 
 CRITICAL: The 'content' field should contain the problem setup/context. The 'question_text' should only contain the actual question."""
 
+
+@with_config(ConfigDict(coerce_numbers_to_str=True))
+class ChoiceWire(TypedDict, total=False):
+    """A choice as emitted by the LLM."""
+    id: str
+    text: str
+    misconception: Optional[str]
+
+
+@with_config(ConfigDict(coerce_numbers_to_str=True))
+class SolutionStepWire(TypedDict, total=False):
+    step_number: int
+    description: str
+    reasoning: str
+
+
+@with_config(ConfigDict(coerce_numbers_to_str=True))
+class GeneratedQuestionWire(TypedDict, total=False):
+    """Blueprint + question JSON as emitted by the generation/revision prompts.
+
+    Fields are optional so the _parse_* helpers keep applying their defaults.
+    """
+    setup_elements: list[Any]
+    question_stem_structure: str
+    constraints: list[Any]
+    correct_answer_reasoning: str
+    solution_steps: list[SolutionStepWire]
+    requires_image: bool
+    image_spec: Optional[str]
+    content: Optional[str]
+    question_text: str
+    choices: list[ChoiceWire]
+    explanation: str
+    tags: list[str]
+
+
+# Built once; validates the raw LLM text straight into plain dicts
+GENERATED_QUESTION_ADAPTER = TypeAdapter(GeneratedQuestionWire)
+GENERATED_BATCH_ADAPTER = TypeAdapter(list[GeneratedQuestionWire])
+
+
+class QuestionGeneratorAgent(BaseAgent):
+    """Agent that creates question blueprints and realizes them into polished questions."""
+
+    def __init__(self):
+        agent_config = AgentConfig(
+            name="QuestionGeneratorAgent",
+            description="Creates blueprints and generates polished NSW Selective exam questions",
+            port=config.ports.question_generator,
+            skills=[
+                {
+                    "id": "generate_question",
+                    "name": "Generate Question",
+                    "description": "Generate a complete question from a concept selection",
+                    "tags": ["generation", "question"],
+                },
+                {
+                    "id": "generate_questions",
+                    "name": "Generate Questions",
+                    "description": "Generate several questions (same subtopic) in one LLM call",
+                    "tags": ["generation", "question", "batch"],
+                },
+                {
+                    "id": "revise_question",
+                    "name": "Revise Question",
+                    "description": "Revise a question based on feedback",
+                    "tags": ["generation", "revision"],
+                },
+            ],
+        )
+        super().__init__(agent_config)
+
+    def _load_subtopic_prompt(self, subtopic_name: str, topic: str = "thinking_skills") -> Optional[str]:
+        """Load the subtopic-specific prompt from markdown files.
+
+        Args:
+            subtopic_name: The subtopic name (e.g., "Geometry", "Logical Reasoning")
+            topic: The topic namespace ("thinking_skills" or "math")
+        """
+        return _read_subtopic_prompt(topic, subtopic_name)
+
+    async def handle_task(self, task: Any, context: Any) -> dict:
+        """Handle incoming task requests."""
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            return {"error": "Invalid JSON in task message"}
+        if task_data is None:
+            return {"error": "No task data provided"}
+
+        action = task_data.get("action", "")
+
+        if action == "generate_question":
+            return await self.generate_question(task_data.get("selection", {}))
+        elif action == "generate_questions":
+            return await self.generate_questions(task_data.get("selections", []))
+        elif action == "revise_question":
+            return await self.revise_question(
+                question=task_data.get("question", {}),
+                blueprint=task_data.get("blueprint", {}),
+                issues=task_data.get("issues", []),
+                suggestions=task_data.get("suggestions", []),
+            )
+        else:
+            return {"error": f"Unknown action: {action}"}
+
+    def _detect_topic(self, concept_data: dict) -> str:
+        """Detect the topic from concept data (thinking_skills or math)."""
+        topic_name = concept_data.get("topic_name", "").lower()
+        if "math" in topic_name:
+            return "math"
+        return "thinking_skills"
+
+    async def generate_question(self, selection_data: dict) -> dict:
+        """Generate a complete question from a concept selection."""
+        try:
+            concept_data = selection_data.get("concept", {})
+            target_difficulty = selection_data.get("target_difficulty", 3)
+            target_bloom = selection_data.get("target_bloom_level", "application")
+            selected_misconceptions = selection_data.get("selected_misconceptions", [])
+            selected_pattern = selection_data.get("selected_pattern")
+
+            # Detect topic (thinking_skills or math)
+            topic = self._detect_topic(concept_data)
+
+            # Generate blueprint and question in one prompt
+            prompt = self._build_generation_prompt(
+                concept_data=concept_data,
+                target_difficulty=target_difficulty,
+                target_bloom=target_bloom,
+                selected_misconceptions=selected_misconceptions,
+                selected_pattern=selected_pattern,
+                topic=topic,
+            )
+
+            result_data = await self.generate_json(
+                prompt,
+                temperature=0.7,
+                schema=GENERATED_QUESTION_ADAPTER,
+                cache=config.cache_generation_responses,
+            )
+
+            if not result_data:
+                return {"success": False, "error": "Failed to generate question"}
+
+            # Parse into models
+            blueprint = self._parse_blueprint(result_data, concept_data, target_difficulty, topic)
+            question = self._parse_question(result_data, blueprint, topic)
+
+            return {
+                "success": True,
+                "blueprint": blueprint.model_dump(mode="json"),
+                "question": question.model_dump(mode="json"),
+            }
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def generate_questions(self, selections: list[dict]) -> dict:
+        """Generate one question per concept selection in a single LLM call.
+
+        All selections must share a subtopic. The instructions are rendered once
+        for the first selection and the remaining concepts are appended, so the
+        prompt prefix is paid once per batch. Each entry of "results" is either a
+        generate_question-style success dict or a failure the caller should
+        retry on its own.
+        """
+        if len(selections) <= 1:
+            return {"success": True, "results": [await self.generate_question(s) for s in selections]}
+
+        try:
+            concept_datas = [s.get("concept", {}) for s in selections]
+            topic = self._detect_topic(concept_datas[0])
+
+            first = selections[0]
+            prompt = self._build_generation_prompt(
+                concept_data=concept_datas[0],
+                target_difficulty=first.get("target_difficulty", 3),
+                target_bloom=first.get("target_bloom_level", "application"),
+                selected_misconceptions=first.get("selected_misconceptions", []),
+                selected_pattern=first.get("selected_pattern"),
+                topic=topic,
+            )
+            prompt = prompt.removesuffix("Output ONLY the JSON object.") + self._build_batch_section(selections)
+
+            items = await self.generate_json(
+                prompt,
+                temperature=0.7,
+                schema=GENERATED_BATCH_ADAPTER,
+                cache=config.cache_generation_responses,
+            )
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        results = []
+        for i, selection in enumerate(selections):
+            if i >= len(items):
+                results.append({"success": False, "error": "Missing from batch response"})
+                continue
+            try:
+                target_difficulty = selection.get("target_difficulty", 3)
+                blueprint = self._parse_blueprint(items[i], concept_datas[i], target_difficulty, topic)
+                question = self._parse_question(items[i], blueprint, topic)
+                results.append({
+                    "success": True,
+                    "blueprint": blueprint.model_dump(mode="json"),
+                    "question": question.model_dump(mode="json"),
+                })
+            except Exception as e:
+                results.append({"success": False, "error": str(e)})
+
+        return {"success": True, "results": results}
+
+    def _build_batch_section(self, selections: list[dict]) -> str:
+        """Describe the extra concepts in a batch and ask for a JSON array."""
+        count = len(selections)
+        lines = [f"""
+
+## BATCH REQUEST
+Create {count} SEPARATE questions. Question 1 tests the concept described above.
+Questions 2-{count} each test the concept listed below instead, with the same subtopic,
+difficulty, format and rules as above. Do not reuse scenarios between questions.
+"""]
+        for i, selection in enumerate(selections[1:], start=2):
+            concept = selection.get("concept", {})
+            lines.append(f"""
+### Question {i}
+- **Name**: {concept.get('name', 'Unknown')}
+- **Description**: {concept.get('description', 'No description')}
+- **Difficulty**: {selection.get('target_difficulty', 3)}/3
+""")
+            misconceptions = selection.get("selected_misconceptions", [])
+            if misconceptions:
+                lines.append("- **Distractor misconceptions**:\n" + "\n".join(f"  - {m}" for m in misconceptions) + "\n")
+
+        lines.append(f"""
+Output ONLY a JSON array of exactly {count} objects, one per question in the order above,
+each following the OUTPUT FORMAT.""")
+        return "".join(lines)
+
+    async def revise_question(
+        self,
+        question: dict,
+        blueprint: dict,
+        issues: list[str],
+        suggestions: list[str],
+    ) -> dict:
+        """Revise a question based on feedback."""
+        try:
+            prompt = self._build_revision_prompt(question, blueprint, issues, suggestions)
+
+            result_data = await self.generate_json(
+                prompt,
+                temperature=0.5,
+                schema=GENERATED_QUESTION_ADAPTER,
+                cache=config.cache_generation_responses,
+            )
+
+            if not result_data:
+                return {"success": False, "error": "Failed to revise question"}
+
+            # Parse revised blueprint and question
+            concept_data = {
+                "id": blueprint.get("concept_id"),
+                "name": blueprint.get("concept_name"),
+                "subtopic_id": blueprint.get("subtopic_id"),
+                "subtopic_name": blueprint.get("subtopic_name"),
+            }
+
+            revised_blueprint = self._parse_blueprint(
+                result_data,
+                concept_data,
+                blueprint.get("difficulty_target", 3),
+            )
+            revised_blueprint.revision_count = blueprint.get("revision_count", 0) + 1
+
+            revised_question = self._parse_question(result_data, revised_blueprint)
+
+            return {
+                "success": True,
+                "blueprint": revised_blueprint.model_dump(mode="json"),
+                "question": revised_question.model_dump(mode="json"),
+                "revision_count": revised_blueprint.revision_count,
+            }
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def _determine_question_type(self, subtopic_name: str, concept_data: dict) -> str:
+        """Determine the appropriate question type based on subtopic.
+
+        Note: Thinking Skills and Math are ALWAYS multiple-choice.
+        Cloze, drag-and-drop, and other types are for English/Reading only.
+        """
+        # Thinking Skills and Math are always multiple-choice
+        # Spatial Reasoning may have images but is still MCQ format
+        return QuestionTypeEnum.MULTIPLE_CHOICE.value
+
+    def _build_generation_prompt(
+        self,
+        concept_data: dict,
+        target_difficulty: int,
+        target_bloom: str,
+        selected_misconceptions: list[str],
+        selected_pattern: str = None,
+        topic: str = "thinking_skills",
+    ) -> str:
+        """Build the prompt for question generation using NSW exam formats."""
+        subtopic_name = concept_data.get('subtopic_name', 'Unknown')
+        subtopic_prompt = self._load_subtopic_prompt(subtopic_name, topic)
+
+        # Use topic-specific builder
+        if topic == "math":
+            return self._build_math_prompt(
+                concept_data=concept_data,
+                target_difficulty=target_difficulty,
+                target_bloom=target_bloom,
+                selected_misconceptions=selected_misconceptions,
+                selected_pattern=selected_pattern,
+                subtopic_prompt=subtopic_prompt,
+            )
+
+        misconceptions_text = "\n".join(f"- {m}" for m in selected_misconceptions) if selected_misconceptions else ""
+
+        requires_image = concept_data.get("typically_requires_image", False)
+        image_types = concept_data.get("image_types", [])
+
+        # Build image section based on subtopic requirements
+        image_section = SUBTOPIC_IMAGE_SECTIONS.get(subtopic_name)
+        if image_section is None:
+            image_section = _generic_image_section(requires_image, tuple(image_types))
+
+        # Build subtopic-specific format instructions
+        format_instructions = SUBTOPIC_FORMAT_INSTRUCTIONS.get(subtopic_name)
+        if format_instructions is None:
+            format_instructions = _generic_format_instructions(subtopic_name, requires_image)
+
         # Build the complete prompt
         prompt = f"""You are creating a NSW Selective Schools exam question (Year 6 level, Thinking Skills).
 
@@ -533,14 +726,14 @@ CRITICAL: The 'content' field should contain the problem setup/context. The 'que
 - **Subtopic**: {subtopic_name}
 
 ## Target Parameters
-- **Difficulty**: {target_difficulty}/3 - {difficulty_desc.get(target_difficulty, 'EXTREMELY HARD')}
+- **Difficulty**: {target_difficulty}/3 - {DIFFICULTY_DESC.get(target_difficulty, 'EXTREMELY HARD')}
 - **Cognitive Level**: {target_bloom}
 - **Question Type**: Multiple Choice (4 options)
 """
 
         # Add hard difficulty requirements for difficulty 3
         if target_difficulty >= 3:
-            prompt += hard_requirements
+            prompt += HARD_REQUIREMENTS
 
         # Add subtopic-specific instructions if available
         if subtopic_prompt:
@@ -559,30 +752,7 @@ Wrong answers must be VERY plausible - students should have to think hard to eli
         prompt += image_section
         prompt += format_instructions
 
-        prompt += """
-
-## CRITICAL RULES
-1. Choice id="1" MUST be the correct answer
-2. Question must have exactly ONE correct answer
-3. Language: clear, unambiguous, Year 6 appropriate vocabulary (but HARD reasoning)
-4. NEVER use literal \\n in content - use actual line breaks or <br> tags
-5. For Deduction: Use HTML box format with character statements
-6. For Inference: Use HTML box format with premise and character statement
-7. All explanations should use <strong>HTML</strong> for emphasis
-8. THIS MUST BE A GENUINELY DIFFICULT QUESTION - if a typical Year 6 student can solve it quickly, it's TOO EASY
-
-## AUSTRALIAN CONTEXT (MANDATORY)
-- Use AUSTRALIAN ENGLISH spelling: colour, favourite, organisation, travelled, centre, metre, litre, programme
-- All locations MUST be Australian: Sydney, Melbourne, Brisbane, Perth, Adelaide, Canberra, Hobart, Darwin
-- Use Australian suburbs: Parramatta, Bondi, St Kilda, Surry Hills, Manly, Fremantle, Paddington
-- Australian schools: use names like "Northwood Primary", "Riverside Public School", "St Mary's College"
-- Australian currency: dollars and cents ($, AUD)
-- Australian seasons: Summer (Dec-Feb), Autumn (Mar-May), Winter (Jun-Aug), Spring (Sep-Nov)
-- Australian animals/plants when relevant: kangaroo, koala, platypus, wombat, eucalyptus, banksia
-- Australian sports: cricket, AFL, rugby league, netball, swimming
-- NO American references: no "favorite", "color", "math" (use "maths"), no US cities, no Fahrenheit
-
-Output ONLY the JSON object."""
+        prompt += CRITICAL_RULES
 
         return prompt
 
@@ -732,14 +902,12 @@ Output ONLY the JSON object."""
         """Build prompt for question revision."""
         issues_text = "\n".join(f"- {i}" for i in issues) if issues else "None"
         suggestions_text = "\n".join(f"- {s}" for s in suggestions) if suggestions else "None"
+        original = self._revision_payload(question)
 
         return f"""You are revising a NSW Selective Schools exam question that failed quality checks.
 
 ## Original Question
-{question.get('question', 'No question')}
-
-## Original Choices
-{json.dumps(question.get('choices', []), indent=2)}
+{json_dumps(original)}
 
 ## Issues Found
 {issues_text}
@@ -779,6 +947,20 @@ Output the revised question in JSON format:
 
 Output ONLY the JSON object."""
 
+    @staticmethod
+    def _revision_payload(question: dict) -> dict:
+        """Strip a question down to the fields a revision actually needs."""
+        payload = {
+            "content": question.get("content"),
+            "question": question.get("question", "No question"),
+            "choices": [
+                {"id": c.get("id"), "text": c.get("text"), "is_correct": c.get("is_correct", False)}
+                for c in question.get("choices", [])
+            ],
+            "explanation": question.get("explanation"),
+        }
+        return {k: v for k, v in payload.items() if v}
+
     def _parse_blueprint(
         self,
         data: dict,
@@ -793,19 +975,21 @@ Output ONLY the JSON object."""
         num_distractors = 4 if topic == "math" else 3
         distractor_end = num_distractors + 1
 
-        # Parse distractors from choices
+        # Parse distractors from choices. As in _parse_question, data was already
+        # type-checked by GENERATED_QUESTION_ADAPTER, so the leaf models are built
+        # with model_construct; misconception is Optional on the wire, hence the `or`.
         distractors = []
         for c in data.get("choices", [])[1:distractor_end]:  # Skip first (correct) answer
-            distractors.append(DistractorSpec(
+            distractors.append(DistractorSpec.model_construct(
                 id=c.get("id", str(len(distractors) + 2)),
-                misconception=c.get("misconception", "Plausible but incorrect"),
+                misconception=c.get("misconception") or "Plausible but incorrect",
                 error_type="conceptual",
                 text_hint=c.get("text"),
             ))
 
         # Ensure we have the right number of distractors
         while len(distractors) < num_distractors:
-            distractors.append(DistractorSpec(
+            distractors.append(DistractorSpec.model_construct(
                 id=str(len(distractors) + 2),
                 misconception="Plausible but incorrect",
                 error_type="conceptual",
@@ -814,7 +998,7 @@ Output ONLY the JSON object."""
         # Parse solution steps
         solution_steps = []
         for s in data.get("solution_steps", []):
-            solution_steps.append(SolutionStep(
+            solution_steps.append(SolutionStep.model_construct(
                 step_number=s.get("step_number", len(solution_steps) + 1),
                 description=s.get("description", ""),
                 reasoning=s.get("reasoning", ""),
@@ -862,42 +1046,42 @@ Output ONLY the JSON object."""
         Note: Thinking Skills and Math are always multiple-choice.
         Math has 5 choices, Thinking Skills has 4 choices.
         """
-        choices = []
         # Math has 5 choices, Thinking Skills has 4
         num_choices = 5 if topic == "math" else 4
 
-        # Standard MCQ: is_correct bool, first choice is correct
-        for i, c in enumerate(data.get("choices", [])):
-            choices.append(Choice(
+        # Standard MCQ: is_correct bool, first choice is correct.
+        # The LLM output was already type-checked by GENERATED_QUESTION_ADAPTER,
+        # so the models are built with model_construct (no second validation pass);
+        # the pipeline's structural check validates the dumped question.
+        choices = [
+            Choice.model_construct(
                 id=c.get("id", str(i + 1)),
-                text=c.get("text", ""),
-                is_correct=(i == 0),  # First choice is correct
-            ))
+                text=sanitize_newlines(c.get("text", "")),
+                is_correct=i == 0,  # First choice is correct
+            )
+            for i, c in enumerate(data.get("choices", []))
+        ]
 
         # Ensure we have the right number of choices
-        while len(choices) < num_choices:
-            choices.append(Choice(
-                id=str(len(choices) + 1),
-                text=f"Option {len(choices) + 1}",
-                is_correct=False,
-            ))
-
-        # Get content field for NSW exam format (Deduction/Inference have premise + character content)
-        content = data.get("content")
+        choices.extend(
+            Choice.model_construct(id=str(i + 1), text=f"Option {i + 1}", is_correct=False)
+            for i in range(len(choices), num_choices)
+        )
 
-        return Question(
-            content=content,
-            question=data.get("question_text", ""),
+        return Question.model_construct(
+            # Deduction/Inference carry premise + character content here
+            content=sanitize_newlines(data.get("content")),
+            question=sanitize_newlines(data.get("question_text", "")),
             choices=choices,
             type=QuestionTypeEnum.MULTIPLE_CHOICE.value,
-            explanation=data.get("explanation", "No explanation provided."),
+            explanation=sanitize_newlines(data.get("explanation", "No explanation provided.")),
             difficulty=str(blueprint.difficulty_target),
             topic_id=blueprint.topic_id,
             subtopic_id=blueprint.subtopic_id,
             subtopic_name=blueprint.subtopic_name,
             requires_image=blueprint.requires_image,
             image_description=blueprint.image_spec,
-            tags=blueprint.tags,
+            tags=intern_tags(blueprint.tags),
         )
 
 
@@ -0,0 +1,88 @@
+"""Adaptive rate limiting for LLM provider calls."""
+
+import asyncio
+import time
+
+from config import config
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose refill rate adapts to provider back-pressure (AIMD).
+
+    Every call acquires tokens before hitting the provider. A rate-limit
+    response halves the refill rate; every `increase_after` consecutive
+    successes add `increase_step` back, up to `max_rate`.
+    """
+
+    def __init__(
+        self,
+        rate_per_sec: float,
+        burst: float,
+        min_rate: float = 0.1,
+        max_rate: float | None = None,
+        increase_step: float = 1.0,
+        increase_after: int = 10,
+    ):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or rate_per_sec
+        self.increase_step = increase_step
+        self.increase_after = increase_after
+
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._successes = 0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until `tokens` are available, then consume them."""
+        tokens = min(tokens, self.burst)
+        # Waiters queue on the lock, so tokens are handed out in FIFO order
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= tokens
+
+    def on_success(self) -> None:
+        """Additive increase after a run of successful calls."""
+        self._successes += 1
+        if self._successes >= self.increase_after:
+            self._successes = 0
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_rate_limited(self) -> None:
+        """Multiplicative decrease when the provider returns 429."""
+        self._successes = 0
+        self.rate = max(self.min_rate, self.rate * 0.5)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Check whether a provider exception is an HTTP 429 / quota error."""
+    code = getattr(error, "code", None) or getattr(error, "status_code", None)
+    return code == 429 or "RESOURCE_EXHAUSTED" in str(error)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt token estimate (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+# Shared by every agent in this process so parallel subtopics pace together
+gemini_limiter = AdaptiveTokenBucket(
+    rate_per_sec=config.gemini.requests_per_second,
+    burst=config.gemini.request_burst,
+)
+
+# Prompt-token budget; refills at tokens_per_minute / 60 with up to a minute banked
+gemini_token_limiter = AdaptiveTokenBucket(
+    rate_per_sec=config.gemini.tokens_per_minute / 60,
+    burst=config.gemini.tokens_per_minute,
+)
@@ -1,19 +1,154 @@
 """Verifier Agent for validating generated exam questions."""
 
 import asyncio
+import hashlib
 import json
-from typing import Any
-
-from a2a_local import AgentConfig
-from agents.base_agent import BaseAgent
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from a2a_local import AgentConfig, get_logger, json_dumps, message_payload
+from agents.base_agent import BaseAgent, read_prompt
+from agents.verifier_local import local_answer_result
 from models.verification import (
     VerificationStatus,
+    IssueCategory,
     VerificationIssue,
     QuestionVerification,
     BatchVerificationResult,
 )
 from config import config
 
+logger = get_logger(__name__)
+
+QUESTIONS_PLACEHOLDER = "{{QUESTIONS_JSON}}"
+QUESTION_PREVIEW_CHARS = 100  # question_text kept on each QuestionVerification
+# Checks are pass/fail judgements; greedy decoding keeps them short and repeatable
+CHECK_TEMPERATURE = 0.0
+VERIFICATION_PROMPTS = (
+    "verify_answer.md",
+    "verify_quality.md",
+    "verify_format.md",
+    "verify_explanation.md",
+)
+
+
+@lru_cache(maxsize=8)
+def _template_parts(filename: str) -> tuple[str, str]:
+    """Split a verification prompt around its questions placeholder, once per file."""
+    template = read_prompt("verification", filename)
+    prefix, _, suffix = template.partition(QUESTIONS_PLACEHOLDER)
+    return prefix, suffix
+
+
+def _render_prompt(filename: str, questions_json: str) -> str:
+    prefix, suffix = _template_parts(filename)
+    return prefix + questions_json + suffix
+
+
+_TRUE_STRINGS = frozenset({"true", "yes", "y", "t", "on", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "n", "f", "off", "0"})
+
+
+def _flag(value: Any, default: bool = True) -> bool:
+    """Read a pass/fail flag from LLM JSON the way pydantic's bool coercion would."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+    return default
+
+
+def _confidence(value: Any, default: float = 0.5) -> float:
+    """Read a 0-1 confidence from LLM JSON; non-numbers fall back to default."""
+    if isinstance(value, bool):
+        return default
+    try:
+        confidence = float(value)
+    except (TypeError, ValueError):
+        return default
+    if confidence != confidence:  # NaN
+        return default
+    # Clamp so dumped results still pass QuestionVerification's 0-1 bounds
+    return min(max(confidence, 0.0), 1.0)
+
+
+PLACEHOLDER_RE = re.compile(r"\[INSERT|\bTODO\b|\bTBD\b", re.IGNORECASE)
+HTML_TAG_RE = re.compile(r"<(/?)([a-zA-Z][a-zA-Z0-9]*)\b[^<>]*?(/?)>")
+VOID_TAGS = frozenset({"br", "hr", "img", "input", "meta", "link", "wbr"})
+
+
+def _html_balanced(text: str) -> bool:
+    """Check that non-void HTML tags open and close in order."""
+    stack = []
+    for closing, tag, self_closing in HTML_TAG_RE.findall(text):
+        tag = tag.lower()
+        if tag in VOID_TAGS or self_closing:
+            continue
+        if not closing:
+            stack.append(tag)
+        elif not stack or stack.pop() != tag:
+            return False
+    return not stack
+
+
+def _format_issues(question: dict) -> list[str]:
+    """Deterministic checks from verify_format.md that don't need an LLM."""
+    issues = []
+    choices = [c for c in question.get("choices") or [] if isinstance(c, dict)]
+
+    # Structure (maths questions have 5 options, the rest 4)
+    if len(choices) not in (4, 5):
+        issues.append(f"Structure: {len(choices)} choices provided, need 4 (5 for maths)")
+    correct = sum(1 for c in choices if c.get("is_correct"))
+    if correct != 1:
+        issues.append(f"Structure: {correct} choices marked correct, need exactly one")
+    if any(not c.get("id") or not str(c.get("text") or "").strip() for c in choices):
+        issues.append("Structure: every choice needs an id and text")
+    if not str(question.get("question") or "").strip():
+        issues.append("Structure: question text is empty")
+
+    # Content formatting
+    texts = [
+        t for t in (
+            question.get("content"),
+            question.get("question"),
+            question.get("explanation"),
+            *(c.get("text") for c in choices),
+        )
+        if isinstance(t, str)
+    ]
+    if any("\\n" in t for t in texts):
+        issues.append("Content: contains literal \\n sequences")
+    if any(not _html_balanced(t) for t in texts):
+        issues.append("Content: broken or unclosed HTML tags")
+    if any(PLACEHOLDER_RE.search(t) for t in texts):
+        issues.append("Content: contains placeholder text")
+    if not str(question.get("explanation") or "").strip():
+        issues.append("Content: explanation is missing")
+
+    # Metadata
+    if not question.get("subtopic_name"):
+        issues.append("Metadata: subtopic_name is missing")
+    if not isinstance(question.get("tags"), list):
+        issues.append("Metadata: tags array is missing")
+    if not question.get("difficulty"):
+        issues.append("Metadata: difficulty is not set")
+
+    return issues
+
+
+class _OwnerCancelled(Exception):
+    """The call verifying an in-flight question was cancelled before finishing."""
+
 
 class VerifierAgent(BaseAgent):
     """Agent for verifying exam question correctness and quality.
@@ -22,7 +157,17 @@ class VerifierAgent(BaseAgent):
     and needs to be regenerated with feedback.
     """
 
-    BATCH_SIZE = 5  # Questions per verification batch
+    BATCH_SIZE = 5  # Initial questions per verification batch
+    MIN_BATCH_SIZE = 2
+    MAX_BATCH_SIZE = 20
+    BATCH_LATENCY_TARGET = 30.0  # Seconds; slower batches stop the size growing
+    # Also send questions that pass the local format checks to the LLM format
+    # prompt (text quality: truncation, repetition). Off by default since the
+    # quality check already reviews wording.
+    LLM_FORMAT_CHECK = False
+    MAX_CONCURRENT_BATCHES = 4  # Batches verified at once (4 LLM calls each)
+    CACHE_SIZE = 4096  # Verdicts kept, keyed by question content
+    FAIL_CACHE_TTL = 300.0  # Seconds before a FAIL verdict is re-verified (bypassing llm_cache)
 
     def __init__(self):
         agent_config = AgentConfig(
@@ -45,18 +190,23 @@ class VerifierAgent(BaseAgent):
             ],
         )
         super().__init__(agent_config)
+        self._batch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BATCHES)
+        self._batch_size = self.BATCH_SIZE
+        # Load the check templates up front so batches never touch the disk
+        for filename in VERIFICATION_PROMPTS:
+            _template_parts(filename)
+        # content hash -> (verdict, expiry on the monotonic clock, or None)
+        self._cache: OrderedDict[str, tuple[QuestionVerification, Optional[float]]] = OrderedDict()
+        # content hash -> verdict being computed by another verify_questions call
+        self._inflight: dict[str, asyncio.Future[QuestionVerification]] = {}
 
     async def handle_task(self, task: Any, context: Any) -> dict:
         """Handle incoming verification tasks."""
-        message = task.status.message
-        if message and message.parts:
-            part = message.parts[0]
-            task_text = part.root.text if hasattr(part, 'root') else part.text
-            try:
-                task_data = json.loads(task_text)
-            except json.JSONDecodeError:
-                return {"error": "Invalid JSON in task message"}
-        else:
+        try:
+            task_data = message_payload(task.status.message)
+        except ValueError:
+            return {"error": "Invalid JSON in task message"}
+        if task_data is None:
             return {"error": "No task data provided"}
 
         action = task_data.get("action", "verify_questions")
@@ -75,42 +225,18 @@ class VerifierAgent(BaseAgent):
     async def verify_questions(self, questions: list[dict]) -> dict:
         """Verify a batch of questions. Returns pass/fail for each."""
         if not questions:
+            # Same shape as a dumped empty BatchVerificationResult; a fresh dict
+            # each time since callers may mutate the reply
             return {
                 "success": True,
-                "verification": BatchVerificationResult(
-                    total_questions=0,
-                    passed=0,
-                    failed=0,
-                    questions=[],
-                ).model_dump(),
+                "verification": {"total_questions": 0, "passed": 0, "failed": 0, "questions": []},
             }
 
-        all_verifications = []
-
-        # Process in batches
-        for i in range(0, len(questions), self.BATCH_SIZE):
-            batch = questions[i:i + self.BATCH_SIZE]
-            batch_results = await self._verify_batch(batch)
-            all_verifications.extend(batch_results)
-
-            # Rate limiting between batches
-            if i + self.BATCH_SIZE < len(questions):
-                await asyncio.sleep(1)
-
-        # Calculate summary statistics
-        passed = sum(1 for v in all_verifications if v.status == VerificationStatus.PASS)
-        failed = sum(1 for v in all_verifications if v.status == VerificationStatus.FAIL)
-
-        result = BatchVerificationResult(
-            total_questions=len(questions),
-            passed=passed,
-            failed=failed,
-            questions=all_verifications,
-        )
+        result = await self._verify_all(questions)
 
         return {
             "success": True,
-            "verification": result.model_dump(),
+            "verification": result.model_dump(mode="json"),
             "summary": {
                 "total": result.total_questions,
                 "passed": result.passed,
@@ -120,164 +246,418 @@ class VerifierAgent(BaseAgent):
             },
         }
 
-    async def _verify_batch(self, questions: list[dict]) -> list[QuestionVerification]:
-        """Run all verification checks on a batch of questions."""
-        questions_json = json.dumps(questions, indent=2, default=str)
+    async def _verify_all(self, questions: list[dict]) -> BatchVerificationResult:
+        """Verify questions (cache first, then concurrent batches) in input order.
+
+        A question already being verified by a concurrent call (or earlier in
+        this one) waits for that verdict instead of being sent again.
+        """
+        # Serve previously verified questions from the cache
+        keys = [self._question_key(q) for q in questions]
+        expired: set[str] = set()
+        all_verifications = [self._cache_get(key, q, expired) for key, q in zip(keys, questions)]
+
+        loop = asyncio.get_running_loop()
+        owned: list[int] = []
+        waiting: dict[int, asyncio.Future[QuestionVerification]] = {}
+        for i, verification in enumerate(all_verifications):
+            if verification is not None:
+                continue
+            future = self._inflight.get(keys[i])
+            if future is None:
+                future = loop.create_future()
+                self._inflight[keys[i]] = future
+                owned.append(i)
+            else:
+                waiting[i] = future
+
+        batch_size = self._batch_size
+        # Verify all batches concurrently; the semaphore bounds how many are in
+        # flight and the shared Gemini limiter paces the individual calls
+        batches = [
+            owned[i:i + batch_size]
+            for i in range(0, len(owned), batch_size)
+        ]
+        try:
+            batch_results = await asyncio.gather(*(
+                self._verify_batch_limited(
+                    [questions[i] for i in batch],
+                    # An identical batch would get the cached LLM response back,
+                    # so re-checks of expired FAIL verdicts go to the model
+                    refresh=any(keys[i] in expired for i in batch),
+                )
+                for batch in batches
+            ))
+        except Exception as e:
+            self._release_inflight(keys, owned, e)
+            raise
+        except asyncio.CancelledError:
+            # Waiters belong to other calls; they verify the questions themselves
+            # instead of being cancelled along with this one
+            self._release_inflight(keys, owned, _OwnerCancelled())
+            raise
+        fresh = [v for results in batch_results for v in results]
+
+        for i, (verification, checked) in zip(owned, fresh):
+            all_verifications[i] = verification
+            # A skipped check reads as passing, so such a verdict (e.g. during
+            # an LLM outage) is returned but never cached
+            if checked:
+                self._cache_put(keys[i], verification)
+            self._inflight.pop(keys[i]).set_result(verification)
+
+        for i, future in waiting.items():
+            try:
+                # Shielded so cancelling this call doesn't cancel the shared future
+                verification = await asyncio.shield(future)
+            except _OwnerCancelled:
+                verification = (await self._verify_all([questions[i]])).questions[0]
+            all_verifications[i] = verification.model_copy(
+                update={"question_id": str(questions[i].get("id", ""))}
+            )
 
-        # Run all 4 verifications in parallel
-        answer_task = self._verify_answers(questions_json)
-        quality_task = self._verify_quality(questions_json)
-        format_task = self._verify_format(questions_json)
-        explanation_task = self._verify_explanations(questions_json)
+        return BatchVerificationResult.from_questions(all_verifications)
+
+    def _release_inflight(self, keys: list[str], owned: list[int], error: Exception) -> None:
+        """Fail the in-flight futures this call owned, so their waiters stop waiting."""
+        for i in owned:
+            future = self._inflight.pop(keys[i])
+            if not future.done():
+                future.set_exception(error)
+                # Mark retrieved in case no other call was waiting on it
+                future.exception()
+
+    @staticmethod
+    def _question_key(question: dict) -> str:
+        """Hash a question's content, ignoring its id."""
+        payload = {k: v for k, v in question.items() if k != "id"}
+        canonical = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(
+        self,
+        key: str,
+        question: dict,
+        expired: set[str],
+    ) -> Optional[QuestionVerification]:
+        """Return the cached verdict for key; expired FAIL keys are added to expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        verification, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._cache[key]
+            expired.add(key)
+            return None
+        self._cache.move_to_end(key)
+        return verification.model_copy(update={"question_id": str(question.get("id", ""))})
+
+    def _cache_put(self, key: str, verification: QuestionVerification) -> None:
+        # FAIL verdicts expire so a regenerated variant can be re-checked later
+        expires_at = None if verification.passed else time.monotonic() + self.FAIL_CACHE_TTL
+        self._cache[key] = (verification, expires_at)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    async def _verify_batch_limited(
+        self,
+        questions: list[dict],
+        refresh: bool = False,
+    ) -> list[tuple[QuestionVerification, bool]]:
+        async with self._batch_semaphore:
+            return await self._verify_batch(questions, refresh)
 
-        results = await asyncio.gather(
-            answer_task, quality_task, format_task, explanation_task,
-            return_exceptions=True
+    async def _verify_batch(
+        self,
+        questions: list[dict],
+        refresh: bool = False,
+    ) -> list[tuple[QuestionVerification, bool]]:
+        """Run all verification checks on a batch of questions.
+
+        Returns (verdict, complete) per question, where complete is False if
+        any check was skipped for it. With refresh, the LLM checks skip
+        llm_cache and store fresh responses.
+        """
+        questions_json = json_dumps(questions)
+        start_time = time.monotonic()
+
+        # Run all 4 verifications in parallel. Each check handles its own LLM
+        # errors (returning None), so anything escaping is a bug that should
+        # cancel the sibling checks rather than be read as a verdict.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._verify_answers(questions, questions_json, refresh)),
+                tg.create_task(self._verify_quality(questions_json, refresh)),
+                tg.create_task(self._verify_format(questions, questions_json, refresh)),
+                tg.create_task(self._verify_explanations(questions_json, refresh)),
+            ]
+        results = [task.result() for task in tasks]
+
+        # A check that failed or dropped questions counts against the batch size
+        complete = all(r is not None and len(r) >= len(questions) for r in results)
+        self._adjust_batch_size(complete, time.monotonic() - start_time)
+
+        answer_results, quality_results, format_results, explanation_results = (
+            self._align_results(r, questions) for r in results
         )
 
-        answer_results = results[0] if not isinstance(results[0], Exception) else []
-        quality_results = results[1] if not isinstance(results[1], Exception) else []
-        format_results = results[2] if not isinstance(results[2], Exception) else []
-        explanation_results = results[3] if not isinstance(results[3], Exception) else []
-
         # Combine results for each question
         verifications = []
         for i, q in enumerate(questions):
             verification = self._combine_results(
                 question=q,
                 index=i,
-                answer_result=answer_results[i] if i < len(answer_results) else {},
-                quality_result=quality_results[i] if i < len(quality_results) else {},
-                format_result=format_results[i] if i < len(format_results) else {},
-                explanation_result=explanation_results[i] if i < len(explanation_results) else {},
+                answer_result=answer_results[i],
+                quality_result=quality_results[i],
+                format_result=format_results[i],
+                explanation_result=explanation_results[i],
+            )
+            checked = all(
+                r[i] is not None
+                for r in (answer_results, quality_results, format_results, explanation_results)
             )
-            verifications.append(verification)
+            verifications.append((verification, checked))
 
         return verifications
 
-    async def _verify_answers(self, questions_json: str) -> list[dict]:
-        """Independently solve and verify answers."""
-        prompt = self.load_prompt("verification", "verify_answer.md")
-        prompt = prompt.replace("{{QUESTIONS_JSON}}", questions_json)
-
+    def _adjust_batch_size(self, complete: bool, elapsed: float) -> None:
+        """AIMD: grow by one after a complete, fast batch; halve after an incomplete one."""
+        if not complete:
+            self._batch_size = max(self.MIN_BATCH_SIZE, self._batch_size // 2)
+        elif elapsed < self.BATCH_LATENCY_TARGET:
+            self._batch_size = min(self.MAX_BATCH_SIZE, self._batch_size + 1)
+
+    @staticmethod
+    def _align_results(results: Optional[list], questions: list[dict]) -> list[Optional[dict]]:
+        """Match check results to questions by question_index (or question_id).
+
+        The LLM can drop or reorder entries, so position is only used for
+        results that carry neither key. Questions without a result get None.
+        """
+        aligned: list[Optional[dict]] = [None] * len(questions)
+        if results is None:
+            return aligned
+        index_by_id = {str(q.get("id", "")): i for i, q in enumerate(questions)}
+        unkeyed = []
+        for result in results:
+            if not isinstance(result, dict):
+                continue
+            try:
+                index = int(result["question_index"])
+            except (KeyError, TypeError, ValueError):
+                index = index_by_id.get(str(result.get("question_id")))
+            if index is not None and 0 <= index < len(questions):
+                aligned[index] = result
+            else:
+                unkeyed.append(result)
+
+        if unkeyed:
+            slots = (i for i, r in enumerate(aligned) if not r)
+            for i, result in zip(slots, unkeyed):
+                aligned[i] = result
+        return aligned
+
+    async def _run_check(
+        self,
+        filename: str,
+        questions_json: str,
+        label: str,
+        refresh: bool = False,
+    ) -> Optional[list[dict]]:
+        """Run one check prompt, collecting per-question results as they stream in.
+
+        Results that completed before an error are kept; _align_results places
+        them by question_index. Returns None if the check produced nothing.
+        """
+        prompt = _render_prompt(filename, questions_json)
+        results = []
         try:
-            result = await self.generate_json(prompt, temperature=0.3)
-            return result if isinstance(result, list) else []
-        except Exception as e:
-            print(f"Answer verification error: {e}")
-            return []
+            async for item in self.generate_json_items(
+                prompt, temperature=CHECK_TEMPERATURE, cache=True, refresh=refresh
+            ):
+                results.append(item)
+        except Exception:
+            logger.exception("%s verification error", label)
+            return results or None
+        return results
+
+    async def _run_check_on(
+        self,
+        filename: str,
+        questions: list[dict],
+        indices: list[int],
+        questions_json: str,
+        label: str,
+        refresh: bool = False,
+    ) -> list[Optional[dict]]:
+        """Run a check on questions[indices] only, returning results aligned to indices.
+
+        questions_json is the whole batch; it is re-serialized only when some
+        questions are left out.
+        """
+        subset = [questions[i] for i in indices]
+        if len(indices) < len(questions):
+            questions_json = json_dumps(subset)
+        results = await self._run_check(filename, questions_json, label, refresh)
+        return self._align_results(results, subset)
+
+    async def _verify_answers(
+        self,
+        questions: list[dict],
+        questions_json: str,
+        refresh: bool = False,
+    ) -> Optional[list[dict]]:
+        """Independently solve and verify answers.
+
+        Plain arithmetic questions are solved exactly in-process; only the
+        rest go to the LLM.
+        """
+        results: list[Optional[dict]] = [local_answer_result(q) for q in questions]
+        unsolved = [i for i, r in enumerate(results) if r is None]
+        if unsolved:
+            llm_results = await self._run_check_on(
+                "verify_answer.md", questions, unsolved, questions_json, "Answer", refresh
+            )
+            for i, llm_result in zip(unsolved, llm_results):
+                results[i] = llm_result
 
-    async def _verify_quality(self, questions_json: str) -> list[dict]:
+        found = [{**r, "question_index": i} for i, r in enumerate(results) if r is not None]
+        return found or None
+
+    async def _verify_quality(self, questions_json: str, refresh: bool = False) -> Optional[list[dict]]:
         """Check question quality."""
-        prompt = self.load_prompt("verification", "verify_quality.md")
-        prompt = prompt.replace("{{QUESTIONS_JSON}}", questions_json)
+        return await self._run_check("verify_quality.md", questions_json, "Quality", refresh)
 
-        try:
-            result = await self.generate_json(prompt, temperature=0.5)
-            return result if isinstance(result, list) else []
-        except Exception as e:
-            print(f"Quality verification error: {e}")
-            return []
+    async def _verify_format(
+        self,
+        questions: list[dict],
+        questions_json: str,
+        refresh: bool = False,
+    ) -> Optional[list[dict]]:
+        """Validate formatting and structure.
+
+        Structural, content and metadata rules are checked locally; only
+        questions that pass them go to the LLM, and only if LLM_FORMAT_CHECK.
+        """
+        results = []
+        for i, q in enumerate(questions):
+            issues = _format_issues(q)
+            results.append({"question_index": i, "all_passed": not issues, "issues": issues})
 
-    async def _verify_format(self, questions_json: str) -> list[dict]:
-        """Validate formatting and structure."""
-        prompt = self.load_prompt("verification", "verify_format.md")
-        prompt = prompt.replace("{{QUESTIONS_JSON}}", questions_json)
+        clean = [i for i, r in enumerate(results) if r["all_passed"]]
+        if not self.LLM_FORMAT_CHECK or not clean:
+            return results
 
-        try:
-            result = await self.generate_json(prompt, temperature=0.2)
-            return result if isinstance(result, list) else []
-        except Exception as e:
-            print(f"Format verification error: {e}")
-            return []
+        llm_results = await self._run_check_on(
+            "verify_format.md", questions, clean, questions_json, "Format", refresh
+        )
+        for i, llm_result in zip(clean, llm_results):
+            if llm_result is not None:
+                results[i] = {**llm_result, "question_index": i}
+        return results
 
-    async def _verify_explanations(self, questions_json: str) -> list[dict]:
+    async def _verify_explanations(self, questions_json: str, refresh: bool = False) -> Optional[list[dict]]:
         """Verify explanation-answer alignment."""
-        prompt = self.load_prompt("verification", "verify_explanation.md")
-        prompt = prompt.replace("{{QUESTIONS_JSON}}", questions_json)
-
-        try:
-            result = await self.generate_json(prompt, temperature=0.4)
-            return result if isinstance(result, list) else []
-        except Exception as e:
-            print(f"Explanation verification error: {e}")
-            return []
+        return await self._run_check("verify_explanation.md", questions_json, "Explanation", refresh)
 
     def _combine_results(
         self,
         question: dict,
         index: int,
-        answer_result: dict,
-        quality_result: dict,
-        format_result: dict,
-        explanation_result: dict,
+        answer_result: Optional[dict],
+        quality_result: Optional[dict],
+        format_result: Optional[dict],
+        explanation_result: Optional[dict],
     ) -> QuestionVerification:
-        """Combine all verification results. ANY failure = FAIL status."""
+        """Combine all verification results. ANY failure = FAIL status.
+
+        A None result means that check was skipped for this question (the call
+        failed or the LLM left it out); it doesn't fail the question on its own,
+        but a skipped answer check reports zero confidence.
+        """
+        # Nothing here is validated by pydantic: LLM values are coerced with
+        # str/_flag/_confidence as they're read, then built with model_construct
         issues = []
 
         # Answer verification
-        answer_correct = answer_result.get("answer_matches", True)
-        answer_confidence = answer_result.get("confidence", 0.5)
+        answer_skipped = answer_result is None
+        answer_result = answer_result or {}
+        quality_result = quality_result or {}
+        format_result = format_result or {}
+        explanation_result = explanation_result or {}
+
+        answer_correct = _flag(answer_result.get("answer_matches"))
+        answer_confidence = 0.0 if answer_skipped else _confidence(answer_result.get("confidence"))
         verified_choice = answer_result.get("my_answer_choice_id")
+        if verified_choice is not None:
+            verified_choice = str(verified_choice)
 
         if not answer_correct:
             issue_msg = answer_result.get("issue") or f"Answer verification failed. Verifier determined correct answer is choice {verified_choice}"
-            issues.append(VerificationIssue(
-                category="answer",
-                message=issue_msg,
-                suggestion=answer_result.get("my_solution"),
+            suggestion = answer_result.get("my_solution")
+            issues.append(VerificationIssue.model_construct(
+                category=IssueCategory.ANSWER,
+                message=str(issue_msg),
+                suggestion=None if suggestion is None else str(suggestion),
             ))
 
         # Quality checks
-        quality_ok = quality_result.get("all_passed", True)
+        quality_ok = _flag(quality_result.get("all_passed"))
         for issue_text in quality_result.get("issues", []):
-            issues.append(VerificationIssue(
-                category="quality",
-                message=issue_text,
+            issues.append(VerificationIssue.model_construct(
+                category=IssueCategory.QUALITY,
+                message=str(issue_text),
             ))
 
         # Format checks
-        format_ok = format_result.get("all_passed", True)
+        format_ok = _flag(format_result.get("all_passed"))
         for issue_text in format_result.get("issues", []):
-            issues.append(VerificationIssue(
-                category="format",
-                message=issue_text,
+            issues.append(VerificationIssue.model_construct(
+                category=IssueCategory.FORMAT,
+                message=str(issue_text),
             ))
 
         # Explanation checks
-        explanation_ok = explanation_result.get("all_passed", True)
+        explanation_ok = _flag(explanation_result.get("all_passed"))
         for issue_text in explanation_result.get("issues", []):
-            issues.append(VerificationIssue(
-                category="explanation",
-                message=issue_text,
+            issues.append(VerificationIssue.model_construct(
+                category=IssueCategory.EXPLANATION,
+                message=str(issue_text),
             ))
 
         # PASS only if ALL checks pass
         all_passed = answer_correct and quality_ok and format_ok and explanation_ok
         status = VerificationStatus.PASS if all_passed else VerificationStatus.FAIL
 
-        return QuestionVerification(
-            question_id=str(question.get("id", "")),
-            question_text=question.get("question", "")[:100],
-            status=status,
-            answer_correct=answer_correct,
-            answer_confidence=answer_confidence,
-            verified_correct_choice=verified_choice,
-            quality_ok=quality_ok,
-            format_ok=format_ok,
-            explanation_ok=explanation_ok,
-            issues=issues,
-        )
+        return QuestionVerification.from_trusted({
+            "question_id": str(question.get("id", "")),
+            "question_text": self._question_preview(question),
+            "status": status,
+            "answer_correct": answer_correct,
+            "answer_confidence": answer_confidence,
+            "verified_correct_choice": verified_choice,
+            "quality_ok": quality_ok,
+            "format_ok": format_ok,
+            "explanation_ok": explanation_ok,
+            "issues": issues,
+        })
+
+    @staticmethod
+    def _question_preview(question: dict) -> str:
+        """Leading characters of the question text, for identifying it in results."""
+        text = question.get("question")
+        # str slicing copies at most the first QUESTION_PREVIEW_CHARS code points
+        return text[:QUESTION_PREVIEW_CHARS] if isinstance(text, str) else ""
 
     async def verify_single(self, question: dict) -> dict:
         """Verify a single question with detailed analysis."""
-        result = await self.verify_questions([question])
-        if result.get("success") and result.get("verification", {}).get("questions"):
-            return {
-                "success": True,
-                "verification": result["verification"]["questions"][0],
-            }
-        return result
+        result = await self._verify_all([question])
+        # Dump only the one verification rather than the whole batch result
+        return {
+            "success": True,
+            "verification": result.questions[0].model_dump(mode="json"),
+        }
 
 
 async def main():
@@ -0,0 +1,104 @@
+"""Local answer checks for questions the verifier can solve without an LLM.
+
+Only pure arithmetic questions ("What is 3 × (4 + 5)?") are handled: the
+expression is evaluated exactly and matched against numeric choices. Anything
+else returns None and goes to the LLM answer check.
+"""
+
+import ast
+import operator
+import re
+from fractions import Fraction
+from typing import Optional
+
+ARITHMETIC_QUESTION_RE = re.compile(
+    r"^\s*(?:what\s+is|calculate|evaluate|work\s+out|find)\s*(?:the\s+value\s+of\s*)?:?\s*"
+    r"(?P<expr>[\d\s.,+\-×x*÷/()]+?)\s*(?:=\s*)?\?*\s*$",
+    re.IGNORECASE,
+)
+NUMBER_RE = re.compile(r"^\s*\$?\s*(-?[\d,]*\.?\d+)\s*$")
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+def _evaluate(node: ast.AST) -> Fraction:
+    """Evaluate an arithmetic AST exactly; raises ValueError on anything else."""
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body)
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return Fraction(str(node.value))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _evaluate(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    raise ValueError("Unsupported expression")
+
+
+def _parse_number(text: str) -> Optional[Fraction]:
+    match = NUMBER_RE.match(text)
+    if not match:
+        return None
+    return Fraction(match.group(1).replace(",", ""))
+
+
+def try_solve_locally(question: dict) -> Optional[str]:
+    """Return the id of the choice a pure arithmetic question evaluates to.
+
+    Returns None unless the question is plain arithmetic with numeric choices
+    and exactly one choice equals the exact result.
+    """
+    if question.get("content"):
+        # A setup/context means it's a word problem, not bare arithmetic
+        return None
+    match = ARITHMETIC_QUESTION_RE.match(str(question.get("question") or ""))
+    if not match:
+        return None
+
+    expr = match.group("expr").replace("×", "*").replace("÷", "/")
+    # "x" is only a times sign between two operands; "3x - 2" is algebra and
+    # is left as is so the parse below rejects it
+    expr = re.sub(r"(?<=[\d)])\s*x\s*(?=[\d(])", "*", expr, flags=re.IGNORECASE)
+    # Thousands separators only; a comma anywhere else makes the parse ambiguous
+    expr = re.sub(r"(?<=\d),(?=\d{3}\b)", "", expr)
+    try:
+        value = _evaluate(ast.parse(expr, mode="eval"))
+    except (SyntaxError, ValueError, ZeroDivisionError):
+        return None
+
+    matches = []
+    for choice in question.get("choices") or []:
+        number = _parse_number(str(choice.get("text") or ""))
+        if number is None:
+            return None
+        if number == value:
+            matches.append(choice.get("id"))
+    return str(matches[0]) if len(matches) == 1 else None
+
+
+def local_answer_result(question: dict) -> Optional[dict]:
+    """Build a verify_answer.md-shaped result for a locally solvable question."""
+    solved_id = try_solve_locally(question)
+    if solved_id is None:
+        return None
+
+    marked_id = next(
+        (str(c.get("id")) for c in question.get("choices") or [] if c.get("is_correct")),
+        None,
+    )
+    matches = solved_id == marked_id
+    return {
+        "my_solution": "Evaluated the arithmetic expression exactly",
+        "my_answer_choice_id": solved_id,
+        "marked_correct_choice_id": marked_id,
+        "answer_matches": matches,
+        "confidence": 1.0,
+        "issue": None if matches else (
+            f"The marked answer is wrong. The expression evaluates to choice {solved_id}."
+        ),
+    }
@@ -1,7 +1,9 @@
 """Configuration management for A2A agents."""
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
+from uuid import UUID
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
@@ -27,6 +29,10 @@ class GeminiConfig(BaseModel):
     pro_model: str = "gemini-2.5-pro-preview-06-05"
     # Use Imagen 3 for image generation
     image_model: str = "imagen-3.0-generate-002"
+    # Starting request rate per agent process; adapts down on 429s
+    requests_per_second: float = float(os.getenv("GEMINI_RPS", "5"))
+    request_burst: float = float(os.getenv("GEMINI_BURST", "10"))
+    tokens_per_minute: float = float(os.getenv("GEMINI_TPM", "1000000"))
 
 
 class AgentPorts(BaseModel):
@@ -158,9 +164,48 @@ class Config(BaseModel):
 
     # Pipeline configuration
     max_pipeline_retries: int = 3
+    max_concurrent_questions: int = int(os.getenv("MAX_CONCURRENT_QUESTIONS", "10"))
+
+    # LLM response cache. Checker/verifier calls always use it; generation only
+    # when enabled, since a cache hit there returns a duplicate question.
+    llm_cache_size: int = int(os.getenv("LLM_CACHE_SIZE", "512"))
+    cache_generation_responses: bool = os.getenv("CACHE_GENERATION_RESPONSES", "false").lower() == "true"
+    # Accepted-question verdicts the pipeline remembers to skip re-verification
+    accepted_verdict_cache_size: int = int(os.getenv("ACCEPTED_VERDICT_CACHE_SIZE", "512"))
     min_quality_threshold: float = 0.7
     min_solver_confidence: float = 0.9
     min_adversarial_robustness: float = 0.7
 
 
 config = Config()
+
+
+@dataclass(frozen=True, slots=True)
+class SubtopicSpec:
+    """A database subtopic, resolved once from the config tables at import."""
+    key: str
+    id: UUID
+    name: str
+    display_name: str
+
+
+def _build_subtopic_specs(subtopics: dict, prefix: str = "") -> dict[str, SubtopicSpec]:
+    return {
+        prefix + key: SubtopicSpec(
+            key=prefix + key,
+            id=UUID(entry["id"]),
+            name=entry["name"],
+            display_name=entry["display_name"],
+        )
+        for key, entry in subtopics.items()
+    }
+
+
+# Keyed like the orchestrator's subtopic jobs ("deduction", "math:geometry")
+SUBTOPIC_SPECS: dict[str, SubtopicSpec] = {
+    **_build_subtopic_specs(config.thinking_skills_subtopics),
+    **_build_subtopic_specs(config.math_subtopics, prefix="math:"),
+}
+SUBTOPIC_SPECS_BY_NAME: dict[str, SubtopicSpec] = {
+    spec.name: spec for spec in SUBTOPIC_SPECS.values()
+}
@@ -96,6 +96,26 @@ async def run_all():
     await asyncio.gather(*tasks)
 
 
+def event_loop_factory():
+    """Use uvloop's faster event loop when it is installed (not available on Windows)."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+async def serve(agents) -> None:
+    """Run agents, then close the Gemini connection pool they share."""
+    try:
+        await agents
+    finally:
+        from agents.base_agent import close_gemini_client
+        await close_gemini_client()
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
@@ -118,10 +138,11 @@ def main():
 
     agent_name = sys.argv[1].lower()
 
+    loop_factory = event_loop_factory()
     if agent_name == "all":
-        asyncio.run(run_all())
+        asyncio.run(serve(run_all()), loop_factory=loop_factory)
     else:
-        asyncio.run(run_agent(agent_name))
+        asyncio.run(serve(run_agent(agent_name)), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 """Models package."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .question import (
     Question,
     Choice,
@@ -12,43 +15,76 @@ from .question import (
 )
 from .verification import (
     VerificationStatus,
+    IssueCategory,
     VerificationIssue,
     QuestionVerification,
     BatchVerificationResult,
 )
-from .curriculum import (
-    BloomLevel,
-    AtomicConcept,
-    PrerequisiteEdge,
-    ConceptGraph,
-    ConceptSelection,
-)
-from .blueprint import (
-    QuestionType,
-    TargetSkill,
-    DistractorSpec,
-    SolutionStep,
-    QuestionBlueprint,
-    BlueprintRevision,
-)
-from .adversarial import (
-    AttackType,
-    Severity,
-    AdversarialAttack,
-    AdversarialReport,
-    ShortcutAnalysis,
-    AmbiguityAnalysis,
-)
-from .judgment import (
-    JudgmentStatus,
-    DifficultyAssessment,
-    ClarityAssessment,
-    AlignmentAssessment,
-    NoveltyAssessment,
-    JudgmentScores,
-    JudgmentResult,
-    PipelineResult,
-)
+
+if TYPE_CHECKING:
+    from .curriculum import (
+        BloomLevel,
+        AtomicConcept,
+        PrerequisiteEdge,
+        ConceptGraph,
+        ConceptSelection,
+    )
+    from .blueprint import (
+        QuestionType,
+        TargetSkill,
+        DistractorSpec,
+        SolutionStep,
+        QuestionBlueprint,
+        BlueprintRevision,
+    )
+    from .adversarial import (
+        AttackType,
+        Severity,
+        AdversarialAttack,
+        AdversarialReport,
+        ShortcutAnalysis,
+        AmbiguityAnalysis,
+    )
+    from .judgment import (
+        JudgmentStatus,
+        DifficultyAssessment,
+        ClarityAssessment,
+        AlignmentAssessment,
+        NoveltyAssessment,
+        JudgmentScores,
+        JudgmentResult,
+        PipelineResult,
+    )
+
+# Pipeline-stage models are imported on first access (PEP 562), so agents
+# that only need questions/verification don't load the rest at startup
+_LAZY_MODELS = {
+    "BloomLevel": ".curriculum",
+    "AtomicConcept": ".curriculum",
+    "PrerequisiteEdge": ".curriculum",
+    "ConceptGraph": ".curriculum",
+    "ConceptSelection": ".curriculum",
+    "QuestionType": ".blueprint",
+    "TargetSkill": ".blueprint",
+    "DistractorSpec": ".blueprint",
+    "SolutionStep": ".blueprint",
+    "QuestionBlueprint": ".blueprint",
+    "BlueprintRevision": ".blueprint",
+    "AttackType": ".adversarial",
+    "Severity": ".adversarial",
+    "AdversarialAttack": ".adversarial",
+    "AdversarialReport": ".adversarial",
+    "ShortcutAnalysis": ".adversarial",
+    "AmbiguityAnalysis": ".adversarial",
+    "JudgmentStatus": ".judgment",
+    "DifficultyAssessment": ".judgment",
+    "ClarityAssessment": ".judgment",
+    "AlignmentAssessment": ".judgment",
+    "NoveltyAssessment": ".judgment",
+    "JudgmentScores": ".judgment",
+    "JudgmentResult": ".judgment",
+    "PipelineResult": ".judgment",
+}
 
 __all__ = [
     # Question models
@@ -62,6 +98,7 @@ __all__ = [
     "MarkingCriterion",
     # Verification models
     "VerificationStatus",
+    "IssueCategory",
     "VerificationIssue",
     "QuestionVerification",
     "BatchVerificationResult",
@@ -95,3 +132,16 @@ __all__ = [
     "JudgmentResult",
     "PipelineResult",
 ]
+
+
+def __getattr__(name: str):
+    module = _LAZY_MODELS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,13 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+
+# Robustness lost per attack when a report doesn't state overall_robustness
+ROBUSTNESS_PENALTY_CRITICAL = 0.5
+ROBUSTNESS_PENALTY_MAJOR = 0.2
+ROBUSTNESS_PENALTY_MINOR = 0.05
 
 
 class AttackType(str, Enum):
@@ -29,6 +35,8 @@ class Severity(str, Enum):
 
 class AdversarialAttack(BaseModel):
     """A specific attack or exploit found in a question."""
+    model_config = ConfigDict(defer_build=True)
+
     attack_type: AttackType
     severity: Severity
     description: str  # What the attack/exploit is
@@ -39,37 +47,77 @@ class AdversarialAttack(BaseModel):
 
 class AdversarialReport(BaseModel):
     """Complete adversarial analysis report for a question."""
+    model_config = ConfigDict(defer_build=True)
+
     question_id: UUID
     question_preview: str  # First 100 chars of question
 
     # Attacks found
-    attacks: list[AdversarialAttack] = []
+    attacks: list[AdversarialAttack] = Field(default_factory=list)
 
     # Overall assessment
-    overall_robustness: float  # 0-1, 1 = no exploits found
+    overall_robustness: Optional[float] = None  # 0-1, 1 = no exploits found; derived from attacks if omitted
     needs_revision: bool = False
 
     # Feedback for revision
-    critical_issues: list[str] = []  # Must fix
-    major_issues: list[str] = []  # Should fix
-    minor_issues: list[str] = []  # Nice to fix
+    critical_issues: list[str] = Field(default_factory=list)  # Must fix
+    major_issues: list[str] = Field(default_factory=list)  # Should fix
+    minor_issues: list[str] = Field(default_factory=list)  # Nice to fix
 
     # Revision suggestions for the Planner
-    revision_suggestions: list[str] = []
+    revision_suggestions: list[str] = Field(default_factory=list)
+
+    # Tallied from attacks on validation
+    _critical_count: int = PrivateAttr(default=0)
+    _major_count: int = PrivateAttr(default=0)
+
+    @model_validator(mode="after")
+    def _tally_severities(self) -> "AdversarialReport":
+        """Count severities once; re-validate the report if attacks change afterwards."""
+        critical = major = minor = 0
+        for attack in self.attacks:
+            if attack.severity is Severity.CRITICAL:
+                critical += 1
+            elif attack.severity is Severity.MAJOR:
+                major += 1
+            elif attack.severity is Severity.MINOR:
+                minor += 1
+        self._critical_count = critical
+        self._major_count = major
+        if self.overall_robustness is None:
+            self.overall_robustness = max(
+                0.0,
+                1.0 - (
+                    critical * ROBUSTNESS_PENALTY_CRITICAL
+                    + major * ROBUSTNESS_PENALTY_MAJOR
+                    + minor * ROBUSTNESS_PENALTY_MINOR
+                ),
+            )
+        return self
+
+    @property
+    def critical_count(self) -> int:
+        return self._critical_count
+
+    @property
+    def major_count(self) -> int:
+        return self._major_count
 
     @property
     def has_critical_issues(self) -> bool:
         """Check if any critical issues were found."""
-        return any(a.severity == Severity.CRITICAL for a in self.attacks)
+        return self.critical_count > 0
 
     @property
     def pass_threshold(self) -> bool:
         """Check if question passes adversarial testing."""
-        return not self.has_critical_issues and self.overall_robustness >= 0.7
+        return not self.has_critical_issues and (self.overall_robustness or 0.0) >= 0.7
 
 
 class ShortcutAnalysis(BaseModel):
     """Analysis of potential shortcuts in a question."""
+    model_config = ConfigDict(defer_build=True)
+
     shortcut_found: bool
     shortcut_description: Optional[str] = None
     shortcut_success_rate: float = 0.0  # Estimated success rate using shortcut
@@ -78,7 +126,9 @@ class ShortcutAnalysis(BaseModel):
 
 class AmbiguityAnalysis(BaseModel):
     """Analysis of potential ambiguities in a question."""
+    model_config = ConfigDict(defer_build=True)
+
     is_ambiguous: bool
     ambiguity_type: Optional[str] = None  # "wording", "interpretation", "scope"
-    alternative_interpretations: list[str] = []
+    alternative_interpretations: list[str] = Field(default_factory=list)
     clarification_needed: Optional[str] = None
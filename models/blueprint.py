@@ -4,17 +4,14 @@ from enum import Enum
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from .question import QuestionTypeEnum
 
-class QuestionType(str, Enum):
-    """Type of question to generate - matches database schema."""
-    MCQ = "multiple-choice"
-    MCQ_IMAGES = "multiple-choice-with-images"
-    DRAG_AND_DROP = "drag-and-drop"
-    MULTI_SUBQUESTION = "multi-subquestion"
-    CLOZE = "cloze"
-    WRITING = "writing"
+
+# Blueprints share the question schema's type enum; MCQ/MCQ_IMAGES are aliases
+# of MULTIPLE_CHOICE/MULTIPLE_CHOICE_WITH_IMAGES
+QuestionType = QuestionTypeEnum
 
 
 class TargetSkill(str, Enum):
@@ -27,6 +24,8 @@ class TargetSkill(str, Enum):
 
 class DistractorSpec(BaseModel):
     """Specification for a distractor (wrong answer) in an MCQ."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     id: str  # "1", "2", "3", or "4"
     misconception: str  # What error or misconception leads to this answer
     error_type: str  # "calculation", "conceptual", "procedural", "misread"
@@ -36,6 +35,8 @@ class DistractorSpec(BaseModel):
 
 class SolutionStep(BaseModel):
     """A step in the solution path."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     step_number: int
     description: str  # What this step does
     operation: Optional[str] = None  # Mathematical/logical operation
@@ -50,6 +51,8 @@ class QuestionBlueprint(BaseModel):
     This captures the logical structure, intended distractors, and solution
     path before the Surface Realiser converts it to actual question text.
     """
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(default_factory=uuid4)
 
     # Source concept
@@ -65,19 +68,19 @@ class QuestionBlueprint(BaseModel):
     difficulty_target: int = 3  # 1-3 (1=easy, 2=medium, 3=hard)
 
     # Content structure
-    setup_elements: list[str] = []  # Facts, context, scenario elements
+    setup_elements: list[str] = Field(default_factory=list)  # Facts, context, scenario elements
     question_stem_structure: str  # Template/structure for the question
-    constraints: list[str] = []  # Logical constraints that must hold
+    constraints: list[str] = Field(default_factory=list)  # Logical constraints that must hold
 
     # Answer specification
     correct_answer_value: Any  # The actual correct answer
     correct_answer_reasoning: str  # Why this is correct
 
     # Distractors (for MCQ)
-    distractors: list[DistractorSpec] = []
+    distractors: list[DistractorSpec] = Field(default_factory=list)
 
     # Solution path
-    solution_steps: list[SolutionStep] = []
+    solution_steps: list[SolutionStep] = Field(default_factory=list)
     estimated_solve_time_seconds: int = 60
 
     # Image requirements
@@ -86,13 +89,34 @@ class QuestionBlueprint(BaseModel):
     image_type: Optional[str] = None  # "diagram", "chart", "portrait", etc.
 
     # Metadata
-    tags: list[str] = []
+    tags: list[str] = Field(default_factory=list)
     revision_count: int = 0
-    revision_feedback: list[str] = []  # Feedback from failed attempts
+    revision_feedback: list[str] = Field(default_factory=list)  # Feedback from failed attempts
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "QuestionBlueprint":
+        """Build from already-validated data without re-validating.
+
+        Use model_validate for anything that hasn't been validated yet, such as LLM output.
+        """
+        data = dict(data)
+        if data.get("distractors"):
+            data["distractors"] = [
+                d if isinstance(d, DistractorSpec) else DistractorSpec.model_construct(**d)
+                for d in data["distractors"]
+            ]
+        if data.get("solution_steps"):
+            data["solution_steps"] = [
+                s if isinstance(s, SolutionStep) else SolutionStep.model_construct(**s)
+                for s in data["solution_steps"]
+            ]
+        return cls.model_construct(**data)
 
 
 class BlueprintRevision(BaseModel):
     """Request to revise a blueprint based on feedback."""
+    model_config = ConfigDict(defer_build=True)
+
     original_blueprint: QuestionBlueprint
     issues: list[str]  # What went wrong
     suggestions: list[str]  # How to fix it
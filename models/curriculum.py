@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 
 class BloomLevel(str, Enum):
@@ -19,6 +19,8 @@ class BloomLevel(str, Enum):
 
 class AtomicConcept(BaseModel):
     """An atomic, testable concept within a subtopic."""
+    model_config = ConfigDict(defer_build=True)
+
     id: str = Field(default_factory=lambda: str(uuid4()))
     name: str
     description: str
@@ -32,58 +34,75 @@ class AtomicConcept(BaseModel):
     difficulty_max: int = 3
 
     # Cognitive skills this concept tests
-    bloom_levels: list[BloomLevel] = [BloomLevel.APPLICATION]
+    bloom_levels: list[BloomLevel] = Field(default_factory=lambda: [BloomLevel.APPLICATION])
 
     # Common student misconceptions for this concept
-    common_misconceptions: list[str] = []
+    common_misconceptions: list[str] = Field(default_factory=list)
 
     # Question patterns that work well for this concept
-    question_patterns: list[str] = []
+    question_patterns: list[str] = Field(default_factory=list)
 
     # Example question stems
-    example_stems: list[str] = []
+    example_stems: list[str] = Field(default_factory=list)
 
     # Whether this concept typically requires an image
     typically_requires_image: bool = False
 
     # Image types that work for this concept (if applicable)
-    image_types: list[str] = []
+    image_types: list[str] = Field(default_factory=list)
 
 
 class PrerequisiteEdge(BaseModel):
     """Represents a prerequisite relationship between concepts."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     prerequisite_id: str  # Concept that must be understood first
     dependent_id: str  # Concept that depends on the prerequisite
 
 
 class ConceptGraph(BaseModel):
     """A graph of concepts with prerequisite relationships."""
+    model_config = ConfigDict(defer_build=True)
+
     subtopic_id: UUID
     subtopic_name: str
     topic_id: UUID
     topic_name: str
     concepts: list[AtomicConcept]
-    prerequisites: list[PrerequisiteEdge] = []
+    prerequisites: list[PrerequisiteEdge] = Field(default_factory=list)
+
+    # Lookup indexes over concepts, built on validation
+    _by_id: dict[str, AtomicConcept] = PrivateAttr(default_factory=dict)
+    _by_difficulty: dict[int, list[AtomicConcept]] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _build_indexes(self) -> "ConceptGraph":
+        by_id: dict[str, AtomicConcept] = {}
+        by_difficulty: dict[int, list[AtomicConcept]] = {}
+        for concept in self.concepts:
+            # First concept with an ID wins, as with the old linear scan
+            by_id.setdefault(concept.id, concept)
+            for difficulty in range(concept.difficulty_min, concept.difficulty_max + 1):
+                by_difficulty.setdefault(difficulty, []).append(concept)
+        self._by_id = by_id
+        self._by_difficulty = by_difficulty
+        return self
 
     def get_concept(self, concept_id: str) -> Optional[AtomicConcept]:
         """Get a concept by ID."""
-        for concept in self.concepts:
-            if concept.id == concept_id:
-                return concept
-        return None
+        return self._by_id.get(concept_id)
 
     def get_concepts_for_difficulty(self, difficulty: int) -> list[AtomicConcept]:
         """Get concepts that can be tested at a given difficulty level."""
-        return [
-            c for c in self.concepts
-            if c.difficulty_min <= difficulty <= c.difficulty_max
-        ]
+        return list(self._by_difficulty.get(difficulty, ()))
 
 
 class ConceptSelection(BaseModel):
     """Result of selecting a concept for question generation."""
+    model_config = ConfigDict(defer_build=True)
+
     concept: AtomicConcept
     target_difficulty: int  # 1, 2, or 3
     target_bloom_level: BloomLevel
-    selected_misconceptions: list[str] = []  # For distractor generation
+    selected_misconceptions: list[str] = Field(default_factory=list)  # For distractor generation
     selected_pattern: Optional[str] = None  # Question pattern to use
@@ -4,7 +4,15 @@ from enum import Enum
 from typing import Any, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
+
+
+# Weights for JudgmentScores.overall_score (sum to 1.0)
+WEIGHT_DIFFICULTY = 0.15
+WEIGHT_CLARITY = 0.25
+WEIGHT_ALIGNMENT = 0.20
+WEIGHT_SOLVER = 0.20
+WEIGHT_ADVERSARIAL = 0.20
 
 
 class JudgmentStatus(str, Enum):
@@ -16,6 +24,8 @@ class JudgmentStatus(str, Enum):
 
 class DifficultyAssessment(BaseModel):
     """Assessment of question difficulty."""
+    model_config = ConfigDict(defer_build=True)
+
     assessed_difficulty: int  # 1-3
     target_difficulty: int  # What was requested
     matches_target: bool
@@ -27,32 +37,40 @@ class DifficultyAssessment(BaseModel):
 
 class ClarityAssessment(BaseModel):
     """Assessment of question clarity."""
+    model_config = ConfigDict(defer_build=True)
+
     clarity_score: float  # 0-1
     is_unambiguous: bool
     grammar_correct: bool
     age_appropriate: bool  # For Year 6 students
-    issues: list[str] = []
+    issues: list[str] = Field(default_factory=list)
 
 
 class AlignmentAssessment(BaseModel):
     """Assessment of curriculum alignment."""
+    model_config = ConfigDict(defer_build=True)
+
     alignment_score: float  # 0-1
     matches_concept: bool
     matches_subtopic: bool
     tests_intended_skill: bool
-    issues: list[str] = []
+    issues: list[str] = Field(default_factory=list)
 
 
 class NoveltyAssessment(BaseModel):
     """Assessment of question novelty (for deduplication)."""
+    model_config = ConfigDict(defer_build=True)
+
     novelty_score: float  # 0-1, 1 = completely novel
-    similar_question_ids: list[UUID] = []
+    similar_question_ids: tuple[UUID, ...] = ()
     max_similarity: float = 0.0
     is_duplicate: bool = False
 
 
 class JudgmentScores(BaseModel):
     """All quality scores for a question."""
+    model_config = ConfigDict(defer_build=True)
+
     # Core scores
     difficulty_assessment: DifficultyAssessment
     clarity_assessment: ClarityAssessment
@@ -70,18 +88,24 @@ class JudgmentScores(BaseModel):
     # Optional novelty (when embeddings enabled)
     novelty_assessment: Optional[NoveltyAssessment] = None
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "JudgmentScores":
+        """Build from already-validated data without re-validating."""
+        data = dict(data)
+        for name, model in (
+            ("difficulty_assessment", DifficultyAssessment),
+            ("clarity_assessment", ClarityAssessment),
+            ("alignment_assessment", AlignmentAssessment),
+            ("novelty_assessment", NoveltyAssessment),
+        ):
+            if isinstance(data.get(name), dict):
+                data[name] = model.model_construct(**data[name])
+        return cls.model_construct(**data)
+
     @computed_field
     @property
     def overall_score(self) -> float:
         """Calculate weighted overall score."""
-        weights = {
-            "difficulty": 0.15,
-            "clarity": 0.25,
-            "alignment": 0.20,
-            "solver": 0.20,
-            "adversarial": 0.20,
-        }
-
         difficulty_score = 1.0 if self.difficulty_assessment.matches_target else 0.5
         clarity_score = self.clarity_assessment.clarity_score
         alignment_score = self.alignment_assessment.alignment_score
@@ -89,16 +113,18 @@ class JudgmentScores(BaseModel):
         adversarial_score = self.adversarial_robustness
 
         return (
-            weights["difficulty"] * difficulty_score +
-            weights["clarity"] * clarity_score +
-            weights["alignment"] * alignment_score +
-            weights["solver"] * solver_score +
-            weights["adversarial"] * adversarial_score
+            WEIGHT_DIFFICULTY * difficulty_score +
+            WEIGHT_CLARITY * clarity_score +
+            WEIGHT_ALIGNMENT * alignment_score +
+            WEIGHT_SOLVER * solver_score +
+            WEIGHT_ADVERSARIAL * adversarial_score
         )
 
 
 class JudgmentResult(BaseModel):
     """Final judgment result for a question."""
+    model_config = ConfigDict(defer_build=True)
+
     question_id: UUID
     question_preview: str  # First 100 chars
 
@@ -113,8 +139,19 @@ class JudgmentResult(BaseModel):
 
     # Final decision
     status: JudgmentStatus
-    rejection_reasons: list[str] = []
-    revision_suggestions: list[str] = []
+    rejection_reasons: list[str] = Field(default_factory=list)
+    revision_suggestions: list[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "JudgmentResult":
+        """Build from already-validated data without re-validating.
+
+        Use model_validate for anything that hasn't been validated yet, such as LLM output.
+        """
+        data = dict(data)
+        if isinstance(data.get("scores"), dict):
+            data["scores"] = JudgmentScores.from_trusted(data["scores"])
+        return cls.model_construct(**data)
 
     @computed_field
     @property
@@ -125,20 +162,24 @@ class JudgmentResult(BaseModel):
     def check_thresholds(self) -> tuple[bool, list[str]]:
         """Check all quality thresholds and return pass/fail with reasons."""
         reasons = []
+        scores = self.scores
+        # overall_score is recomputed on every access; read it once
+        overall_score = scores.overall_score
+        clarity_score = scores.clarity_assessment.clarity_score
 
-        if self.scores.overall_score < self.min_overall_score:
-            reasons.append(f"Overall score {self.scores.overall_score:.2f} below threshold {self.min_overall_score}")
+        if overall_score < self.min_overall_score:
+            reasons.append(f"Overall score {overall_score:.2f} below threshold {self.min_overall_score}")
 
-        if self.scores.clarity_assessment.clarity_score < self.min_clarity_score:
-            reasons.append(f"Clarity score {self.scores.clarity_assessment.clarity_score:.2f} below threshold {self.min_clarity_score}")
+        if clarity_score < self.min_clarity_score:
+            reasons.append(f"Clarity score {clarity_score:.2f} below threshold {self.min_clarity_score}")
 
-        if self.scores.solver_confidence < self.min_solver_confidence:
-            reasons.append(f"Solver confidence {self.scores.solver_confidence:.2f} below threshold {self.min_solver_confidence}")
+        if scores.solver_confidence < self.min_solver_confidence:
+            reasons.append(f"Solver confidence {scores.solver_confidence:.2f} below threshold {self.min_solver_confidence}")
 
-        if self.scores.adversarial_robustness < self.min_adversarial_robustness:
-            reasons.append(f"Adversarial robustness {self.scores.adversarial_robustness:.2f} below threshold {self.min_adversarial_robustness}")
+        if scores.adversarial_robustness < self.min_adversarial_robustness:
+            reasons.append(f"Adversarial robustness {scores.adversarial_robustness:.2f} below threshold {self.min_adversarial_robustness}")
 
-        if self.scores.solver_found_ambiguity:
+        if scores.solver_found_ambiguity:
             reasons.append("Solver detected ambiguity in question")
 
         passed = len(reasons) == 0
@@ -147,12 +188,19 @@ class JudgmentResult(BaseModel):
 
 class PipelineResult(BaseModel):
     """Result of the full question generation pipeline."""
+    model_config = ConfigDict(defer_build=True)
+
     accepted: bool
     question: Optional[Any] = None  # Question model
     concept_id: Optional[str] = None
     revision_count: int = 0
     judgment: Optional[dict] = None
-    errors: list[str] = []
+    errors: list[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "PipelineResult":
+        """Build from pipeline state without re-validating; question is kept as given."""
+        return cls.model_construct(**data)
 
     @property
     def success(self) -> bool:
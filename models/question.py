@@ -1,11 +1,17 @@
 """Question and Exam data models supporting all question types."""
 
+import re
 from enum import Enum
-from typing import Optional, Union
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Callable, ClassVar, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
 from uuid import UUID, uuid4
 
 
+# {{N}} blanks in cloze content
+CLOZE_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+
 class QuestionTypeEnum(str, Enum):
     """All supported question types matching database schema."""
     MULTIPLE_CHOICE = "multiple-choice"
@@ -15,6 +21,10 @@ class QuestionTypeEnum(str, Enum):
     CLOZE = "cloze"
     WRITING = "writing"
 
+    # Short names used by blueprints (models.blueprint.QuestionType)
+    MCQ = "multiple-choice"
+    MCQ_IMAGES = "multiple-choice-with-images"
+
 
 class Choice(BaseModel):
     """Universal Choice interface - fields used depend on question type.
@@ -25,6 +35,8 @@ class Choice(BaseModel):
     For multi-subquestion: id, text (the subquestion), correct (letter A/B/C)
     For cloze: id, text="", options (4 strings), is_correct (0-3 index)
     """
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
     id: str
     text: str
 
@@ -46,14 +58,35 @@ class Choice(BaseModel):
 
 class MarkingCriterion(BaseModel):
     """Marking criterion for writing questions."""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     id: str
     name: str
     max_marks: int
     description: str
 
 
+def _construct_each(model: type[BaseModel], items: Optional[list]) -> Optional[list]:
+    """model_construct each dict in items, passing through existing instances."""
+    if not items:
+        return items
+    return [item if isinstance(item, model) else model.model_construct(**item) for item in items]
+
+
+@lru_cache(maxsize=1024)
+def _interned_tags(tags: tuple[str, ...]) -> tuple[str, ...]:
+    return tags
+
+
+def intern_tags(tags) -> tuple[str, ...]:
+    """Return a shared tuple for a tag set; questions in an exam mostly repeat a few."""
+    return _interned_tags(tuple(tags))
+
+
 class Question(BaseModel):
     """Complete question data structure supporting all types."""
+    model_config = ConfigDict(extra="ignore", defer_build=True)
+
     id: UUID = Field(default_factory=uuid4)
 
     # Content fields
@@ -68,20 +101,20 @@ class Question(BaseModel):
     # Topic/subtopic references
     topic_id: Optional[UUID] = None
     subtopic_id: Optional[UUID] = None
-    subtopic_ids: list[UUID] = []  # Array for multiple subtopics
+    subtopic_ids: tuple[UUID, ...] = ()  # Array for multiple subtopics
     subtopic_name: str = ""
 
     # Choices - structure varies by type
-    choices: Optional[list[Choice]] = []
+    choices: Optional[list[Choice]] = Field(default_factory=list)
 
     # For drag-and-drop
     max_positions: Optional[int] = None  # Number of slots to fill
 
     # For multi-subquestion - references to extracts table
-    extract_id: Optional[list[UUID]] = None
+    extract_id: Optional[tuple[UUID, ...]] = None
 
     # For writing questions
-    marking_criteria: list[MarkingCriterion] = []
+    marking_criteria: list[MarkingCriterion] = Field(default_factory=list)
 
     # Image support
     requires_image: bool = False
@@ -89,7 +122,7 @@ class Question(BaseModel):
     image_url: Optional[str] = None
 
     # Metadata
-    tags: list[str] = []
+    tags: tuple[str, ...] = ()  # Shared across questions via intern_tags
     showup: bool = True
     is_active: bool = True
 
@@ -98,12 +131,45 @@ class Question(BaseModel):
     percent_correct: Optional[float] = None
     total_attempts: int = 0
 
+    # Index of the is_correct choice, found once on validation
+    _correct_index: Optional[int] = PrivateAttr(default=None)
+
+    @field_validator("tags", mode="after")
+    @classmethod
+    def _intern_tags(cls, tags: tuple[str, ...]) -> tuple[str, ...]:
+        return intern_tags(tags)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Question":
+        """Build from already-validated data (DB rows, pipeline state) without re-validating.
+
+        Use model_validate for anything that hasn't been validated yet, such as LLM output.
+        """
+        data = dict(data)
+        if "choices" in data:
+            data["choices"] = _construct_each(Choice, data["choices"])
+        if "marking_criteria" in data:
+            data["marking_criteria"] = _construct_each(MarkingCriterion, data["marking_criteria"])
+        return cls.model_construct(**data)
+
+    @model_validator(mode="after")
+    def _index_correct_choice(self) -> "Question":
+        self._correct_index = next(
+            (i for i, c in enumerate(self.choices or []) if c.is_correct is True), None
+        )
+        return self
+
     @property
     def correct_choice(self) -> Optional[Choice]:
         """Get the correct choice for MCQ types."""
         if self.type in [QuestionTypeEnum.MULTIPLE_CHOICE.value,
                          QuestionTypeEnum.MULTIPLE_CHOICE_WITH_IMAGES.value]:
-            for choice in self.choices or []:
+            choices = self.choices or []
+            index = self._correct_index
+            if index is not None and index < len(choices) and choices[index].is_correct is True:
+                return choices[index]
+            # Built with model_construct, or choices replaced since validation
+            for choice in choices:
                 if choice.is_correct is True:
                     return choice
         return None
@@ -113,12 +179,23 @@ class Question(BaseModel):
         """Get correct order for drag-and-drop questions."""
         if self.type != QuestionTypeEnum.DRAG_AND_DROP.value:
             return []
-        return [
-            c.id for c in sorted(
-                [c for c in (self.choices or []) if c.correct_position is not None],
-                key=lambda x: x.correct_position or 0
-            )
-        ]
+        choices = self.choices or []
+        # Positions are normally 1..N, so each item drops straight into its slot
+        slots: list[Optional[str]] = [None] * len(choices)
+        for c in choices:
+            position = c.correct_position
+            if position is None:
+                continue
+            if not 1 <= position <= len(slots) or slots[position - 1] is not None:
+                # Gaps or duplicates (see _validate_drag_drop): fall back to sorting
+                return [
+                    c.id for c in sorted(
+                        [c for c in choices if c.correct_position is not None],
+                        key=lambda x: x.correct_position or 0
+                    )
+                ]
+            slots[position - 1] = c.id
+        return [choice_id for choice_id in slots if choice_id is not None]
 
     def validate_structure(self) -> list[str]:
         """Validate question structure based on type."""
@@ -127,18 +204,9 @@ class Question(BaseModel):
         if not self.question.strip():
             errors.append("Question text is required")
 
-        if self.type == QuestionTypeEnum.MULTIPLE_CHOICE.value:
-            errors.extend(self._validate_mcq())
-        elif self.type == QuestionTypeEnum.MULTIPLE_CHOICE_WITH_IMAGES.value:
-            errors.extend(self._validate_mcq_images())
-        elif self.type == QuestionTypeEnum.DRAG_AND_DROP.value:
-            errors.extend(self._validate_drag_drop())
-        elif self.type == QuestionTypeEnum.MULTI_SUBQUESTION.value:
-            errors.extend(self._validate_multi_sub())
-        elif self.type == QuestionTypeEnum.CLOZE.value:
-            errors.extend(self._validate_cloze())
-        elif self.type == QuestionTypeEnum.WRITING.value:
-            errors.extend(self._validate_writing())
+        validator = self._TYPE_VALIDATORS.get(self.type)
+        if validator is not None:
+            errors.extend(validator(self))
 
         return errors
 
@@ -156,10 +224,13 @@ class Question(BaseModel):
     def _validate_mcq_images(self) -> list[str]:
         """Validate MCQ with images."""
         errors = self._validate_mcq()
-        if self.choices:
-            for i, c in enumerate(self.choices):
-                if not c.image:
-                    errors.append(f"Choice {i+1} missing image URL")
+        choices = self.choices or []
+        # Usually every choice has its image; only walk for messages when one doesn't
+        if not all(c.image for c in choices):
+            errors.extend(
+                f"Choice {i+1} missing image URL"
+                for i, c in enumerate(choices) if not c.image
+            )
         return errors
 
     def _validate_drag_drop(self) -> list[str]:
@@ -172,11 +243,12 @@ class Question(BaseModel):
             if len(valid_positions) < 2:
                 errors.append("At least 2 items with positions required")
 
-            # Check positions are sequential starting at 1
-            positions = sorted([c.correct_position for c in valid_positions])
-            expected = list(range(1, len(positions) + 1))
-            if positions != expected:
-                errors.append(f"Positions must be sequential from 1, got {positions}")
+            # Positions are 1..n exactly when they are distinct and span 1..n;
+            # only sort them for the error message
+            positions = [c.correct_position for c in valid_positions]
+            n = len(positions)
+            if n and (min(positions) != 1 or max(positions) != n or len(set(positions)) != n):
+                errors.append(f"Positions must be sequential from 1, got {sorted(positions)}")
 
             if self.max_positions and self.max_positions != len(valid_positions):
                 errors.append(f"max_positions ({self.max_positions}) doesn't match valid items ({len(valid_positions)})")
@@ -187,7 +259,7 @@ class Question(BaseModel):
         errors = []
         if not self.choices:
             errors.append("At least one subquestion required")
-        else:
+        elif not all(c.correct and len(c.correct) == 1 and c.correct.isalpha() for c in self.choices):
             for i, c in enumerate(self.choices):
                 if not c.correct:
                     errors.append(f"Subquestion {i+1} missing correct answer letter")
@@ -212,10 +284,10 @@ class Question(BaseModel):
 
         # Check placeholders in content match choice IDs
         if self.content:
+            found = set(CLOZE_PLACEHOLDER_RE.findall(self.content))
             for c in self.choices or []:
-                placeholder = f"{{{{{c.id}}}}}"
-                if placeholder not in self.content:
-                    errors.append(f"Placeholder {placeholder} not found in content")
+                if c.id not in found:
+                    errors.append(f"Placeholder {{{{{c.id}}}}} not found in content")
         return errors
 
     def _validate_writing(self) -> list[str]:
@@ -231,8 +303,20 @@ class Question(BaseModel):
                     errors.append(f"Marking criterion {i+1} invalid")
         return errors
 
+    # Question type -> structure validator, used by validate_structure
+    _TYPE_VALIDATORS: ClassVar[dict[str, Callable[["Question"], list[str]]]] = {
+        QuestionTypeEnum.MULTIPLE_CHOICE.value: _validate_mcq,
+        QuestionTypeEnum.MULTIPLE_CHOICE_WITH_IMAGES.value: _validate_mcq_images,
+        QuestionTypeEnum.DRAG_AND_DROP.value: _validate_drag_drop,
+        QuestionTypeEnum.MULTI_SUBQUESTION.value: _validate_multi_sub,
+        QuestionTypeEnum.CLOZE.value: _validate_cloze,
+        QuestionTypeEnum.WRITING.value: _validate_writing,
+    }
+
 
 class Exam(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(default_factory=uuid4)
     code: str
     name: str
@@ -241,11 +325,24 @@ class Exam(BaseModel):
     time_limit: int = 45
     question_count: int = 0
     topic_id: Optional[UUID] = None
-    questions: list[Question] = []
+    questions: list[Question] = Field(default_factory=list)
     is_active: bool = True
 
+    @classmethod
+    def from_trusted(cls, data: dict) -> "Exam":
+        """Build from already-validated data without re-validating (see Question.from_trusted)."""
+        data = dict(data)
+        if data.get("questions"):
+            data["questions"] = [
+                q if isinstance(q, Question) else Question.from_trusted(q)
+                for q in data["questions"]
+            ]
+        return cls.model_construct(**data)
+
 
 class ExamConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     exam_code: Optional[str] = None
     exam_name: Optional[str] = None
     exam_description: str = ""
@@ -1,9 +1,9 @@
 """Verification result models for the VerifierAgent."""
 
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel
-from uuid import UUID
+from functools import cached_property
+from typing import Annotated, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
 
 
 class VerificationStatus(str, Enum):
@@ -12,47 +12,135 @@ class VerificationStatus(str, Enum):
     FAIL = "fail"
 
 
+class IssueCategory(str, Enum):
+    """Which verification check raised an issue."""
+    ANSWER = "answer"
+    QUALITY = "quality"
+    FORMAT = "format"
+    EXPLANATION = "explanation"
+
+
 class VerificationIssue(BaseModel):
     """A single issue found during verification."""
-    category: str  # "answer", "quality", "format", "explanation"
+    model_config = ConfigDict(frozen=True)
+
+    category: IssueCategory
     message: str
     suggestion: Optional[str] = None
 
 
 class QuestionVerification(BaseModel):
     """Verification result for a single question."""
+    model_config = ConfigDict(frozen=True)
+
     question_id: Optional[str] = None
     question_text: str  # First 100 chars for identification
     status: VerificationStatus
 
     # Individual check results
     answer_correct: bool
-    answer_confidence: float  # 0.0 to 1.0
+    answer_confidence: Annotated[float, Field(ge=0.0, le=1.0, strict=True)]
     verified_correct_choice: Optional[str] = None  # The choice ID verifier determined
 
     quality_ok: bool
     format_ok: bool
     explanation_ok: bool
 
-    issues: list[VerificationIssue] = []
+    issues: list[VerificationIssue] = Field(default_factory=list)
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "QuestionVerification":
+        """Build from values the verifier has already typed, without validating.
+
+        Anything parsed from external JSON must go through model_validate.
+        """
+        data = dict(data)
+        if data.get("issues"):
+            data["issues"] = [
+                i if isinstance(i, VerificationIssue) else VerificationIssue.model_construct(**i)
+                for i in data["issues"]
+            ]
+        return cls.model_construct(**data)
 
     @property
     def passed(self) -> bool:
-        return self.status == VerificationStatus.PASS
+        return self.status is VerificationStatus.PASS
 
 
 class BatchVerificationResult(BaseModel):
-    """Verification results for a batch of questions."""
+    """Verification results for a batch of questions.
+
+    For JSON output call `.to_json()`; do not use `json.dumps(result.model_dump())`.
+    """
+    model_config = ConfigDict(frozen=True)
+
     total_questions: int
     passed: int
     failed: int
 
     questions: list[QuestionVerification]
 
-    @property
+    @model_validator(mode="before")
+    @classmethod
+    def _derive_counts(cls, data: Any) -> Any:
+        """Fill the counts from questions, overriding whatever was supplied."""
+        if isinstance(data, dict) and isinstance(data.get("questions"), list):
+            data = {**data, **_count_questions(data["questions"])}
+        return data
+
+    @classmethod
+    def from_trusted(cls, data: dict) -> "BatchVerificationResult":
+        """Build from QuestionVerification instances without validating.
+
+        The counts are still derived from questions.
+        """
+        return cls.model_construct(**{**data, **_count_questions(data.get("questions", []))})
+
+    @classmethod
+    def from_questions(cls, questions: list[QuestionVerification]) -> "BatchVerificationResult":
+        """Build from per-question verdicts, deriving the counts in one pass."""
+        return cls.from_trusted({"questions": questions})
+
+    @classmethod
+    def from_items(cls, items: list[dict]) -> "BatchVerificationResult":
+        """Validate untrusted per-question dicts in one call and build the batch."""
+        return cls.from_questions(_QUESTION_LIST_ADAPTER.validate_python(items))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "BatchVerificationResult":
+        """Parse and validate raw JSON in one pydantic-core pass.
+
+        Pass the undecoded text; json.loads followed by model_validate parses twice.
+        """
+        return cls.model_validate_json(data)
+
+    def to_json(self) -> bytes:
+        """Serialize straight to JSON bytes with pydantic-core, skipping the dict step."""
+        return self.__pydantic_serializer__.to_json(self)
+
+    # Frozen, so these are computed once per result
+    @cached_property
     def pass_rate(self) -> float:
         return self.passed / self.total_questions if self.total_questions > 0 else 0.0
 
-    @property
+    @cached_property
     def all_passed(self) -> bool:
         return self.failed == 0
+
+
+def _count_questions(questions: list) -> dict[str, int]:
+    """Batch counts for verdicts given as models or (unvalidated) dicts."""
+    passed = 0
+    for q in questions:
+        status = q.get("status") if isinstance(q, dict) else getattr(q, "status", None)
+        if status == VerificationStatus.PASS:
+            passed += 1
+    return {
+        "total_questions": len(questions),
+        "passed": passed,
+        "failed": len(questions) - passed,
+    }
+
+
+# Validates a whole list of verdicts in one pydantic-core call (see from_items)
+_QUESTION_LIST_ADAPTER = TypeAdapter(list[QuestionVerification])
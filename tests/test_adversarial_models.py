@@ -0,0 +1,47 @@
+"""Tests for AdversarialReport's severity tally."""
+
+from uuid import uuid4
+
+from models.adversarial import AdversarialReport
+
+
+def _attack(severity: str) -> dict:
+    return {
+        "attack_type": "shortcut",
+        "severity": severity,
+        "description": "The longest option is always correct",
+        "exploit_method": "Pick the longest option",
+    }
+
+
+def _report(*severities: str, **fields) -> AdversarialReport:
+    return AdversarialReport(
+        question_id=uuid4(),
+        question_preview="Which word completes the analogy?",
+        attacks=[_attack(s) for s in severities],
+        **fields,
+    )
+
+
+def test_counts_are_tallied_from_attacks():
+    report = _report("critical", "major", "major", "minor")
+    assert (report.critical_count, report.major_count) == (1, 2)
+    assert report.has_critical_issues
+    assert not report.pass_threshold
+
+
+def test_counts_are_not_fields():
+    report = _report("major", critical_count=5)
+    assert report.critical_count == 0
+    assert "critical_count" not in report.model_dump()
+    assert "major_count" not in AdversarialReport.model_json_schema()["properties"]
+
+
+def test_needs_revision_is_kept_as_supplied():
+    assert _report("critical").needs_revision is False
+    assert _report(needs_revision=True).needs_revision is True
+
+
+def test_json_round_trip_recounts():
+    report = _report("critical")
+    assert AdversarialReport.model_validate_json(report.model_dump_json()).critical_count == 1
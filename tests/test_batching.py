@@ -0,0 +1,127 @@
+"""Tests for MicroBatcher."""
+
+import asyncio
+
+import pytest
+
+from agents.batching import MicroBatcher
+
+
+class _Recorder:
+    """Batch function that records each call and doubles every item."""
+
+    def __init__(self, drop: int = 0, error: Exception | None = None):
+        self.calls: list[list[int]] = []
+        self.drop = drop
+        self.error = error
+
+    async def __call__(self, items: list[int]) -> list[int]:
+        self.calls.append(list(items))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        results = [item * 2 for item in items]
+        return results[:len(results) - self.drop]
+
+
+def test_flushes_when_batch_is_full():
+    async def scenario():
+        fn = _Recorder()
+        # A long wait: only a full batch can trigger the flush
+        batcher = MicroBatcher(fn, max_batch=3, max_wait_ms=60_000)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3))), timeout=1.0
+        )
+        return fn, results
+
+    fn, results = asyncio.run(scenario())
+    assert results == [0, 2, 4]
+    assert fn.calls == [[0, 1, 2]]
+
+
+def test_flushes_partial_batch_when_timer_fires():
+    async def scenario():
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, max_batch=10, max_wait_ms=10)
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2))
+        later = await batcher.submit(3)
+        return fn, results, later
+
+    fn, results, later = asyncio.run(scenario())
+    assert results == [2, 4]
+    assert later == 6
+    assert fn.calls == [[1, 2], [3]]
+
+
+def test_overflow_starts_a_new_batch():
+    async def scenario():
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, max_batch=2, max_wait_ms=10)
+        return fn, await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    fn, results = asyncio.run(scenario())
+    assert results == [0, 2, 4, 6, 8]
+    assert fn.calls == [[0, 1], [2, 3], [4]]
+
+
+def test_cancelled_submitters_are_skipped():
+    async def scenario():
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, max_batch=10, max_wait_ms=10)
+        cancelled = asyncio.create_task(batcher.submit(1))
+        kept = asyncio.create_task(batcher.submit(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return fn, await kept, cancelled.cancelled()
+
+    fn, result, was_cancelled = asyncio.run(scenario())
+    assert was_cancelled
+    assert result == 4
+    assert fn.calls == [[2]]
+
+
+def test_fully_cancelled_batch_is_not_sent():
+    async def scenario():
+        fn = _Recorder()
+        batcher = MicroBatcher(fn, max_batch=10, max_wait_ms=10)
+        task = asyncio.create_task(batcher.submit(1))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        return fn
+
+    assert asyncio.run(scenario()).calls == []
+
+
+def test_missing_results_fail_only_the_unanswered_items():
+    async def scenario():
+        fn = _Recorder(drop=1)
+        batcher = MicroBatcher(fn, max_batch=3, max_wait_ms=10)
+        return await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+
+    first, second, third = asyncio.run(scenario())
+    assert (first, second) == (0, 2)
+    assert isinstance(third, RuntimeError)
+
+
+def test_fn_exception_reaches_every_waiter():
+    error = ValueError("agent unavailable")
+
+    async def scenario():
+        batcher = MicroBatcher(_Recorder(error=error), max_batch=2, max_wait_ms=10)
+        return await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+
+    assert asyncio.run(scenario()) == [error, error]
+
+
+def test_fn_exception_is_raised_from_submit():
+    async def scenario():
+        batcher = MicroBatcher(_Recorder(error=ValueError("boom")), max_batch=1)
+        await batcher.submit(1)
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(scenario())
@@ -0,0 +1,100 @@
+"""Tests for BaseAgent.generate_json_items over a fake Gemini stream."""
+
+import asyncio
+import uuid
+
+from a2a_local import AgentConfig
+from agents.base_agent import BaseAgent
+
+
+class _StreamingAgent(BaseAgent):
+    """Agent whose Gemini stream replays fixed chunks."""
+
+    def __init__(self, chunks: list[str]):
+        super().__init__(AgentConfig(name="Test", description="", port=0, skills=[]))
+        self.chunks = chunks
+        self.stream_calls = 0
+
+    async def handle_task(self, task, context) -> dict:
+        return {}
+
+    async def _stream_text(self, prompt, model, temperature, max_tokens, json_mode=False):
+        self.stream_calls += 1
+        for chunk in self.chunks:
+            yield chunk
+
+
+def _collect(agent: BaseAgent, **kwargs) -> list:
+    """Every item generate_json_items yields, in order."""
+    async def run():
+        return [item async for item in agent.generate_json_items(_prompt(), **kwargs)]
+    return asyncio.run(run())
+
+
+def _prompt() -> str:
+    # Unique per call so the process-wide llm_cache never serves another test
+    return f"test prompt {uuid.uuid4()}"
+
+
+def test_elements_split_across_chunks_are_yielded_once():
+    agent = _StreamingAgent(['[{"a": 1', '}, {"b"', ': "x, y"}, {"c": [1,', ' 2]}', "]"])
+    assert _collect(agent) == [{"a": 1}, {"b": "x, y"}, {"c": [1, 2]}]
+
+
+def test_elements_are_yielded_before_the_stream_ends():
+    seen_at: list[int] = []
+
+    class _Probe(_StreamingAgent):
+        async def _stream_text(self, *args, **kwargs):
+            for i, chunk in enumerate(self.chunks):
+                self.position = i
+                yield chunk
+
+    agent = _Probe(['[{"a": 1},', ' {"b": 2},', ' {"c": 3}]'])
+
+    async def run():
+        items = []
+        async for item in agent.generate_json_items(_prompt()):
+            seen_at.append(agent.position)
+            items.append(item)
+        return items
+
+    assert asyncio.run(run()) == [{"a": 1}, {"b": 2}, {"c": 3}]
+    # The first element is complete once the second one starts
+    assert seen_at[0] == 1
+
+
+def test_code_fenced_response():
+    agent = _StreamingAgent(["```json\n[", '{"a": 1}, ', '{"b": 2}', "]\n```"])
+    assert _collect(agent) == [{"a": 1}, {"b": 2}]
+
+
+def test_scalar_elements():
+    agent = _StreamingAgent(["[1", "2, 3", "4, 5]"])
+    assert _collect(agent) == [12, 34, 5]
+
+
+def test_non_array_response_yields_nothing():
+    agent = _StreamingAgent(['{"items": [', '{"a": 1}]}'])
+    assert _collect(agent) == []
+
+
+def test_empty_array():
+    assert _collect(_StreamingAgent(["[", "]"])) == []
+
+
+def test_cached_response_is_replayed_and_refresh_bypasses_it():
+    agent = _StreamingAgent(['[{"a": 1}, ', '{"b": 2}]'])
+    prompt = _prompt()
+
+    async def run(**kwargs):
+        return [item async for item in agent.generate_json_items(prompt, cache=True, **kwargs)]
+
+    assert asyncio.run(run()) == [{"a": 1}, {"b": 2}]
+    agent.chunks = ['[{"c": 3}]']
+    assert asyncio.run(run()) == [{"a": 1}, {"b": 2}]
+    assert agent.stream_calls == 1
+
+    assert asyncio.run(run(refresh=True)) == [{"c": 3}]
+    assert asyncio.run(run()) == [{"c": 3}]
+    assert agent.stream_calls == 2
@@ -0,0 +1,46 @@
+"""Tests for A2A message part decoding."""
+
+import pytest
+from a2a.types import DataPart, Message, Part, TextPart
+
+from a2a_local.parts import first_part, message_payload, part_payload, part_text
+
+
+def _message(part) -> Message:
+    return Message(role="user", message_id="m1", parts=[Part(root=part)])
+
+
+def test_text_part_is_json_decoded():
+    message = _message(TextPart(text='{"action": "check_quality"}'))
+    assert message_payload(message) == {"action": "check_quality"}
+
+
+def test_data_part_is_returned_as_is():
+    message = _message(DataPart(data={"action": "check_quality", "n": 2}))
+    assert message_payload(message) == {"action": "check_quality", "n": 2}
+
+
+def test_dict_message_from_response():
+    # send_task responses carry the reply message as plain JSON
+    text_message = {"parts": [{"kind": "text", "text": '{"success": true}'}]}
+    data_message = {"parts": [{"kind": "data", "data": {"success": True}}]}
+    assert message_payload(text_message) == {"success": True}
+    assert message_payload(data_message) == {"success": True}
+
+
+def test_invalid_json_text_raises_value_error():
+    message = _message(TextPart(text="draw a triangle"))
+    with pytest.raises(ValueError):
+        message_payload(message)
+    assert part_text(first_part(message)) == "draw a triangle"
+
+
+def test_missing_parts():
+    assert first_part(None) is None
+    assert message_payload({"parts": []}) is None
+
+
+def test_part_text_of_data_part_is_empty():
+    part = DataPart(data={"a": 1})
+    assert part_text(part) == ""
+    assert part_payload(part) == {"a": 1}
@@ -0,0 +1,137 @@
+"""Tests for AdaptiveTokenBucket, run against a fake clock."""
+
+import asyncio
+
+import pytest
+
+from agents import ratelimit
+from agents.ratelimit import AdaptiveTokenBucket
+
+
+class _FakeClock:
+    """Stands in for the time module; asyncio.sleep advances it instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _FakeClock()
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay: float) -> None:
+        fake.sleeps.append(delay)
+        fake.now += delay
+        await real_sleep(0)
+
+    monkeypatch.setattr(ratelimit, "time", fake)
+    monkeypatch.setattr(ratelimit.asyncio, "sleep", sleep)
+    return fake
+
+
+def test_burst_is_available_immediately(clock):
+    bucket = AdaptiveTokenBucket(rate_per_sec=1.0, burst=3.0)
+
+    async def scenario():
+        for _ in range(3):
+            await bucket.acquire()
+
+    asyncio.run(scenario())
+    assert clock.sleeps == []
+    assert clock.now == 0.0
+
+
+def test_acquire_waits_for_refill(clock):
+    bucket = AdaptiveTokenBucket(rate_per_sec=2.0, burst=1.0)
+
+    async def scenario():
+        await bucket.acquire()
+        await bucket.acquire()
+
+    asyncio.run(scenario())
+    assert clock.now == pytest.approx(0.5)
+
+
+def test_idle_time_refills_up_to_burst(clock):
+    bucket = AdaptiveTokenBucket(rate_per_sec=1.0, burst=2.0)
+
+    async def scenario():
+        await bucket.acquire(2)
+        clock.now += 100.0
+        await bucket.acquire(2)
+        await bucket.acquire(1)
+
+    asyncio.run(scenario())
+    # Only the burst is banked, so the last token still waits a second
+    assert clock.now == pytest.approx(101.0)
+
+
+def test_request_larger_than_burst_is_capped(clock):
+    bucket = AdaptiveTokenBucket(rate_per_sec=1.0, burst=5.0)
+    asyncio.run(bucket.acquire(50))
+    assert clock.sleeps == []
+
+
+def test_waiters_are_served_in_fifo_order(clock):
+    bucket = AdaptiveTokenBucket(rate_per_sec=1.0, burst=1.0)
+    order: list[int] = []
+
+    async def waiter(n: int) -> None:
+        await bucket.acquire()
+        order.append(n)
+
+    async def scenario():
+        await bucket.acquire()
+        await asyncio.gather(*(waiter(n) for n in range(4)))
+
+    asyncio.run(scenario())
+    assert order == [0, 1, 2, 3]
+    assert clock.now == pytest.approx(4.0)
+
+
+def test_rate_limited_halves_rate_down_to_min():
+    bucket = AdaptiveTokenBucket(rate_per_sec=4.0, burst=1.0, min_rate=0.75)
+    bucket.on_rate_limited()
+    assert bucket.rate == 2.0
+    bucket.on_rate_limited()
+    bucket.on_rate_limited()
+    assert bucket.rate == 0.75
+
+
+def test_successes_recover_rate_up_to_max():
+    bucket = AdaptiveTokenBucket(rate_per_sec=4.0, burst=1.0, increase_step=1.0, increase_after=3)
+    bucket.on_rate_limited()
+    for _ in range(2):
+        bucket.on_success()
+    assert bucket.rate == 2.0
+    bucket.on_success()
+    assert bucket.rate == 3.0
+    for _ in range(9):
+        bucket.on_success()
+    assert bucket.rate == 4.0
+
+
+def test_rate_limit_resets_the_success_run():
+    bucket = AdaptiveTokenBucket(rate_per_sec=8.0, burst=1.0, increase_after=3)
+    bucket.on_success()
+    bucket.on_success()
+    bucket.on_rate_limited()
+    bucket.on_success()
+    assert bucket.rate == 4.0
+
+
+def test_halved_rate_slows_acquire(clock):
+    bucket = AdaptiveTokenBucket(rate_per_sec=2.0, burst=1.0)
+    bucket.on_rate_limited()
+
+    async def scenario():
+        await bucket.acquire()
+        await bucket.acquire()
+
+    asyncio.run(scenario())
+    assert clock.now == pytest.approx(1.0)
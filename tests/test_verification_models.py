@@ -0,0 +1,57 @@
+"""Tests for the batch verification result model."""
+
+from models.verification import BatchVerificationResult, QuestionVerification
+
+
+def _verdict(status: str) -> dict:
+    return {
+        "question_text": "What is 2 + 2?",
+        "status": status,
+        "answer_correct": status == "pass",
+        "answer_confidence": 0.9,
+        "quality_ok": True,
+        "format_ok": True,
+        "explanation_ok": True,
+    }
+
+
+def _counts(result: BatchVerificationResult) -> tuple[int, int, int]:
+    return result.total_questions, result.passed, result.failed
+
+
+def test_from_json_ignores_supplied_counts():
+    result = BatchVerificationResult.from_json(
+        '{"total_questions":5,"passed":5,"failed":0,"questions":[]}'
+    )
+    assert _counts(result) == (0, 0, 0)
+
+
+def test_model_validate_derives_counts():
+    result = BatchVerificationResult.model_validate({
+        "total_questions": 9,
+        "passed": 9,
+        "failed": 0,
+        "questions": [_verdict("pass"), _verdict("fail"), _verdict("fail")],
+    })
+    assert _counts(result) == (3, 1, 2)
+    assert not result.all_passed
+
+
+def test_counts_may_be_omitted():
+    result = BatchVerificationResult.model_validate({"questions": [_verdict("pass")]})
+    assert _counts(result) == (1, 1, 0)
+
+
+def test_from_trusted_derives_counts():
+    result = BatchVerificationResult.from_trusted({
+        "total_questions": 4,
+        "passed": 0,
+        "failed": 4,
+        "questions": [QuestionVerification.model_validate(_verdict("pass"))],
+    })
+    assert _counts(result) == (1, 1, 0)
+
+
+def test_json_round_trip_keeps_counts():
+    result = BatchVerificationResult.from_items([_verdict("pass"), _verdict("fail")])
+    assert _counts(BatchVerificationResult.from_json(result.to_json())) == (2, 1, 1)
@@ -0,0 +1,101 @@
+"""Tests for VerifierAgent's verdict cache and in-flight coalescing."""
+
+import asyncio
+
+from agents.verifier_agent import VerifierAgent
+from models.verification import VerificationStatus
+
+
+def _question(marked: str = "b") -> dict:
+    return {
+        "id": "q1",
+        "question": "What is the capital of Australia?",
+        "content": "",
+        "explanation": "Canberra was chosen as a compromise between Sydney and Melbourne.",
+        "subtopic_name": "geography",
+        "tags": ["capitals"],
+        "difficulty": 2,
+        "choices": [
+            {"id": cid, "text": text, "is_correct": cid == marked}
+            for cid, text in zip("abcd", ["Sydney", "Canberra", "Melbourne", "Perth"])
+        ],
+    }
+
+
+def _passing_items(prompt, **kwargs):
+    async def items():
+        yield {
+            "question_index": 0,
+            "answer_matches": True,
+            "my_answer_choice_id": "b",
+            "confidence": 0.9,
+            "all_passed": True,
+            "issues": [],
+        }
+    return items()
+
+
+def _failing_items(prompt, **kwargs):
+    async def items():
+        raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        yield
+    return items()
+
+
+def test_complete_verdict_is_cached():
+    agent = VerifierAgent()
+    agent.generate_json_items = _passing_items
+
+    result = asyncio.run(agent._verify_all([_question()]))
+
+    assert result.questions[0].status is VerificationStatus.PASS
+    assert len(agent._cache) == 1
+
+
+def test_verdict_with_skipped_checks_is_not_cached():
+    # During an LLM outage every check is skipped; a wrongly marked answer
+    # must not be cached as a PASS
+    agent = VerifierAgent()
+    agent.generate_json_items = _failing_items
+
+    result = asyncio.run(agent._verify_all([_question(marked="a")]))
+
+    assert result.questions[0].answer_confidence == 0.0
+    assert agent._cache == {}
+    assert agent._inflight == {}
+
+    # Once the LLM is back the question is checked again
+    agent.generate_json_items = _passing_items
+    asyncio.run(agent._verify_all([_question()]))
+    assert len(agent._cache) == 1
+
+
+def test_cancelled_owner_does_not_cancel_waiters():
+    async def scenario():
+        agent = VerifierAgent()
+        release = asyncio.Event()
+
+        def slow_items(prompt, **kwargs):
+            async def items():
+                await release.wait()
+                async for item in _passing_items(prompt):
+                    yield item
+            return items()
+
+        agent.generate_json_items = slow_items
+        owner = asyncio.create_task(agent._verify_all([_question()]))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(agent._verify_all([_question()]))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        result = await asyncio.wait_for(waiter, timeout=1.0)
+        return agent, owner, result
+
+    agent, owner, result = asyncio.run(scenario())
+    assert owner.cancelled()
+    assert result.questions[0].status is VerificationStatus.PASS
+    assert len(agent._cache) == 1
+    assert agent._inflight == {}
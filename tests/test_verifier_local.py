@@ -0,0 +1,64 @@
+"""Tests for the verifier's local arithmetic answer check."""
+
+from agents.verifier_local import local_answer_result, try_solve_locally
+
+
+def _question(text: str, choices: list[str], correct: int = 0, content: str = "") -> dict:
+    return {
+        "question": text,
+        "content": content,
+        "choices": [
+            {"id": chr(ord("a") + i), "text": choice, "is_correct": i == correct}
+            for i, choice in enumerate(choices)
+        ],
+    }
+
+
+def test_times_and_divide_signs():
+    assert try_solve_locally(_question("What is 3 × (4 + 5)?", ["27", "17", "12"])) == "a"
+    assert try_solve_locally(_question("What is 84 ÷ 4?", ["20", "21", "22"])) == "b"
+
+
+def test_x_between_operands_is_multiplication():
+    assert try_solve_locally(_question("What is 6 x 7?", ["42", "13"])) == "a"
+    assert try_solve_locally(_question("Calculate 2X(3 + 1)", ["6", "8"])) == "b"
+    assert try_solve_locally(_question("What is (2 + 1)x4?", ["12", "9"])) == "a"
+
+
+def test_algebra_variable_is_not_multiplication():
+    question = _question("What is 3x - 2?", ["-6", "3x - 2", "1"], correct=1)
+    assert try_solve_locally(question) is None
+    assert local_answer_result(question) is None
+    assert try_solve_locally(_question("What is 2x?", ["2", "4"])) is None
+
+
+def test_thousands_separators():
+    question = _question("What is 1,200 + 3,400?", ["4,600", "4,700", "460"])
+    assert try_solve_locally(question) == "a"
+
+
+def test_non_numeric_choices_are_not_solved():
+    question = _question("What is 2 + 2?", ["4", "four", "5"])
+    assert try_solve_locally(question) is None
+
+
+def test_divide_by_zero_is_not_solved():
+    assert try_solve_locally(_question("What is 5 ÷ 0?", ["0", "5"])) is None
+
+
+def test_more_than_one_matching_choice_is_not_solved():
+    question = _question("What is 10 ÷ 4?", ["2.5", "2.50", "3"])
+    assert try_solve_locally(question) is None
+
+
+def test_word_problems_are_left_to_the_llm():
+    question = _question("What is 2 + 3?", ["5", "6"], content="Sam has 2 apples.")
+    assert try_solve_locally(question) is None
+
+
+def test_result_flags_a_wrong_marked_answer():
+    result = local_answer_result(_question("What is 6 x 7?", ["42", "13"], correct=1))
+    assert result["my_answer_choice_id"] == "a"
+    assert result["marked_correct_choice_id"] == "b"
+    assert result["answer_matches"] is False
+    assert result["confidence"] == 1.0